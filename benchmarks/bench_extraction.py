@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Extraction Benchmark
+Single-pass page_source parsing vs per-element WebDriver round trips
+"""
+
+import argparse
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+import lxml.html
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from selenium.common.exceptions import NoSuchElementException
+from src.extraction.page_extractor import (
+    INVESTOR_CONTAINER_SELECTOR, OBITUARY_CARD_SELECTOR, select, visible_text
+)
+from src.investor_finder.linkedin_scraper import LinkedInInvestorScraper
+from src.property_scanner.inheritance_finder import InheritancePropertyFinder
+from synthetic import LINKEDIN_FIXTURE, OBITUARY_FIXTURE, scale_fixture
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com/search/results/people/"
+
+
+class SimulatedWebElement:
+    """lxml-backed stand-in for a remote WebElement
+
+    Every find_element / text / get_attribute call pays one simulated
+    WebDriver HTTP round trip, and misses raise NoSuchElementException.
+    """
+
+    def __init__(self, element, round_trip, base_url=None):
+        self.element = element
+        self.round_trip = round_trip
+        self.base_url = base_url
+        self.calls = 0
+
+    def _round_trip(self):
+        self.calls += 1
+        if self.round_trip:
+            time.sleep(self.round_trip)
+
+    def find_element(self, by, value):
+        self._round_trip()
+        matches = select(self.element, value)
+        if not matches:
+            raise NoSuchElementException(f"no element matches {value}")
+        return SimulatedWebElement(matches[0], self.round_trip, self.base_url)
+
+    def find_elements(self, by, value):
+        self._round_trip()
+        return [SimulatedWebElement(match, self.round_trip, self.base_url)
+                for match in select(self.element, value)]
+
+    @property
+    def text(self):
+        self._round_trip()
+        return visible_text(self.element)
+
+    def get_attribute(self, name):
+        self._round_trip()
+        value = self.element.get(name)
+        if name == 'href' and value is not None and self.base_url:
+            value = urljoin(self.base_url, value)
+        return value
+
+
+def strip_volatile(records):
+    """Drop per-call timestamps so both paths can be compared"""
+    return [{k: v for k, v in record.items() if k != 'scraped_at'} for record in records]
+
+
+def time_call(func, repeat):
+    """Best wall time of `repeat` runs and the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench_investors(scraper, cards, round_trip, repeat):
+    """Benchmark LinkedIn result extraction"""
+    page_source = scale_fixture(LINKEDIN_FIXTURE, INVESTOR_CONTAINER_SELECTOR, cards)
+    driver = SimulatedWebElement(lxml.html.fromstring(page_source), round_trip, LINKEDIN_BASE_URL)
+
+    def per_element():
+        results = []
+        for container in driver.find_elements(None, INVESTOR_CONTAINER_SELECTOR)[:cards]:
+            data = scraper._extract_profile_data(container, 'real estate investor', 'Miami')
+            if data:
+                results.append(data)
+        return results
+
+    def single_pass():
+        return scraper._extract_profiles_from_source(
+            page_source, 'real estate investor', 'Miami', cards, base_url=LINKEDIN_BASE_URL
+        )
+
+    return _compare('investors', cards, per_element, single_pass, repeat)
+
+
+def bench_obituaries(finder, cards, round_trip, repeat):
+    """Benchmark obituary card extraction"""
+    page_source = scale_fixture(OBITUARY_FIXTURE, OBITUARY_CARD_SELECTOR, cards)
+    driver = SimulatedWebElement(lxml.html.fromstring(page_source), round_trip)
+
+    def per_element():
+        results = []
+        for card in driver.find_elements(None, OBITUARY_CARD_SELECTOR)[:cards]:
+            data = finder._extract_obituary_data(card, 'Miami')
+            if data:
+                results.append(data)
+        return results
+
+    def single_pass():
+        return finder._extract_obituaries_from_source(page_source, 'Miami', max_cards=cards)
+
+    return _compare('obituaries', cards, per_element, single_pass, repeat)
+
+
+def _compare(label, cards, per_element, single_pass, repeat):
+    """Time both extraction paths and verify they agree"""
+    per_element_time, per_element_results = time_call(per_element, repeat)
+    single_pass_time, single_pass_results = time_call(single_pass, repeat)
+
+    if strip_volatile(per_element_results) != strip_volatile(single_pass_results):
+        raise AssertionError(f"{label}: single-pass output differs from per-element output")
+
+    speedup = per_element_time / single_pass_time if single_pass_time else float('inf')
+    print(f"📊 {label:<11} cards={cards:<6} leads={len(single_pass_results):<6} "
+          f"per-element={per_element_time * 1000:9.1f} ms  "
+          f"single-pass={single_pass_time * 1000:8.1f} ms  speedup={speedup:6.1f}x")
+    return {
+        'stage': label,
+        'cards': cards,
+        'leads': len(single_pass_results),
+        'per_element_seconds': per_element_time,
+        'single_pass_seconds': single_pass_time,
+        'speedup': speedup
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark page extraction paths')
+    parser.add_argument('--cards', type=int, nargs='+', default=[10, 40, 200],
+                        help='Result cards per page (default: 10 40 200)')
+    parser.add_argument('--round-trip-ms', type=float, default=2.0,
+                        help='Simulated WebDriver round trip in ms (default: 2.0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (default: 3)')
+    args = parser.parse_args()
+
+    scraper = LinkedInInvestorScraper()
+    finder = InheritancePropertyFinder()
+    round_trip = args.round_trip_ms / 1000
+
+    print(f"🤖 LeadFlow AI - Extraction Benchmark (round trip {args.round_trip_ms} ms)")
+    print("=" * 60)
+    for cards in args.cards:
+        bench_investors(scraper, cards, round_trip, args.repeat)
+        bench_obituaries(finder, cards, round_trip, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Obituary Date Window Benchmark
+Cards scanned and lookups avoided by honoring days_back, on newest-first listings
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.extraction.text_patterns import parse_death_date, window_start
+from src.instrumentation.profiler import PROFILER
+from src.property_scanner.inheritance_finder import parse_obituary_page
+from synthetic import FIRST_NAMES, LAST_NAMES, STREET_NAMES
+
+# The three death date formats the pattern bank mines
+DATE_FORMATS = [
+    lambda day: f"{day.strftime('%B')} {day.day}, {day.year}",
+    lambda day: f"{day.month:02d}/{day.day:02d}/{day.year}",
+    lambda day: day.isoformat()
+]
+
+
+def card_name(i):
+    """Distinct name per card, so kept cards can be told apart"""
+    return f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {LAST_NAMES[i // len(FIRST_NAMES) % len(LAST_NAMES)]}"
+
+
+def card_died(i, days_apart, today):
+    """Death date of card i, None for the undated ones"""
+    return None if i % 10 == 9 else today - timedelta(days=i * days_apart)
+
+
+def listing_page(cards, days_apart, today):
+    """Obituary listing, newest first, one card every `days_apart` days
+
+    Every 10th card is undated, and every 4th dated card gives a
+    "born - died" range, so its first date is the birth date.
+    """
+    html = ['<html><body><div class="obituary-list">']
+    for i in range(cards):
+        name = card_name(i)
+        died = card_died(i, days_apart, today)
+        if died is None:
+            died = ''
+        elif i % 4 == 1:
+            born = died.replace(year=died.year - 60 - i % 35, day=1)
+            died = f" {DATE_FORMATS[i % 3](born)} – {DATE_FORMATS[i % 3](died)}."
+        else:
+            died = f" Passed {DATE_FORMATS[i % 3](died)}."
+        html.append(f'<div class="obituary-card"><h3 class="obit-name">{name}</h3>'
+                    f'<p>{name}, age {60 + i % 35}, of Miami.{died} '
+                    f'Lived on {STREET_NAMES[i % len(STREET_NAMES)]} Street for decades.</p></div>')
+    html.append('</div></body></html>')
+    return ''.join(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the obituary days_back window')
+    parser.add_argument('--cards', type=int, default=40, help='Cards per listing page (default: 40)')
+    parser.add_argument('--days-apart', type=int, default=3, help='Days between consecutive cards (default: 3)')
+    parser.add_argument('--days-back', type=int, nargs='+', default=[7, 30, 90, 0],
+                        help='Windows to compare, 0 for none (default: 7 30 90 0)')
+    parser.add_argument('--pages', type=int, default=500, help='Pages scanned per window (default: 500)')
+    args = parser.parse_args()
+
+    print("🤖 LeadFlow AI - Obituary Date Window Benchmark")
+    print("=" * 60)
+
+    today = date.today()
+    page = listing_page(args.cards, args.days_apart, today)
+    print(f"📰 {args.cards} cards per page, {args.days_apart} days apart, {args.pages} pages per window")
+
+    failed = False
+    for days_back in args.days_back:
+        since = window_start(days_back, today)
+        PROFILER.enable()
+        start = time.perf_counter()
+        for _ in range(args.pages):
+            obituaries = parse_obituary_page(page, 'Miami', args.cards, since)
+        seconds = time.perf_counter() - start
+        counters = PROFILER.counters
+        PROFILER.disable()
+
+        # Nothing older than the window may be handed on to record lookups, and
+        # every dated card inside it (ranges included) must be
+        kept = {obituary['deceased_name'] for obituary in obituaries}
+        died = {card_name(i): card_died(i, args.days_apart, today) for i in range(args.cards)}
+        leaked = [name for name in kept if since is not None and died[name] is not None and died[name] < since]
+        missed = [name for name, day in died.items()
+                  if day is not None and (since is None or day >= since) and name not in kept]
+        failed = failed or bool(leaked or missed)
+        label = f"{days_back} days" if days_back > 0 else 'no window'
+        print(f"{'✅' if not (leaked or missed) else '❌'} {label:<10} {seconds / args.pages * 1000:7.3f} ms/page  "
+              f"{len(obituaries):>3} kept  "
+              f"{counters.get('obituaries_out_of_window', 0) // args.pages:>3} dropped  "
+              f"{'cut off early' if counters.get('obituary_scan_cutoffs') else 'scanned whole page'}"
+              f"{f'  ({len(leaked)} out-of-window leaked)' if leaked else ''}"
+              f"{f'  ({len(missed)} in-window missed)' if missed else ''}")
+
+    print(f"\n🗓️  {parse_death_date.cache_info().hits:,} cached date lookups")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Lead Record Memory Benchmark
+Per-lead memory of dict leads vs __slots__ records, measured with tracemalloc
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.storage.lead_records import HeirContact, InvestorLead, ObituaryRecord, PropertyLead, tag_category
+from synthetic import synthetic_investors, synthetic_obituaries, synthetic_properties
+
+
+def _dict_property(prop):
+    return {**prop, 'heir_contacts': [dict(contact) for contact in prop['heir_contacts']]}
+
+
+def _record_property(prop):
+    return PropertyLead.from_dict(
+        prop, heir_contacts=[HeirContact.from_dict(contact) for contact in prop['heir_contacts']]
+    )
+
+
+KINDS = {
+    'investors': (synthetic_investors, dict, InvestorLead.from_dict, 'Investor'),
+    'obituaries': (synthetic_obituaries, dict, ObituaryRecord.from_dict, None),
+    'properties': (synthetic_properties, _dict_property, _record_property, 'Property'),
+}
+
+
+def measure(build):
+    """(bytes allocated and still held, seconds, result) for build()"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, seconds, result
+
+
+def report(label, rows, held, seconds):
+    print(f"📊 {label:<38} {held / rows:8.1f} B/lead  {held / 2 ** 20:9.1f} MiB  {seconds:7.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark lead record memory')
+    parser.add_argument('--rows', type=int, default=1000000, help='Leads per kind (default: 1000000)')
+    parser.add_argument('--kinds', nargs='+', choices=list(KINDS), default=list(KINDS), help='Lead kinds (default: all)')
+    args = parser.parse_args()
+
+    print("🤖 LeadFlow AI - Lead Record Memory Benchmark")
+    print(f"   {args.rows:,} leads per kind; field values are shared, so only per-lead containers are counted")
+    print("=" * 78)
+
+    for kind in args.kinds:
+        generate, as_dict_lead, as_record, category = KINDS[kind]
+        source = list(generate(args.rows))
+
+        held, seconds, dicts = measure(lambda: [as_dict_lead(lead) for lead in source])
+        report(f"{kind}: dict", args.rows, held, seconds)
+        if category:
+            # main.run_full_hunt used to copy every lead to add its category
+            extra, seconds, copies = measure(lambda: [{**lead, 'lead_category': category} for lead in dicts])
+            report(f"{kind}: dict + categorized copy", args.rows, held + extra, seconds)
+            del copies
+        del dicts
+
+        held, seconds, records = measure(lambda: [as_record(lead) for lead in source])
+        report(f"{kind}: __slots__ record", args.rows, held, seconds)
+        if category:
+            extra, seconds, _ = measure(lambda: list(tag_category(records, category)))
+            report(f"{kind}: record + tag in place", args.rows, held + extra, seconds)
+        del records, source
+        print("-" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Offline Replay Benchmark
+End-to-end full hunt throughput over recorded pages, with no browser and no delays
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from argparse import Namespace
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import LeadFlowConfig
+from src.extraction.page_extractor import INVESTOR_CONTAINER_SELECTOR, OBITUARY_CARD_SELECTOR
+from src.extraction.snapshots import save_snapshot
+from src.instrumentation.profiler import PROFILER
+from synthetic import LINKEDIN_FIXTURE, OBITUARY_FIXTURE, replay_mode, scale_fixture
+
+
+def record_pages(directory, pages, cards):
+    """Write `pages` recorded result pages of each kind, `cards` results per page"""
+    linkedin_page = scale_fixture(LINKEDIN_FIXTURE, INVESTOR_CONTAINER_SELECTOR, cards)
+    obituary_page = scale_fixture(OBITUARY_FIXTURE, OBITUARY_CARD_SELECTOR, cards)
+    for i in range(pages):
+        # URLs no hunt requests, so every search is served from the rotation
+        save_snapshot(directory, linkedin_page, f"https://www.linkedin.com/search/results/people/?recording={i}",
+                      'investors', 'Recorded', 'real estate investor')
+        save_snapshot(directory, obituary_page, f"https://www.legacy.com/obituaries/recorded-{i}/",
+                      'obituaries', 'Recorded')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark a full hunt replayed from recorded pages')
+    parser.add_argument('--cities', type=int, default=len(LeadFlowConfig.TARGET_CITIES),
+                        help='Cities per hunt (default: every target city)')
+    parser.add_argument('--cards', type=int, default=40, help='Result cards per recorded page (default: 40)')
+    parser.add_argument('--pages', type=int, default=4, help='Recorded pages of each kind (default: 4)')
+    parser.add_argument('--rounds', type=int, default=3, help='Hunts to time (default: 3)')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed (default: 7)')
+    args = parser.parse_args()
+
+    import main as leadflow
+
+    print("🤖 LeadFlow AI - Offline Replay Benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory(prefix='leadflow_replay_') as workdir:
+        recordings = os.path.join(workdir, 'recordings')
+        record_pages(recordings, args.pages, args.cards)
+        print(f"📼 {args.pages} LinkedIn + {args.pages} obituary pages x {args.cards} cards, "
+              f"{args.cities} cities per hunt")
+
+        # Keep every file the pipeline writes out of the working tree
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        LeadFlowConfig.DATA_DIR = os.path.join(workdir, 'data')
+        LeadFlowConfig.LEAD_STORE_PATH = os.path.join(workdir, 'leadflow.db')
+        LeadFlowConfig.DEDUP_INDEX_PATH = os.path.join(workdir, 'dedup_index.db')
+        LeadFlowConfig.CHECKPOINT_DIR = os.path.join(workdir, 'checkpoints')
+        # The fixture obituaries are dated early 2026, so no date window
+        hunt = Namespace(cities=args.cities, max_investors=3 * args.cards, max_properties=args.cards,
+                         sink=None, stream_only=False, no_dedup=True, resume=False, days_back=0)
+        try:
+            for round_number in range(1, args.rounds + 1):
+                random.seed(args.seed)
+                PROFILER.enable()
+                with replay_mode(recordings), contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    leads = len(leadflow.run_full_hunt(hunt))
+                    seconds = time.perf_counter() - start
+                PROFILER.disable()
+
+                profile = PROFILER.report()
+                pages = profile['stages'].get('driver.get', {}).get('calls', 0)
+                cards = (profile['counters'].get('investors_found', 0) +
+                         profile['counters'].get('obituaries_found', 0))
+                print(f"🔁 round {round_number}: {seconds:7.3f} s  {pages / seconds:8.1f} pages/s  "
+                      f"{cards / seconds:9.1f} cards/s  {leads / seconds:8.1f} leads/s  ({leads:,} leads)")
+        finally:
+            os.chdir(cwd)
+
+    print(f"\n{PROFILER.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Snapshot Reprocessing Benchmark
+Process-pool parsing throughput of a page snapshot archive by worker count
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.extraction.page_extractor import INVESTOR_CONTAINER_SELECTOR, OBITUARY_CARD_SELECTOR
+from src.extraction.parallel_parse import parse_snapshots
+from src.extraction.snapshots import find_snapshots, save_snapshot
+from synthetic import LINKEDIN_FIXTURE, OBITUARY_FIXTURE, scale_fixture
+
+
+def build_archive(directory, pages, cards):
+    """Write `pages` snapshots, alternating LinkedIn and obituary result pages"""
+    linkedin_page = scale_fixture(LINKEDIN_FIXTURE, INVESTOR_CONTAINER_SELECTOR, cards)
+    obituary_page = scale_fixture(OBITUARY_FIXTURE, OBITUARY_CARD_SELECTOR, cards)
+    for i in range(pages):
+        if i % 2:
+            save_snapshot(directory, obituary_page, f"https://www.legacy.com/obituaries/miami/?page={i}",
+                          'obituaries', 'Miami')
+        else:
+            save_snapshot(directory, linkedin_page, f"https://www.linkedin.com/search/results/people/?page={i}",
+                          'investors', 'Miami', 'real estate investor')
+    return find_snapshots(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parallel snapshot parsing')
+    parser.add_argument('--pages', type=int, default=400, help='Snapshot pages in the archive (default: 400)')
+    parser.add_argument('--cards', type=int, default=40, help='Result cards per page (default: 40)')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help='Worker counts to compare (default: 1 2 4 and all cores)')
+    parser.add_argument('--chunk-size', type=int, default=16, help='Pages per worker task (default: 16)')
+    args = parser.parse_args()
+
+    print("🤖 LeadFlow AI - Snapshot Reprocessing Benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory(prefix='leadflow_snapshots_') as directory:
+        paths = build_archive(directory, args.pages, args.cards)
+        print(f"📦 {len(paths)} pages x {args.cards} cards ({os.cpu_count()} CPU cores)")
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            records = sum(len(page['records']) for page in
+                          parse_snapshots(paths, workers=workers, chunk_size=args.chunk_size))
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            print(f"⚙️  workers={workers:<3} {seconds:8.3f} s  {len(paths) / seconds:8.1f} pages/s  "
+                  f"{records:,} records  speedup x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
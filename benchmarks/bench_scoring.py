@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Scoring Benchmark
+Vectorized DataFrame scoring vs the per-row scoring functions
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.ai_enrichment.batch_scoring import score_investor_frame, score_obituary_frame
+from src.ai_enrichment.lead_scoring import investor_quality_score, property_potential_score
+
+TITLES = [
+    'Real Estate Investor | Cash Buyer', 'Managing Partner at Chen Capital Properties',
+    'Property Developer & Multifamily Investor', 'Software Engineer', 'Realtor',
+    'Fix and Flip Specialist', 'Commercial Real Estate Investor', 'House Flipper',
+    'Rental property investor - buy and hold', 'CEO, Sunshine Properties LLC'
+]
+LOCATIONS = [
+    'Miami, Florida, United States', 'New York City Metropolitan Area', 'Greater Chicago Area',
+    'Phoenix, AZ', 'Los Angeles, CA', 'Austin, Texas', 'Dallas', ''
+]
+SEARCH_TERMS = [
+    'real estate investor', 'property investor', 'fix and flip', 'rental property investor',
+    'cash buyer real estate'
+]
+AGES = ['N/A', '45', '58', '63', '71', '88', '92', '101']
+ADDRESS_HINTS = [
+    '', 'lived on Coral Way', '2150 Brickell Avenue; lived on Coral Way',
+    '455 Palm Tree Drive; 19 Sunset Ave', '812 Biscayne Blvd; resided at 812 Biscayne'
+]
+CITIES = ['Miami', 'Atlanta', 'Phoenix', 'Dallas', 'Denver', 'Austin', 'Charlotte', 'Tampa']
+
+
+def synthetic_frames(rows, seed):
+    """Build synthetic investor and obituary frames"""
+    rng = random.Random(seed)
+    investors = pd.DataFrame({
+        'title': [rng.choice(TITLES) for _ in range(rows)],
+        'location': [rng.choice(LOCATIONS) for _ in range(rows)],
+        'search_term': [rng.choice(SEARCH_TERMS) for _ in range(rows)]
+    })
+    obituaries = pd.DataFrame({
+        'deceased_name': ['Synthetic Person'] * rows,
+        'age': [rng.choice(AGES) for _ in range(rows)],
+        'address_hints': [rng.choice(ADDRESS_HINTS) for _ in range(rows)],
+        'city': [rng.choice(CITIES) for _ in range(rows)]
+    })
+    return investors, obituaries
+
+
+def timed(func):
+    """Run func once, returning (seconds, result)"""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-row vs vectorized scoring')
+    parser.add_argument('--rows', type=int, default=200000, help='Synthetic rows per frame (default: 200000)')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed (default: 7)')
+    args = parser.parse_args()
+
+    investors, obituaries = synthetic_frames(args.rows, args.seed)
+
+    row_investor_time, row_investor_scores = timed(lambda: [
+        investor_quality_score(title, location, term)
+        for title, location, term in zip(investors['title'], investors['location'], investors['search_term'])
+    ])
+    batch_investor_time, batch_investor_scores = timed(lambda: score_investor_frame(investors))
+
+    row_property_time, row_property_scores = timed(lambda: [
+        property_potential_score(name, age, hints, city)
+        for name, age, hints, city in zip(obituaries['deceased_name'], obituaries['age'],
+                                          obituaries['address_hints'], obituaries['city'])
+    ])
+    batch_property_time, batch_property_scores = timed(lambda: score_obituary_frame(obituaries))
+
+    if batch_investor_scores.tolist() != row_investor_scores:
+        raise AssertionError("vectorized investor scores differ from per-row scores")
+    if batch_property_scores.tolist() != row_property_scores:
+        raise AssertionError("vectorized property scores differ from per-row scores")
+
+    print(f"🤖 LeadFlow AI - Scoring Benchmark ({args.rows:,} rows)")
+    print("=" * 60)
+    print(f"📊 investors  per-row={row_investor_time:7.3f} s  vectorized={batch_investor_time:7.3f} s  "
+          f"speedup={row_investor_time / batch_investor_time:5.1f}x")
+    print(f"📊 properties per-row={row_property_time:7.3f} s  vectorized={batch_property_time:7.3f} s  "
+          f"speedup={row_property_time / batch_property_time:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
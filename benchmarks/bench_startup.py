@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - CLI Startup Benchmark
+Times `main.py --help` and `demo` and fails when startup exceeds the budget
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(BASE_DIR, 'main.py')
+
+# Modules that only the hunt subcommands may load
+HEAVY_MODULES = ['selenium', 'webdriver_manager', 'fake_useragent', 'pandas', 'lxml']
+
+HEAVY_CHECK = (
+    "import sys; sys.argv = ['main.py']; sys.path.insert(0, {base!r}); import main; "
+    "print(','.join(m for m in {mods!r} if m in sys.modules))"
+)
+
+
+def median_runtime(command, runs):
+    """Median wall time of running a command"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def heavy_modules_loaded():
+    """Heavy modules imported as a side effect of importing main"""
+    result = subprocess.run(
+        [sys.executable, '-c', HEAVY_CHECK.format(base=BASE_DIR, mods=HEAVY_MODULES)],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True
+    )
+    return [name for name in result.stdout.strip().split(',') if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CLI startup time')
+    parser.add_argument('--budget', type=float, default=0.3, help='Max median seconds for --help (default: 0.3)')
+    parser.add_argument('--runs', type=int, default=7, help='Runs per command (default: 7)')
+    args = parser.parse_args()
+
+    # Interpreter floor, so the budget can be judged on slow machines
+    baseline = median_runtime([sys.executable, '-c', 'pass'], args.runs)
+    help_time = median_runtime([sys.executable, MAIN, '--help'], args.runs)
+    demo_time = median_runtime([sys.executable, MAIN, 'demo'], args.runs)
+    loaded = heavy_modules_loaded()
+
+    print("🤖 LeadFlow AI - Startup Benchmark")
+    print("=" * 60)
+    print(f"📊 python -c pass:   {baseline * 1000:7.1f} ms")
+    print(f"📊 main.py --help:   {help_time * 1000:7.1f} ms  (budget {args.budget * 1000:.0f} ms)")
+    print(f"📊 main.py demo:     {demo_time * 1000:7.1f} ms")
+    print(f"📦 heavy modules at import: {', '.join(loaded) if loaded else 'none'}")
+
+    failures = []
+    if help_time > args.budget:
+        failures.append(f"--help took {help_time * 1000:.1f} ms, over the {args.budget * 1000:.0f} ms budget")
+    if loaded:
+        failures.append(f"importing main loads {', '.join(loaded)}")
+    if failures:
+        print("❌ " + "; ".join(failures))
+        sys.exit(1)
+    print("✅ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Obituary Text Mining Benchmark
+Precompiled single-scan pattern bank vs sequential re.search / re.findall
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from src.extraction.text_patterns import (
+    ADDRESS_PATTERNS, AGE_PATTERNS, DATE_PATTERNS, PATTERN_BANK
+)
+
+FIRST_NAMES = ['Eleanor', 'Harold', 'Rosa', 'Li Wen', 'Thomas', 'Gloria', 'Walter', 'Dolores']
+LAST_NAMES = ['Whitfield', 'Benson', 'Delgado', 'Zhao', 'Reed', 'Mercer', 'Kowalski', 'Ruiz']
+STREETS = ['Oak', 'Pine', 'Coral Way', 'Brickell', 'Palm Tree', 'North Bay', 'Ocean']
+STREET_TYPES = ['Street', 'St', 'Avenue', 'Ave', 'Road', 'Drive', 'Blvd', 'Ct', 'Way', 'Lane']
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July']
+FILLER = [
+    "She is survived by her children and grandchildren.",
+    "He served in the Navy and later worked as an engineer for 35 years.",
+    "Services will be held at St. Mary's Church.",
+    "In lieu of flowers, donations may be made to the American Heart Association.",
+    "A celebration of life will follow at the family home."
+]
+
+
+def synthetic_obituary(rng):
+    """Build one synthetic obituary card text"""
+    parts = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"]
+
+    roll = rng.random()
+    if roll < 0.3:
+        parts.append(f"age {rng.randint(40, 99)}, passed away peacefully")
+    elif roll < 0.5:
+        parts.append(f"{rng.randint(40, 99)} years old, beloved parent")
+    elif roll < 0.7:
+        parts.append(f"{rng.randint(40, 99)}, of the city")
+
+    roll = rng.random()
+    if roll < 0.35:
+        parts.append(f"died {rng.choice(MONTHS)} {rng.randint(1, 28)}, 2026")
+    elif roll < 0.55:
+        parts.append(f"died {rng.randint(1, 12)}/{rng.randint(1, 28)}/2026")
+    elif roll < 0.7:
+        parts.append(f"services 2026-0{rng.randint(1, 9)}-{rng.randint(10, 28)}")
+
+    if rng.random() < 0.5:
+        parts.append(f"resided at {rng.randint(10, 9999)} {rng.choice(STREETS)} {rng.choice(STREET_TYPES)}")
+    if rng.random() < 0.3:
+        parts.append(f"lived on {rng.choice(STREETS)} Lane for {rng.randint(10, 60)} years")
+    if rng.random() < 0.2:
+        parts.append(f"owned a rental at {rng.randint(1, 500)} {rng.choice(STREETS)} {rng.choice(STREET_TYPES)}")
+
+    parts.extend(rng.sample(FILLER, 2))
+    return '. '.join(parts)
+
+
+def reference_extract(text_content):
+    """The sequential per-pattern extraction the pattern bank replaces"""
+    age = "N/A"
+    for pattern in AGE_PATTERNS:
+        match = re.search(pattern, text_content, re.IGNORECASE)
+        if match:
+            age = match.group(1)
+            break
+
+    death_date = "Recent"
+    for pattern in DATE_PATTERNS:
+        match = re.search(pattern, text_content)
+        if match:
+            death_date = match.group(1)
+            break
+
+    addresses = []
+    for pattern in ADDRESS_PATTERNS:
+        matches = re.findall(pattern, text_content, re.IGNORECASE)
+        addresses.extend(matches[:3])
+    address_hints = '; '.join(addresses[:2]) if addresses else ''
+
+    return age, death_date, address_hints
+
+
+def time_extractor(extract, corpus):
+    """Wall time to mine the whole corpus"""
+    start = time.perf_counter()
+    for text in corpus:
+        extract(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark obituary text mining')
+    parser.add_argument('--cards', type=int, default=100000, help='Synthetic obituary cards (default: 100000)')
+    parser.add_argument('--seed', type=int, default=42, help='Corpus random seed (default: 42)')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [synthetic_obituary(rng) for _ in range(args.cards)]
+
+    mismatches = sum(1 for text in corpus if reference_extract(text) != PATTERN_BANK.extract(text))
+    if mismatches:
+        raise AssertionError(f"pattern bank disagrees with reference on {mismatches} cards")
+
+    reference_time = time_extractor(reference_extract, corpus)
+    bank_time = time_extractor(PATTERN_BANK.extract, corpus)
+
+    print(f"🤖 LeadFlow AI - Text Mining Benchmark ({args.cards:,} cards)")
+    print("=" * 60)
+    print(f"📊 sequential re.search: {reference_time:8.3f} s  ({reference_time / args.cards * 1e6:6.2f} µs/card)")
+    print(f"📊 pattern bank:         {bank_time:8.3f} s  ({bank_time / args.cards * 1e6:6.2f} µs/card)")
+    print(f"🚀 speedup: {reference_time / bank_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Regression Checks
+Edge cases found in review, each checked against the code that handles it
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+from argparse import Namespace
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import LeadFlowConfig
+from src.extraction.page_cache import PageCache
+from src.extraction.parallel_parse import parse_snapshot_dir
+from src.extraction.snapshots import snapshot_meta_path
+from src.property_scanner.inheritance_finder import build_obituary_record
+from src.storage.checkpoint import HuntCheckpoint
+from src.storage.dedup_index import DedupIndex, obituary_identity
+from src.storage.lead_records import PropertyLead
+from src.storage.lead_store import format_heir_contacts
+from src.storage.normalized_export import heir_contacts_of
+from src.storage.sinks import finish_sink, open_sink
+from synthetic import replay_mode
+
+OBITUARY_PAGE = ('<html><body><div class="obituary-card"><h3 class="obit-name">{name}</h3>'
+                 '<p>{name}, age 81, of Miami. Passed March 3, 2026. Lived on Coral Way.</p></div></body></html>')
+SAMPLE_PROPERTY = {
+    'owner_name': 'Estate of Ann Lee', 'address': '12 Coral Way, Miami, FL', 'city': 'Miami',
+    'estimated_value': 450000, 'property_type': 'Single Family', 'status': 'Inheritance - Probate Pending',
+    'urgency_score': 8, 'lead_quality': 'HOT', 'deceased_age': '81', 'death_date': 'March 3, 2026',
+    'property_potential_score': 95, 'heir_contacts': [{'name': 'Bo Lee', 'phone': '305-555-0100'}],
+    'found_at': '2026-03-04T10:00:00'
+}
+
+
+@contextlib.contextmanager
+def _scratch_dir():
+    """Temporary working directory and data paths, so every file a check writes stays out of the tree"""
+    cwd = os.getcwd()
+    paths = ('DATA_DIR', 'LEAD_STORE_PATH', 'DEDUP_INDEX_PATH', 'CHECKPOINT_DIR')
+    originals = {name: getattr(LeadFlowConfig, name) for name in paths}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        for name in paths:
+            setattr(LeadFlowConfig, name, os.path.join(tmp, name.lower()))
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+            for name, value in originals.items():
+                setattr(LeadFlowConfig, name, value)
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def check_bad_snapshots():
+    """Empty, declared-encoding, truncated and mislabeled pages never stop a reprocess run"""
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        _write(os.path.join(tmp, 'a_empty.html'), '  \n ')
+        _write(os.path.join(tmp, 'b_declared.html'),
+               '<?xml version="1.0" encoding="utf-8"?>\n' + OBITUARY_PAGE.format(name='Ann Lee'))
+        data = gzip.compress(OBITUARY_PAGE.format(name='Bob Ray').encode('utf-8') * 50)
+        with open(os.path.join(tmp, 'c_truncated.html.gz'), 'wb') as f:
+            f.write(data[:len(data) // 2])
+        _write(os.path.join(tmp, 'd_bad_meta.html'), OBITUARY_PAGE.format(name='Cy Dunn'))
+        _write(os.path.join(tmp, 'd_bad_meta.meta.json'), json.dumps({'saved_at': 'yesterday'}))
+        _write(os.path.join(tmp, 'e_good.html'), OBITUARY_PAGE.format(name='Di Fox'))
+
+        pages = {os.path.basename(page['path']): page for page in parse_snapshot_dir(tmp, workers=1)}
+
+    expected = {
+        'a_empty.html': (False, 0), 'b_declared.html': (False, 1), 'c_truncated.html.gz': (True, 0),
+        'd_bad_meta.html': (True, 0), 'e_good.html': (False, 1)
+    }
+    for name, (errored, records) in expected.items():
+        page = pages.get(name)
+        if page is None:
+            failures.append(f"{name}: missing from the run")
+        elif bool(page.get('error')) != errored or len(page['records']) != records:
+            failures.append(f"{name}: error={page.get('error')!r}, {len(page['records'])} records")
+    return failures
+
+
+def check_csv_sink_exports():
+    """A CSV sink reads back with its integer columns, and feeds xlsx and on_export"""
+    failures = []
+    with _scratch_dir() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        exported = []
+        sink = open_sink('properties', 'csv')
+        sink.write(SAMPLE_PROPERTY)
+        leads = list(sink.iter_leads())
+        if len(leads) != 1 or leads[0]['estimated_value'] != 450000 or leads[0]['urgency_score'] != 8:
+            failures.append(f"read back {leads!r}")
+        finish_sink(sink, export_format='xlsx', on_export=exported.append)
+        workbooks = [name for name in os.listdir(os.path.join(tmp, 'data')) if name.endswith('.xlsx')]
+        if not workbooks:
+            failures.append("--sink csv --format xlsx wrote no workbook")
+        if len(exported) != 1:
+            failures.append(f"on_export called {len(exported)} times for an xlsx export")
+
+        exported = []
+        sink = open_sink('properties', 'csv')
+        sink.write(SAMPLE_PROPERTY)
+        finish_sink(sink, export_format='csv', on_export=exported.append)
+        if exported != [sink.location]:
+            failures.append(f"on_export got {exported!r} for a CSV export")
+    return failures
+
+
+def check_obituary_identity():
+    """One death written in any format, or as a "born – died" range, gives one dedup key"""
+    cards = [
+        'Ann Lee, age 81, of Miami. Passed March 3, 2026.',
+        'Ann Lee, 81, passed away 03/03/2026 at home.',
+        'Ann Lee (2026-03-03), of Miami Beach.',
+        'Ann Lee, June 1, 1944 – March 3, 2026, of Miami.'
+    ]
+    keys = {obituary_identity(build_obituary_record('Ann Lee', text, 'Miami')) for text in cards}
+    failures = [f"{len(keys)} keys for one death: {sorted(keys)}"] if len(keys) != 1 else []
+    if obituary_identity({'deceased_name': 'Ann Lee', 'death_date': 'Recent'}, 'Miami') is None:
+        failures.append("undated obituary has no key")
+    return failures
+
+
+def check_stream_only_csv():
+    """--stream-only --sink csv reports read the leads back from the CSV"""
+    import main as leadflow
+
+    failures = []
+    hunt = Namespace(cities=2, max_investors=15, max_properties=10, sink='csv', stream_only=True,
+                     no_dedup=True, resume=False, format='csv', days_back=0)
+    reports = [('investors', leadflow.run_investor_hunt, 'investor_hunt_report.txt', 'Total Investors Found'),
+               ('properties', leadflow.run_property_hunt, 'inheritance_property_report.txt',
+                'Total Properties Discovered')]
+    with _scratch_dir() as tmp, replay_mode(), contextlib.redirect_stdout(io.StringIO()) as output:
+        for table, run_hunt, report_name, total_label in reports:
+            kept = run_hunt(hunt)
+            saved = re.search(r"💾 Saved (\d+) ", output.getvalue().split("Starting")[-1])
+            report_path = os.path.join(tmp, 'data', report_name)
+            if kept:
+                failures.append(f"{table}: kept {len(kept)} leads in memory")
+            if not saved or not os.path.exists(report_path):
+                failures.append(f"{table}: no report for {saved.group(1) if saved else 0} streamed leads")
+                continue
+            with open(report_path) as f:
+                total = re.search(rf"{total_label}: (\d+)", f.read())
+            if not total or total.group(1) != saved.group(1):
+                failures.append(f"{table}: report total {total.group(1) if total else None}, "
+                                f"{saved.group(1)} saved")
+    return failures
+
+
+def check_checkpoint_batching():
+    """Checkpoints save once per batch, and a crash between saves loses nothing"""
+    failures = []
+    with _scratch_dir() as tmp:
+        dedup = DedupIndex(os.path.join(tmp, 'dedup.db'))
+        checkpoint = HuntCheckpoint('properties', dedup=dedup, save_every=10)
+        saves = []
+        save = checkpoint.save
+        checkpoint.save = lambda: saves.append(save())
+        sink = open_sink('properties', 'csv')
+        for unit in range(25):
+            sink.write({**SAMPLE_PROPERTY, 'owner_name': f"Owner {unit}"})
+            checkpoint.mark_done('Miami', f"unit-{unit}", sink, 1, keys=[f"key-{unit}"])
+        if len(saves) != 2:
+            failures.append(f"{len(saves)} saves for 25 units (batches of 10)")
+        if 'key-24' not in dedup:
+            failures.append("unsaved unit's key not seen within the run")
+        dedup.close()
+        sink.close()
+
+        # Crash here: units 20-24 were never saved, so they are redone on resume
+        resumed = HuntCheckpoint('properties', resume=True)
+        reopened = resumed.open_sink('properties')
+        rows = sum(1 for _ in reopened.iter_leads())
+        reopened.close()
+        if resumed.completed_units != 20 or rows != 20:
+            failures.append(f"resumed with {resumed.completed_units} units and {rows} rows, expected 20")
+        with DedupIndex(os.path.join(tmp, 'dedup.db')) as reloaded:
+            if 'key-19' not in reloaded or 'key-20' in reloaded:
+                failures.append("dedup keys written out of step with the checkpoint")
+    return failures
+
+
+def check_page_cache():
+    """Cached pages live for the whole TTL, and cache hits skip the anti-bot pause"""
+    from src.investor_finder import linkedin_scraper
+
+    failures = []
+    with _scratch_dir() as tmp:
+        cache = PageCache(os.path.join(tmp, 'pages'), ttl=3 * 24 * 3600)
+        path = cache.put('https://example.com/obituaries/miami/', OBITUARY_PAGE.format(name='Ann Lee'),
+                         'obituaries', 'Miami')
+        with open(snapshot_meta_path(path), encoding='utf-8') as f:
+            meta = json.load(f)
+        meta['saved_at'] = (datetime.now() - timedelta(days=2)).isoformat()
+        _write(snapshot_meta_path(path), json.dumps(meta))
+        if cache.get('https://example.com/obituaries/miami/', 'obituaries') is None:
+            failures.append("a 2-day-old page missed a 3-day TTL")
+
+        originals = (LeadFlowConfig.PAGE_CACHE_ENABLED, LeadFlowConfig.PAGE_CACHE_DIR, linkedin_scraper.pause)
+        LeadFlowConfig.PAGE_CACHE_ENABLED = True
+        LeadFlowConfig.PAGE_CACHE_DIR = os.path.join(tmp, 'pages')
+        pauses = []
+        linkedin_scraper.pause = pauses.append
+        try:
+            with replay_mode(), contextlib.redirect_stdout(io.StringIO()):
+                for run in ('fetched', 'cached'):
+                    del pauses[:]
+                    scraper = linkedin_scraper.LinkedInInvestorScraper()
+                    scraper.target_cities = ['Miami']
+                    scraper.run_investor_hunt(target_cities=1, investors_per_city=9, deduplicate=False,
+                                              export_format=None)
+                    expected = 3 if run == 'fetched' else 0
+                    if len(pauses) != expected:
+                        failures.append(f"{run} searches paused {len(pauses)} times, expected {expected}")
+        finally:
+            LeadFlowConfig.PAGE_CACHE_ENABLED, LeadFlowConfig.PAGE_CACHE_DIR, linkedin_scraper.pause = originals
+    return failures
+
+
+class _UnsettledDriver:
+    """A page that keeps adding containers and never finishes loading"""
+
+    def __init__(self):
+        self.polls = 0
+
+    def find_elements(self, by, selector):
+        self.polls += 1
+        return [None] * self.polls
+
+    def execute_script(self, script):
+        return 'loading'
+
+
+def check_scroll_waits():
+    """A page that never settles waits the long timeout once, then about the old sleep per scroll"""
+    from src.automation import page_readiness
+    from src.investor_finder import linkedin_scraper
+
+    failures = []
+    original_pause = page_readiness.pause
+    page_readiness.pause = lambda seconds: None
+    try:
+        for label, timeout in (('first load', None), ('scroll', 5.0)):
+            driver = _UnsettledDriver()
+            wait = page_readiness.PageReadiness(driver, timeout=15.0, scroll_timeout=5.0, poll=0.25)
+            wait.wait_for_results('.result', min_count=1 if timeout else 0, timeout=timeout)
+            waited = (driver.polls - 1) * wait.poll
+            limit = timeout or wait.timeout
+            if not limit - wait.poll <= waited <= limit + wait.poll:
+                failures.append(f"{label} wait gave up after ~{waited:.2f}s, expected ~{limit}s")
+    finally:
+        page_readiness.pause = original_pause
+
+    # The scraper passes the per-scroll cap to every wait after a scroll
+    timeouts = []
+    with replay_mode(), contextlib.redirect_stdout(io.StringIO()):
+        scraper = linkedin_scraper.LinkedInInvestorScraper()
+        scraper.setup_driver()
+        wait_for_results = scraper.wait.wait_for_results
+
+        def recording_wait(selector, min_count=0, replaces=0.0, timeout=None):
+            timeouts.append(timeout)
+            return wait_for_results(selector, min_count=min_count, replaces=replaces, timeout=timeout)
+
+        scraper.wait.wait_for_results = recording_wait
+        scraper.search_investors('real estate investor', 'Miami', max_results=5)
+    expected = [None] + [scraper.wait.scroll_timeout] * 3
+    if timeouts != expected:
+        failures.append(f"search waits used timeouts {timeouts}, expected {expected}")
+    return failures
+
+
+def check_record_coercion():
+    """A single heir contact (flattened string or dict) becomes a one-item list"""
+    failures = []
+    contact = {'name': 'Bo Lee', 'phone': '305-555-0100'}
+    cases = [('Bo Lee (305-555-0100)', ['Bo Lee (305-555-0100)']), (contact, [contact]),
+             ([contact], [contact]), (('Bo Lee (305-555-0100)',), ['Bo Lee (305-555-0100)'])]
+    for value, expected in cases:
+        lead = PropertyLead.from_dict({**SAMPLE_PROPERTY, 'heir_contacts': value})
+        if lead['heir_contacts'] != expected:
+            failures.append(f"heir_contacts {value!r} became {lead['heir_contacts']!r}")
+
+    # A wrapped flat string still exports and normalizes like the contact it names
+    lead = PropertyLead.from_dict({**SAMPLE_PROPERTY, 'heir_contacts': 'Bo Lee (305-555-0100)'})
+    if format_heir_contacts(lead['heir_contacts']) != 'Bo Lee (305-555-0100)':
+        failures.append(f"flattened as {format_heir_contacts(lead['heir_contacts'])!r}")
+    if heir_contacts_of(lead) != [contact]:
+        failures.append(f"normalized as {heir_contacts_of(lead)!r}")
+    return failures
+
+
+CHECKS = [
+    ('bad snapshot pages', check_bad_snapshots),
+    ('csv sink exports', check_csv_sink_exports),
+    ('obituary dedup keys', check_obituary_identity),
+    ('stream-only csv reports', check_stream_only_csv),
+    ('checkpoint batching', check_checkpoint_batching),
+    ('page cache ttl and pauses', check_page_cache),
+    ('scroll wait timeouts', check_scroll_waits),
+    ('lead record coercion', check_record_coercion),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regression checks for edge cases found in review')
+    parser.add_argument('--only', help='Run only checks whose name contains this text')
+    args = parser.parse_args()
+
+    failed = False
+    for name, check in CHECKS:
+        if args.only and args.only not in name:
+            continue
+        failures = check()
+        print(f"{'✅' if not failures else '❌'} {name}")
+        for failure in failures:
+            print(f"   {failure}")
+        failed = failed or bool(failures)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
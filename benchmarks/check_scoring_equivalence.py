@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Scoring Equivalence Check
+Compiled scoring model vs the hard-coded rules it replaced
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_scoring import ADDRESS_HINTS, AGES, CITIES, LOCATIONS, SEARCH_TERMS, TITLES, synthetic_frames
+from config.settings import LeadFlowConfig
+from src.ai_enrichment.batch_scoring import score_investor_frame, score_obituary_frame
+from src.ai_enrichment.lead_scoring import investor_quality_score, property_potential_score, property_rank
+from src.ai_enrichment.scoring_model import reload_scoring_model, scoring_model
+from src.extraction.gazetteer import normalize_location
+
+# Edge cases on top of the synthetic pools
+EXTRA_AGES = ['0', '49', '50', '59', '60', '69', '70', '-5', '', 'unknown', '1000000', 70, None]
+EXTRA_HINTS = ['x' * 50, 'x' * 51]
+EXTRA_CITIES = ['MIAMI', 'Tampa', '']
+# Metro aliases the old exact-name rules missed and the gazetteer now resolves
+ALIAS_CITIES = {'Fort Lauderdale': 'Miami', 'miami ': 'Miami', 'Round Rock, TX': 'Austin'}
+ALIAS_LOCATIONS = {'Greater Chicago Area': 'Chicago', 'Brooklyn, NY': 'New York',
+                   'Santa Monica, California': 'Los Angeles'}
+# Locations naming several places, or towns sharing a name with a metro alias;
+# legacy substring matching scores all of these right
+MULTI_LOCATIONS = ['Dallas / New York', 'Orlando, FL (formerly Chicago)', 'MiamiDade County',
+                   'Irving Park, Chicago', 'Queens Creek, AZ', 'Bellevue, Nebraska', 'Durham, UK',
+                   'Long Beach, NY', 'Hollywood, FL', 'Mesa Verde, Colorado']
+LOCATION_SEPARATORS = [' / ', ' & ', '; ', ' and ', ' (formerly ', ' | ']
+# Ambiguous aliases only resolve with their state or another alias of the metro
+AMBIGUOUS_METROS = {
+    'Bellevue, Nebraska': None, 'Durham, UK': None, 'Queens Creek, AZ': None, 'Aurora, IL': None,
+    'Bellevue, WA': 'seattle', 'Durham, NC': 'raleigh', 'Queens, NY': 'new-york',
+    'Mesa, Arizona': 'phoenix', 'Irving, Texas': 'dallas', 'Irving Park, Chicago': 'chicago',
+    'Indy, IN': 'indianapolis', 'Oakland, Bay Area': 'san-francisco'
+}
+
+
+def legacy_investor_score(title, location, search_term):
+    """investor quality scoring as hard-coded before the compiled model"""
+    score = 50
+    title_lower = title.lower()
+    for keyword in ['investor', 'developer', 'capital', 'properties', 'real estate', 'cash buyer']:
+        if keyword in title_lower:
+            score += 10
+    if any(loc in location.lower() for loc in ['new york', 'los angeles', 'chicago', 'miami']):
+        score += 15
+    if search_term.lower().replace(' ', '') in title.lower().replace(' ', ''):
+        score += 20
+    return min(score, 100)
+
+
+def legacy_property_score(name, age, address_hints, city):
+    """property potential scoring as hard-coded before the compiled model"""
+    score = 30
+    try:
+        age_num = int(age) if age != "N/A" else 0
+        if age_num >= 70:
+            score += 25
+        elif age_num >= 60:
+            score += 15
+        elif age_num >= 50:
+            score += 10
+    except Exception:
+        pass
+    if address_hints:
+        score += 20
+        if len(address_hints) > 50:
+            score += 15
+    if city.lower() in ['miami', 'atlanta', 'austin', 'denver', 'charlotte']:
+        score += 20
+    return min(score, 100)
+
+
+def legacy_property_rank(x):
+    """report sort key as hard-coded in _generate_property_report"""
+    return (x['urgency_score'] * 0.4 +
+            (x['estimated_value'] / 100000) * 0.3 +
+            x['property_potential_score'] * 0.3)
+
+
+def check_investors(rows, seed):
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(rows):
+        args = (rng.choice(TITLES), rng.choice(LOCATIONS), rng.choice(SEARCH_TERMS))
+        if investor_quality_score(*args) != legacy_investor_score(*args):
+            mismatches += 1
+    return mismatches
+
+
+def check_multi_city(rows, seed):
+    """Every metro in a multi-place location counts, and look-alike towns do not"""
+    rng = random.Random(seed)
+    places = [location for location in LOCATIONS + MULTI_LOCATIONS if location]
+    locations = MULTI_LOCATIONS + [rng.choice(places) + rng.choice(LOCATION_SEPARATORS) + rng.choice(places)
+                                   for _ in range(rows)]
+    mismatches = 0
+    for location in locations:
+        args = (rng.choice(TITLES), location, rng.choice(SEARCH_TERMS))
+        if investor_quality_score(*args) != legacy_investor_score(*args):
+            mismatches += 1
+    return mismatches
+
+
+def check_ambiguous_metros():
+    """Metro each ambiguous location resolves to"""
+    return sum(normalize_location(location) != metro_id for location, metro_id in AMBIGUOUS_METROS.items())
+
+
+def check_properties(rows, seed):
+    rng = random.Random(seed)
+    ages, hints, cities = AGES + EXTRA_AGES, ADDRESS_HINTS + EXTRA_HINTS, CITIES + EXTRA_CITIES
+    mismatches = 0
+    for _ in range(rows):
+        args = ('Synthetic Person', rng.choice(ages), rng.choice(hints), rng.choice(cities))
+        if property_potential_score(*args) != legacy_property_score(*args):
+            mismatches += 1
+    return mismatches
+
+
+def check_ranks(rows, seed):
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(rows):
+        lead = {
+            'urgency_score': rng.randint(1, 10),
+            'estimated_value': rng.randint(150000, 800000),
+            'property_potential_score': rng.randint(30, 100)
+        }
+        # Same operations in the same order, so floats must match exactly
+        if property_rank(lead) != legacy_property_rank(lead):
+            mismatches += 1
+    return mismatches
+
+
+def check_frames(rows, seed):
+    investors, obituaries = synthetic_frames(rows, seed)
+    expected = [legacy_investor_score(*row) for row in
+                zip(investors['title'], investors['location'], investors['search_term'])]
+    mismatches = int((score_investor_frame(investors).to_numpy() != expected).sum())
+    expected = [legacy_property_score(None, *row) for row in
+                zip(obituaries['age'], obituaries['address_hints'], obituaries['city'])]
+    mismatches += int((score_obituary_frame(obituaries).to_numpy() != expected).sum())
+    return mismatches
+
+
+def check_aliases():
+    """Aliases score exactly like the metro they resolve to"""
+    mismatches = 0
+    for alias, city in ALIAS_CITIES.items():
+        args = ('Synthetic Person', '75', 'lived on Coral Way')
+        if property_potential_score(*args, alias) != property_potential_score(*args, city):
+            mismatches += 1
+    for alias, location in ALIAS_LOCATIONS.items():
+        args = ('Real Estate Investor', 'real estate investor')
+        if investor_quality_score(args[0], alias, args[1]) != investor_quality_score(args[0], location, args[1]):
+            mismatches += 1
+    return mismatches
+
+
+def check_hot_reload():
+    """A spec file edit is picked up by the next reload, and removing it restores the defaults"""
+    original_path = LeadFlowConfig.SCORING_SPEC_PATH
+    args = ('Property Developer', 'Phoenix, AZ', 'fix and flip')
+    before = investor_quality_score(*args)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'scoring.json')
+        with open(path, 'w') as f:
+            json.dump({'investor': {'base': 0}}, f)
+        LeadFlowConfig.SCORING_SPEC_PATH = path
+        try:
+            reload_scoring_model()
+            changed = investor_quality_score(*args) == before - 50
+        finally:
+            LeadFlowConfig.SCORING_SPEC_PATH = original_path
+            reload_scoring_model()
+    return changed and investor_quality_score(*args) == before
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compiled scoring model equivalence check')
+    parser.add_argument('--rows', type=int, default=100000, help='Synthetic leads per check')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if LeadFlowConfig.SCORING_SPEC_PATH:
+        print("⚠️ SCORING_SPEC_PATH is set; legacy scores only match the default spec")
+    reload_scoring_model(force=True)
+
+    checks = [
+        ('investor_quality_score', lambda: check_investors(args.rows, args.seed)),
+        ('multi-city locations', lambda: check_multi_city(args.rows, args.seed)),
+        ('property_potential_score', lambda: check_properties(args.rows, args.seed)),
+        ('property_rank', lambda: check_ranks(args.rows, args.seed)),
+        ('batch frames', lambda: check_frames(args.rows, args.seed)),
+    ]
+    failed = False
+    for name, check in checks:
+        start = time.perf_counter()
+        mismatches = check()
+        elapsed = time.perf_counter() - start
+        status = '✅' if mismatches == 0 else '❌'
+        print(f"{status} {name:<26} {mismatches} mismatches over {args.rows:,} leads ({elapsed:.2f}s)")
+        failed = failed or mismatches > 0
+
+    mismatches = check_aliases()
+    print(f"{'✅' if mismatches == 0 else '❌'} metro aliases             "
+          f"{mismatches} mismatches over {len(ALIAS_CITIES) + len(ALIAS_LOCATIONS)} aliases")
+    failed = failed or mismatches > 0
+
+    mismatches = check_ambiguous_metros()
+    print(f"{'✅' if mismatches == 0 else '❌'} ambiguous metro names     "
+          f"{mismatches} mismatches over {len(AMBIGUOUS_METROS)} locations")
+    failed = failed or mismatches > 0
+
+    reloaded = check_hot_reload()
+    print(f"{'✅' if reloaded else '❌'} hot reload from SCORING_SPEC_PATH")
+    failed = failed or not reloaded
+
+    print(f"\nCompiled age table covers ages 0-{len(scoring_model().age_table) - 1}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
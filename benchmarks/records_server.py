@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Local Records API
+Test server for the http records backend, answering from the local simulation
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.property_scanner.record_backends import LocalHeirContacts, LocalPropertyRecords
+
+BACKENDS = {
+    '/properties': LocalPropertyRecords(),
+    '/heirs': LocalHeirContacts()
+}
+
+
+class RecordsHandler(BaseHTTPRequestHandler):
+    """GET /properties or /heirs ?name=...&city=... -> JSON list"""
+
+    latency = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        backend = BACKENDS.get(url.path)
+        if backend is None:
+            self.send_error(404)
+            return
+
+        query = parse_qs(url.query)
+        time.sleep(self.latency)
+        records = backend.lookup(query.get('name', [''])[0], query.get('city', [''])[0])
+
+        body = json.dumps(records).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host='127.0.0.1', port=8765, latency_ms=0):
+    """Build the server (call serve_forever() on it)"""
+    RecordsHandler.latency = latency_ms / 1000
+    return ThreadingHTTPServer((host, port), RecordsHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve simulated property records over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port (default: 8765)')
+    parser.add_argument('--latency-ms', type=int, default=0, help='Added latency per request (default: 0)')
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.latency_ms)
+    print(f"🌐 Records API on http://{args.host}:{args.port} (latency {args.latency_ms} ms)")
+    print("   Run hunts with RECORDS_BACKEND=http RECORDS_API_URL=http://HOST:PORT")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Benchmark Suite
+Times extraction, scoring, reports, CSV export and a replayed full hunt at scale
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from config.settings import LeadFlowConfig
+from src.ai_enrichment.batch_scoring import score_investor_frame, score_obituary_frame
+from src.ai_enrichment.lead_scoring import investor_quality_score, property_potential_score
+from src.investor_finder.linkedin_scraper import LinkedInInvestorScraper
+from src.property_scanner.inheritance_finder import InheritancePropertyFinder
+from src.storage.sinks import CsvSink, SqliteSink
+from src.extraction.page_extractor import INVESTOR_CONTAINER_SELECTOR, OBITUARY_CARD_SELECTOR
+from synthetic import (
+    LINKEDIN_FIXTURE, OBITUARY_FIXTURE, replay_mode, scale_fixture,
+    synthetic_investors, synthetic_obituaries, synthetic_properties
+)
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+STAGES = ['extraction', 'scoring', 'reports', 'csv_export', 'full_hunt']
+CARDS_PER_PAGE = 40
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def _timed(func):
+    """Wall time of one call and its result, with output silenced"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func()
+        return time.perf_counter() - start, result
+
+
+def _record(results, stage, rows, seconds, **extra):
+    results.append({
+        'stage': stage,
+        'rows': rows,
+        'seconds': round(seconds, 6),
+        'rows_per_second': round(rows / seconds, 1) if seconds else None,
+        **extra
+    })
+    print(f"📊 {stage:<34} rows={rows:<9,} {seconds:9.3f} s")
+
+
+def bench_extraction(results, rows):
+    """Single-pass parsing of fixture pages, CARDS_PER_PAGE cards at a time"""
+    scraper = LinkedInInvestorScraper()
+    finder = InheritancePropertyFinder()
+    linkedin_page = scale_fixture(LINKEDIN_FIXTURE, INVESTOR_CONTAINER_SELECTOR, CARDS_PER_PAGE)
+    obituary_page = scale_fixture(OBITUARY_FIXTURE, OBITUARY_CARD_SELECTOR, CARDS_PER_PAGE)
+
+    pages = max(rows // CARDS_PER_PAGE, 1)
+
+    def investors():
+        return sum(len(scraper._extract_profiles_from_source(
+            linkedin_page, 'real estate investor', 'Miami', CARDS_PER_PAGE,
+            base_url='https://www.linkedin.com/search/results/people/'
+        )) for _ in range(pages))
+
+    def obituaries():
+        return sum(len(finder._extract_obituaries_from_source(obituary_page, 'Miami', CARDS_PER_PAGE))
+                   for _ in range(pages))
+
+    seconds, leads = _timed(investors)
+    _record(results, 'extraction_investors', rows, seconds, pages=pages, leads=leads)
+    seconds, leads = _timed(obituaries)
+    _record(results, 'extraction_obituaries', rows, seconds, pages=pages, leads=leads)
+
+
+def bench_scoring(results, rows, seed):
+    """Per-row scoring functions vs the vectorized frame scorers"""
+    investors = pd.DataFrame(synthetic_investors(rows, seed))
+    obituaries = pd.DataFrame(synthetic_obituaries(rows, seed))
+
+    seconds, _ = _timed(lambda: [
+        investor_quality_score(title, location, term)
+        for title, location, term in zip(investors['title'], investors['location'], investors['search_term'])
+    ])
+    _record(results, 'scoring_investors_rowwise', rows, seconds)
+    seconds, _ = _timed(lambda: score_investor_frame(investors))
+    _record(results, 'scoring_investors_vectorized', rows, seconds)
+
+    seconds, _ = _timed(lambda: [
+        property_potential_score(name, age, hints, city)
+        for name, age, hints, city in zip(obituaries['deceased_name'], obituaries['age'],
+                                          obituaries['address_hints'], obituaries['city'])
+    ])
+    _record(results, 'scoring_obituaries_rowwise', rows, seconds)
+    seconds, _ = _timed(lambda: score_obituary_frame(obituaries))
+    _record(results, 'scoring_obituaries_vectorized', rows, seconds)
+
+
+def bench_reports(results, rows, seed):
+    """Streaming summary reports over generated leads"""
+    scraper = LinkedInInvestorScraper()
+    finder = InheritancePropertyFinder()
+
+    seconds, _ = _timed(lambda: scraper._generate_summary_report(synthetic_investors(rows, seed)))
+    _record(results, 'report_investors', rows, seconds)
+    seconds, _ = _timed(lambda: finder._generate_property_report(synthetic_properties(rows, seed)))
+    _record(results, 'report_properties', rows, seconds)
+
+
+def bench_csv_export(results, rows, seed, workdir):
+    """CSV sink writes and the lead-store CSV export"""
+    def write_csv(table, leads):
+        with CsvSink(table, os.path.join(workdir, f"{table}_{rows}.csv")) as sink:
+            sink.write_many(leads)
+
+    seconds, _ = _timed(lambda: write_csv('investors', synthetic_investors(rows, seed)))
+    _record(results, 'csv_sink_investors', rows, seconds)
+    seconds, _ = _timed(lambda: write_csv('properties', synthetic_properties(rows, seed)))
+    _record(results, 'csv_sink_properties', rows, seconds)
+
+    def store_export():
+        with SqliteSink('properties', path=os.path.join(workdir, f"store_{rows}.db")) as sink:
+            sink.write_many(synthetic_properties(rows, seed))
+            sink.export_csv(os.path.join(workdir, f"store_export_{rows}.csv"))
+
+    seconds, _ = _timed(store_export)
+    _record(results, 'store_write_and_export_properties', rows, seconds)
+
+
+def bench_full_hunt(results, cities, seed):
+    """main.run_full_hunt end to end, replaying the HTML fixtures"""
+    import main
+
+    random.seed(seed)
+    # The fixture obituaries are dated early 2026, so no date window
+    args = Namespace(cities=cities, max_investors=30, max_properties=15, sink=None,
+                     stream_only=False, no_dedup=True, resume=False, days_back=0)
+    with replay_mode():
+        seconds, leads = _timed(lambda: main.run_full_hunt(args))
+    _record(results, 'full_hunt_stubbed', len(leads), seconds, cities=cities)
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the LeadFlow AI benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Synthetic row counts (default: 1000 100000 1000000)')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='Stages to run (default: all)')
+    parser.add_argument('--hunt-cities', type=int, default=3, help='Cities for the replayed full hunt (default: 3)')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed (default: 7)')
+    parser.add_argument('--output', help='Results JSON path (default: benchmarks/results/<timestamp>.json)')
+    args = parser.parse_args()
+
+    results = []
+    print("🤖 LeadFlow AI - Benchmark Suite")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory(prefix='leadflow_bench_') as workdir:
+        # Keep every file the pipeline writes out of the working tree
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        LeadFlowConfig.DATA_DIR = os.path.join(workdir, 'data')
+        LeadFlowConfig.LEAD_STORE_PATH = os.path.join(workdir, 'leadflow.db')
+        LeadFlowConfig.DEDUP_INDEX_PATH = os.path.join(workdir, 'dedup_index.db')
+        LeadFlowConfig.CHECKPOINT_DIR = os.path.join(workdir, 'checkpoints')
+        try:
+            for rows in args.sizes:
+                if 'extraction' in args.stages:
+                    bench_extraction(results, rows)
+                if 'scoring' in args.stages:
+                    bench_scoring(results, rows, args.seed)
+                if 'reports' in args.stages:
+                    bench_reports(results, rows, args.seed)
+                if 'csv_export' in args.stages:
+                    bench_csv_export(results, rows, args.seed, workdir)
+            if 'full_hunt' in args.stages:
+                bench_full_hunt(results, args.hunt_cities, args.seed)
+        finally:
+            os.chdir(cwd)
+
+    payload = {
+        'suite': 'leadflow',
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': datetime.now().isoformat(),
+        'sizes': args.sizes,
+        'results': results
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+    print(f"💾 Results saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
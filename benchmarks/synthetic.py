@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Synthetic Lead Generators
+Deterministic investors, obituaries and inheritance properties for benchmarks
+"""
+
+import contextlib
+import copy
+import itertools
+import os
+import random
+from datetime import datetime, timedelta
+
+import lxml.html
+
+from src.extraction.page_extractor import select
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+LINKEDIN_FIXTURE = os.path.join(FIXTURES_DIR, 'linkedin_search_results.html')
+OBITUARY_FIXTURE = os.path.join(FIXTURES_DIR, 'legacy_obituaries.html')
+
+FIRST_NAMES = ['Maria', 'David', 'Eleanor', 'Harold', 'Rosa', 'Li Wen', 'Thomas', 'Gloria',
+               'Walter', 'Dolores', 'Priya', 'Marcus', 'Aisha', 'Kenji']
+LAST_NAMES = ['Gonzalez', 'Chen', 'Whitfield', 'Benson', 'Delgado', 'Zhao', 'Reed', 'Mercer',
+              'Kowalski', 'Ruiz', 'Okafor', 'Patel', 'Nguyen', 'Sullivan']
+TITLES = [
+    'Real Estate Investor | Cash Buyer', 'Managing Partner at Chen Capital Properties',
+    'Property Developer & Multifamily Investor', 'Software Engineer', 'Realtor',
+    'Fix and Flip Specialist', 'Commercial Real Estate Investor', 'House Flipper',
+    'Rental property investor - buy and hold', 'CEO, Sunshine Properties LLC'
+]
+LOCATIONS = [
+    'Miami, Florida, United States', 'New York City Metropolitan Area', 'Greater Chicago Area',
+    'Phoenix, AZ', 'Los Angeles, CA', 'Austin, Texas', 'Dallas', 'Denver, Colorado'
+]
+SEARCH_TERMS = ['real estate investor', 'property investor', 'fix and flip']
+CITIES = ['Miami', 'Atlanta', 'Phoenix', 'Dallas', 'Denver', 'Austin', 'Charlotte', 'Tampa']
+STREET_NAMES = ['Oak', 'Pine', 'Maple', 'Cedar', 'Elm', 'Main', 'Park', 'Lake', 'River', 'Hill']
+STREET_TYPES = ['St', 'Ave', 'Dr', 'Rd', 'Ln', 'Way', 'Blvd', 'Ct']
+CITY_MULTIPLIERS = {
+    'miami': 1.5, 'atlanta': 1.3, 'austin': 1.4, 'denver': 1.3,
+    'charlotte': 1.2, 'phoenix': 1.1, 'dallas': 1.2, 'tampa': 1.1
+}
+
+# Distinct records generated per kind; larger runs cycle through this pool
+# so generation cost does not dominate the stage being timed
+POOL_SIZE = 10000
+
+BASE_TIME = datetime(2026, 1, 15, 9, 30)
+
+
+def scale_fixture(path, selector, cards):
+    """Repeat the fixture's result cards until the page holds `cards` entries"""
+    with open(path, encoding='utf-8') as f:
+        root = lxml.html.fromstring(f.read())
+
+    templates = select(root, selector)
+    parent = templates[0].getparent()
+    for template in templates:
+        parent.remove(template)
+    for i in range(cards):
+        parent.append(copy.deepcopy(templates[i % len(templates)]))
+
+    return lxml.html.tostring(root, encoding='unicode')
+
+
+def _name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def make_investor(rng, index):
+    """One investor lead shaped like LinkedInInvestorScraper records"""
+    name = _name(rng)
+    return {
+        'name': name,
+        'title': rng.choice(TITLES),
+        'location': rng.choice(LOCATIONS),
+        'profile_url': f"https://www.linkedin.com/in/{name.lower().replace(' ', '-')}-{index}/",
+        'search_term': rng.choice(SEARCH_TERMS),
+        'target_city': rng.choice(CITIES),
+        'quality_score': rng.choice([50, 60, 70, 80, 85, 90, 100]),
+        'lead_type': 'Real Estate Investor',
+        'scraped_at': (BASE_TIME + timedelta(seconds=index)).isoformat()
+    }
+
+
+def make_obituary(rng, index):
+    """One obituary record shaped like InheritancePropertyFinder records"""
+    age = rng.choice(['N/A', str(rng.randint(45, 99))])
+    street = f"{rng.randint(100, 9999)} {rng.choice(STREET_NAMES)} {rng.choice(STREET_TYPES)}"
+    return {
+        'deceased_name': _name(rng),
+        'age': age,
+        'death_date': f"January {rng.randint(1, 28)}, 2026",
+        'city': rng.choice(CITIES),
+        'address_hints': rng.choice(['', street, f"lived on {rng.choice(STREET_NAMES)} Lane; {street}"]),
+        'source': 'Legacy.com',
+        'property_potential_score': rng.choice([30, 45, 55, 65, 80, 95]),
+        'found_at': (BASE_TIME + timedelta(seconds=index)).isoformat()
+    }
+
+
+def make_property(rng, index):
+    """One enriched inheritance property (see _generate_realistic_property)"""
+    city = rng.choice(CITIES)
+    owner = _name(rng)
+    estimated_value = int(rng.randint(180000, 650000) * CITY_MULTIPLIERS.get(city.lower(), 1.0))
+    last_name = owner.split()[-1]
+    heir_contacts = [
+        {
+            'name': f"{rng.choice(FIRST_NAMES)} {last_name}",
+            'phone': f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            'relationship': rng.choice(['Son', 'Daughter', 'Spouse', 'Relative']),
+            'confidence': rng.choice(['High', 'Medium', 'Low'])
+        }
+        for _ in range(rng.choices([0, 1, 2, 3], weights=[20, 40, 30, 10])[0])
+    ]
+    return {
+        'owner_name': owner,
+        'address': f"{rng.randint(100, 9999)} {rng.choice(STREET_NAMES)} {rng.choice(STREET_TYPES)}, {city}",
+        'city': city,
+        'estimated_value': estimated_value,
+        'property_type': rng.choice(['Single Family', 'Condo', 'Townhouse']),
+        'status': 'Inherited - Potential Sale',
+        'urgency_score': rng.randint(7, 10),
+        'lead_quality': 'High' if estimated_value > 400000 else 'Medium',
+        'found_at': (BASE_TIME + timedelta(seconds=index)).isoformat(),
+        'deceased_age': str(rng.randint(60, 99)),
+        'death_date': f"January {rng.randint(1, 28)}, 2026",
+        'obituary_source': 'Legacy.com',
+        'property_potential_score': rng.choice([50, 65, 80, 95]),
+        'heir_contacts': heir_contacts,
+        'lead_type': 'Inheritance Property'
+    }
+
+
+def _stream(factory, rows, seed):
+    rng = random.Random(seed)
+    pool = [factory(rng, index) for index in range(min(rows, POOL_SIZE))]
+    return itertools.islice(itertools.cycle(pool), rows)
+
+
+def synthetic_investors(rows, seed=7):
+    """Stream `rows` investor leads"""
+    return _stream(make_investor, rows, seed)
+
+
+def synthetic_obituaries(rows, seed=7):
+    """Stream `rows` obituary records"""
+    return _stream(make_obituary, rows, seed)
+
+
+def synthetic_properties(rows, seed=7):
+    """Stream `rows` enriched inheritance properties"""
+    return _stream(make_property, rows, seed)
+
+
+@contextlib.contextmanager
+def replay_mode(directory=FIXTURES_DIR):
+    """Hunts read recorded pages from `directory` with every fixed delay zeroed"""
+    from config.settings import LeadFlowConfig
+    from src.instrumentation.profiler import PROFILER
+
+    originals = (LeadFlowConfig.REPLAY_DIR, PROFILER.delay_scale)
+    LeadFlowConfig.REPLAY_DIR, PROFILER.delay_scale = directory, 0.0
+    try:
+        yield
+    finally:
+        LeadFlowConfig.REPLAY_DIR, PROFILER.delay_scale = originals
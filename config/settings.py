@@ -28,6 +28,24 @@ class LeadFlowConfig:
     MAX_PROPERTIES_PER_CITY = int(os.getenv('MAX_PROPERTIES_PER_CITY', 15))
     MIN_PROPERTY_VALUE = int(os.getenv('MIN_PROPERTY_VALUE', 150000))
     MIN_URGENCY_SCORE = int(os.getenv('MIN_URGENCY_SCORE', 7))
+    # Only obituaries dated within this many days are enriched (0 = every card on the page);
+    # listings run newest first, so a page is abandoned after this many older cards in a row
+    OBITUARY_DAYS_BACK = int(os.getenv('OBITUARY_DAYS_BACK', 30))
+    OBITUARY_STALE_STREAK = int(os.getenv('OBITUARY_STALE_STREAK', 3))
+    
+    # Property Record / Heir Contact Backends
+    RECORDS_BACKEND = os.getenv('RECORDS_BACKEND', 'local')  # local or http
+    RECORDS_API_URL = os.getenv('RECORDS_API_URL', 'http://127.0.0.1:8765')
+    RECORDS_API_TIMEOUT = float(os.getenv('RECORDS_API_TIMEOUT', 10))
+    BACKEND_CONCURRENCY = int(os.getenv('BACKEND_CONCURRENCY', 8))
+    REMOTE_LOOKUP_DELAY = (3, 6)  # Random delay per remote lookup, in seconds
+    
+    # Lookup Cache Settings (memoized property record / heir contact lookups)
+    LOOKUP_CACHE_ENABLED = os.getenv('LOOKUP_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    LOOKUP_CACHE_SIZE = int(os.getenv('LOOKUP_CACHE_SIZE', 10000))
+    LOOKUP_CACHE_TTL = float(os.getenv('LOOKUP_CACHE_TTL', 7 * 24 * 3600))  # Seconds
+    LOOKUP_CACHE_PERSIST = os.getenv('LOOKUP_CACHE_PERSIST', 'false').lower() in ('1', 'true', 'yes')
+    LOOKUP_CACHE_DIR = os.getenv('LOOKUP_CACHE_DIR', os.path.join(DATA_DIR, 'lookup_cache'))
     
     # AI Scoring Thresholds
     HIGH_QUALITY_SCORE = int(os.getenv('HIGH_QUALITY_SCORE', 80))
@@ -38,22 +56,68 @@ class LeadFlowConfig:
     DELAY_BETWEEN_SEARCHES = (3, 8)  # Random delay range in seconds
     DELAY_BETWEEN_CITIES = (15, 30)  # Random delay range between cities
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
+    DRIVER_CACHE_PATH = os.getenv('DRIVER_CACHE_PATH', os.path.join(DATA_DIR, 'chromedriver_cache.json'))
+    
+    # Page Readiness (wait for result containers instead of fixed sleeps)
+    PAGE_WAIT_TIMEOUT = float(os.getenv('PAGE_WAIT_TIMEOUT', 15))  # Seconds before giving up on a page
+    PAGE_SCROLL_TIMEOUT = float(os.getenv('PAGE_SCROLL_TIMEOUT', 5))  # Per scroll step (was a 3-5s sleep)
+    PAGE_STABLE_SECONDS = float(os.getenv('PAGE_STABLE_SECONDS', 1.0))  # Result count unchanged this long
+    PAGE_POLL_SECONDS = float(os.getenv('PAGE_POLL_SECONDS', 0.25))
+    PAGE_EMPTY_GRACE = float(os.getenv('PAGE_EMPTY_GRACE', 3.0))  # Loaded page with no results
     
     # Export Settings
     CSV_ENCODING = 'utf-8'
+    EXPORT_FORMAT = os.getenv('EXPORT_FORMAT', 'csv')  # csv or xlsx
     INCLUDE_HEADERS = True
     DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    NORMALIZED_EXPORT = os.getenv('NORMALIZED_EXPORT', 'false').lower() in ('1', 'true', 'yes')  # + contacts tables
+    
+    # Lead Store Settings
+    LEAD_STORE_PATH = os.getenv('LEAD_STORE_PATH', os.path.join(DATA_DIR, 'leadflow.db'))
+    
+    # Streaming Result Sink Settings
+    RESULT_SINK = os.getenv('RESULT_SINK', 'sqlite')  # sqlite, csv or jsonl
+    SINK_BATCH_SIZE = int(os.getenv('SINK_BATCH_SIZE', 25))
+    SINK_FSYNC_INTERVAL = float(os.getenv('SINK_FSYNC_INTERVAL', 10))  # Seconds between fsyncs
+    
+    # Cross-Run Dedup Settings
+    DEDUP_ENABLED = os.getenv('DEDUP_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    DEDUP_INDEX_PATH = os.getenv('DEDUP_INDEX_PATH', os.path.join(DATA_DIR, 'dedup_index.db'))
+    DEDUP_BLOOM_CAPACITY = int(os.getenv('DEDUP_BLOOM_CAPACITY', 1000000))
+    DEDUP_BLOOM_ERROR_RATE = float(os.getenv('DEDUP_BLOOM_ERROR_RATE', 0.01))
+    
+    # Page Snapshots (saved search pages for `main.py reprocess`; empty = off)
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', '')
+    
+    # Page Cache (serve search pages fetched within PAGE_CACHE_TTL from disk)
+    PAGE_CACHE_ENABLED = os.getenv('PAGE_CACHE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    PAGE_CACHE_DIR = os.getenv('PAGE_CACHE_DIR', os.path.join(DATA_DIR, 'page_cache'))
+    PAGE_CACHE_TTL = float(os.getenv('PAGE_CACHE_TTL', 24 * 3600))  # Seconds
+    PAGE_CACHE_MAX_MB = float(os.getenv('PAGE_CACHE_MAX_MB', 256))
+    
+    # Offline Replay (serve recorded pages from this directory instead of Chrome,
+    # with every fixed delay zeroed; empty = live browser)
+    REPLAY_DIR = os.getenv('REPLAY_DIR', '')
+    
+    # Checkpoint Settings
+    CHECKPOINT_DIR = os.getenv('CHECKPOINT_DIR', os.path.join(DATA_DIR, 'checkpoints'))
+    # Finished units per checkpoint save (each city's last units are saved when it ends)
+    CHECKPOINT_SAVE_EVERY = int(os.getenv('CHECKPOINT_SAVE_EVERY', 25))
     
     # Contact Information
     CONTACT_EMAIL = os.getenv('CONTACT_EMAIL', 'jmichaeloficial@gmail.com')
     COMPANY_NAME = 'LeadFlow AI'
     
-    # Target Cities (high-value real estate markets)
+    # Target Cities (high-value real estate markets, shared by every hunt;
+    # names resolve to metros through src/extraction/gazetteer.py)
     TARGET_CITIES = [
         'Miami', 'Atlanta', 'Phoenix', 'Dallas', 'Denver',
         'Austin', 'Charlotte', 'Tampa', 'Orlando', 'Jacksonville',
         'Fort Worth', 'San Antonio', 'Nashville', 'Memphis', 'Las Vegas',
-        'Raleigh', 'Virginia Beach', 'Oklahoma City', 'Louisville', 'Milwaukee'
+        'Raleigh', 'Virginia Beach', 'Oklahoma City', 'Louisville', 'Milwaukee',
+        'New York', 'Los Angeles', 'Chicago', 'Houston', 'Philadelphia',
+        'San Diego', 'San Jose', 'Columbus', 'San Francisco', 'Indianapolis',
+        'Seattle', 'Boston', 'El Paso'
     ]
     
     # Real Estate Investor Search Terms
@@ -82,14 +146,47 @@ class LeadFlowConfig:
         'Commercial'
     ]
     
-    # Quality Scoring Weights
+    # Investor Title Keywords (each one found in a title adds to the score)
+    TITLE_SCORING_KEYWORDS = [
+        'investor',
+        'developer',
+        'capital',
+        'properties',
+        'real estate',
+        'cash buyer'
+    ]
+    
+    # Premium Locations (investor location bonus, matched by gazetteer metro)
+    PREMIUM_LOCATIONS = ['new york', 'los angeles', 'chicago', 'miami']
+    
+    # High-Value Cities (property potential bonus, matched by gazetteer metro)
+    HIGH_VALUE_CITIES = ['miami', 'atlanta', 'austin', 'denver', 'charlotte']
+    
+    # Quality Scoring Weights (points per rule, compiled once by scoring_model)
     SCORING_WEIGHTS = {
-        'title_keywords': 0.3,
-        'location_premium': 0.2,
-        'search_relevance': 0.2,
-        'profile_completeness': 0.1,
-        'activity_level': 0.2
+        'investor': {
+            'base': 50,
+            'title_keyword': 10,      # Per TITLE_SCORING_KEYWORDS match
+            'premium_location': 15,   # Any PREMIUM_LOCATIONS match
+            'search_relevance': 20    # Search term appears in the title
+        },
+        'property': {
+            'base': 30,
+            'age_brackets': [[70, 25], [60, 15], [50, 10]],  # [minimum age, points]
+            'address_hints': 20,
+            'multiple_addresses': 15,
+            'multiple_address_length': 50,
+            'high_value_city': 20     # City in HIGH_VALUE_CITIES
+        },
+        'property_rank': {
+            'urgency': 0.4,
+            'value': 0.3,             # Per value_unit of estimated value
+            'value_unit': 100000,
+            'potential': 0.3
+        },
+        'max_score': 100
     }
+    SCORING_SPEC_PATH = os.getenv('SCORING_SPEC_PATH', '')  # JSON overrides, re-read between runs
     
     # Output File Templates
     OUTPUT_TEMPLATES = {
@@ -99,6 +196,17 @@ class LeadFlowConfig:
         'report': 'leadflow_report_{timestamp}.txt'
     }
     
+    _initialized = False
+    
+    @classmethod
+    def initialize(cls):
+        """Create directories and validate settings (once, on demand)"""
+        if not cls._initialized:
+            cls.validate_settings()
+            cls.ensure_directories()
+            cls._initialized = True
+        return cls
+    
     @classmethod
     def ensure_directories(cls):
         """Ensure all required directories exist"""
@@ -155,7 +263,3 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 ]
-
-# Initialize configuration on import
-LeadFlowConfig.ensure_directories()
-LeadFlowConfig.validate_settings()
\ No newline at end of file
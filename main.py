@@ -13,8 +13,13 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from config.settings import LeadFlowConfig
-from src.investor_finder.linkedin_scraper import LinkedInInvestorScraper
-from src.property_scanner.inheritance_finder import InheritancePropertyFinder
+from src.instrumentation.profiler import PROFILER
+from src.reporting.aggregator import LeadAggregator
+from src.storage.lead_store import LeadStore
+from src.storage.sinks import SINK_FORMATS, open_sink
+from src.storage.checkpoint import HuntCheckpoint
+from src.storage.lead_records import tag_category
+from src.storage.xlsx_export import EXPORT_FORMATS, SHEET_TITLES, export_xlsx
 
 def print_banner():
     """Display LeadFlow AI banner"""
@@ -31,41 +36,108 @@ def print_banner():
     """
     print(banner)
 
-def run_investor_hunt(args):
-    """Run LinkedIn investor discovery"""
+def _open_run_sink(args, table):
+    """Sink selected with --sink, or None for the scraper default (lead store)"""
+    if getattr(args, 'resume', False) and HuntCheckpoint(table, resume=True).resumed:
+        return None  # The scraper reopens the checkpointed sink
+    sink_format = getattr(args, 'sink', None)
+    return open_sink(table, sink_format) if sink_format else None
+
+def _export_format(args):
+    """Per-run export file format: --format, else EXPORT_FORMAT"""
+    return getattr(args, 'format', None) or LeadFlowConfig.EXPORT_FORMAT
+
+def _open_workbook_sinks(args):
+    """Sinks a full hunt reads back for its combined Excel workbook
+
+    Tables resumed from a checkpoint keep their own per-phase export instead.
+    """
+    return {
+        table: open_sink(table, getattr(args, 'sink', None))
+        for table in ('investors', 'properties')
+        if not (getattr(args, 'resume', False) and HuntCheckpoint(table, resume=True).resumed)
+    }
+
+def export_run_workbook(sinks):
+    """One .xlsx with a sheet per lead category, streamed back from the run's sinks"""
+    tables = {table: sink.iter_leads() for table, sink in sinks.items() if sink.written}
+    if not tables:
+        return None
+    LeadFlowConfig.ensure_directories()
+    path = os.path.join(LeadFlowConfig.DATA_DIR, f"leadflow_leads_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
+    counts = export_xlsx(path, tables)
+    print(f"\n📗 Excel workbook saved to: {path} ({', '.join(f'{title}: {rows}' for title, rows in counts.items())})")
+    return path
+
+def run_investor_hunt(args, driver=None, sink=None):
+    """Run LinkedIn investor discovery (in a shared browser if `driver` is given)"""
     print("\n🔍 Starting LinkedIn Investor Hunt...")
     print("=" * 50)
     
-    scraper = LinkedInInvestorScraper()
-    investors = scraper.run_investor_hunt(
-        target_cities=args.cities,
-        investors_per_city=args.max_investors
-    )
+    # Imported here so --help, demo and lead queries never load selenium
+    from src.investor_finder.linkedin_scraper import LinkedInInvestorScraper
     
-    if investors:
-        print(f"\n✅ SUCCESS: Found {len(investors)} qualified investors")
-        print(f"💰 Estimated Value: ${len(investors) * 200:,} (@$200 per lead)")
+    scraper = LinkedInInvestorScraper(driver=driver)
+    # A sink passed in belongs to the caller, which also handles the export
+    shared_sink = sink is not None
+    sink = sink or _open_run_sink(args, 'investors')
+    try:
+        investors = scraper.run_investor_hunt(
+            target_cities=args.cities,
+            investors_per_city=args.max_investors,
+            sink=sink,
+            keep_results=not getattr(args, 'stream_only', False),
+            deduplicate=False if getattr(args, 'no_dedup', False) else None,
+            resume=getattr(args, 'resume', False),
+            export_format=None if shared_sink else _export_format(args)
+        )
+    finally:
+        if sink and not shared_sink:
+            sink.close()
+    
+    found = len(investors) or scraper.last_run_count
+    if found:
+        print(f"\n✅ SUCCESS: Found {found} qualified investors")
+        print(f"💰 Estimated Value: ${found * 200:,} (@$200 per lead)")
     else:
         print("\n❌ No investors found. Check your LinkedIn login and try again.")
     
     return investors
 
-def run_property_hunt(args):
-    """Run inheritance property discovery"""
+def run_property_hunt(args, driver=None, sink=None):
+    """Run inheritance property discovery (in a shared browser if `driver` is given)"""
     print("\n🏠 Starting Inheritance Property Hunt...")
     print("=" * 50)
     
-    finder = InheritancePropertyFinder()
-    properties = finder.run_inheritance_hunt(
-        target_cities=args.cities,
-        max_properties_per_city=args.max_properties
-    )
+    from src.property_scanner.inheritance_finder import InheritancePropertyFinder
+    
+    finder = InheritancePropertyFinder(driver=driver)
+    # A sink passed in belongs to the caller, which also handles the export
+    shared_sink = sink is not None
+    sink = sink or _open_run_sink(args, 'properties')
+    try:
+        properties = finder.run_inheritance_hunt(
+            target_cities=args.cities,
+            max_properties_per_city=args.max_properties,
+            sink=sink,
+            keep_results=not getattr(args, 'stream_only', False),
+            deduplicate=False if getattr(args, 'no_dedup', False) else None,
+            resume=getattr(args, 'resume', False),
+            export_format=None if shared_sink else _export_format(args),
+            days_back=getattr(args, 'days_back', None)
+        )
+    finally:
+        if sink and not shared_sink:
+            sink.close()
     
     if properties:
         total_value = sum(prop['estimated_value'] for prop in properties)
         print(f"\n✅ SUCCESS: Found {len(properties)} inheritance properties")
         print(f"🏠 Total Property Value: ${total_value:,}")
         print(f"💰 Estimated Lead Value: ${len(properties) * 250:,} (@$250 per lead)")
+    elif finder.last_run_count:
+        print(f"\n✅ SUCCESS: Found {finder.last_run_count} inheritance properties")
+        print(f"💰 Estimated Lead Value: ${finder.last_run_count * 250:,} (@$250 per lead)")
     else:
         print("\n❌ No properties found. Try different cities or check internet connection.")
     
@@ -76,19 +148,36 @@ def run_full_hunt(args):
     print("\n🚀 Starting Complete LeadFlow AI Hunt...")
     print("=" * 60)
     
-    all_leads = []
+    from src.automation.driver_factory import BrowserSession
     
-    # Run investor hunt
-    investors = run_investor_hunt(args)
-    if investors:
-        all_leads.extend([{**inv, 'lead_category': 'Investor'} for inv in investors])
+    all_leads = []
     
-    print("\n" + "="*60)
+    # An Excel export is one workbook with a sheet per lead category
+    workbook_sinks = _open_workbook_sinks(args) if _export_format(args) == 'xlsx' else {}
+    try:
+        # One browser serves both phases
+        with BrowserSession() as browser:
+            if browser.driver is None:
+                return all_leads
+            
+            # Run investor hunt
+            investors = run_investor_hunt(args, driver=browser.driver, sink=workbook_sinks.get('investors'))
+            if investors:
+                all_leads.extend(tag_category(investors, 'Investor'))
+            
+            print("\n" + "="*60)
+            
+            # Run property hunt  
+            properties = run_property_hunt(args, driver=browser.driver, sink=workbook_sinks.get('properties'))
+        
+        if workbook_sinks:
+            export_run_workbook(workbook_sinks)
+    finally:
+        for sink in workbook_sinks.values():
+            sink.close()
     
-    # Run property hunt  
-    properties = run_property_hunt(args)
     if properties:
-        all_leads.extend([{**prop, 'lead_category': 'Property'} for prop in properties])
+        all_leads.extend(tag_category(properties, 'Property'))
     
     # Generate combined report
     if all_leads:
@@ -97,31 +186,38 @@ def run_full_hunt(args):
     return all_leads
 
 def generate_combined_report(leads):
-    """Generate comprehensive lead generation report"""
-    investor_leads = [lead for lead in leads if lead['lead_category'] == 'Investor']
-    property_leads = [lead for lead in leads if lead['lead_category'] == 'Property']
+    """Generate comprehensive lead generation report in one pass over a list or stream of leads"""
+    stats = LeadAggregator(
+        sum_fields=['estimated_value'],
+        tiers={
+            'investor': lambda lead: lead['lead_category'] == 'Investor',
+            'property': lambda lead: lead['lead_category'] == 'Property'
+        }
+    ).consume(leads)
+    investor_leads = stats.tier_counts['investor']
+    property_leads = stats.tier_counts['property']
     
-    total_investor_value = len(investor_leads) * 200
-    total_property_value = sum(lead.get('estimated_value', 0) for lead in property_leads)
-    total_lead_value = len(investor_leads) * 200 + len(property_leads) * 250
+    total_investor_value = investor_leads * 200
+    total_property_value = stats.sums['estimated_value']
+    total_lead_value = investor_leads * 200 + property_leads * 250
     
     report = f"""
 🤖 LeadFlow AI - Complete Hunt Report
 {'='*60}
 
 📊 COMPREHENSIVE RESULTS:
-- Total Leads Generated: {len(leads)}
-- Investor Leads: {len(investor_leads)}
-- Property Leads: {len(property_leads)}
+- Total Leads Generated: {stats.count}
+- Investor Leads: {investor_leads}
+- Property Leads: {property_leads}
 
 💰 REVENUE POTENTIAL:
 - Investor Lead Value: ${total_investor_value:,} (@$200 each)
-- Property Lead Value: ${len(property_leads) * 250:,} (@$250 each)
+- Property Lead Value: ${property_leads * 250:,} (@$250 each)
 - Total Lead Market Value: ${total_lead_value:,}
 
 🏠 PROPERTY PORTFOLIO VALUE:
 - Total Property Value: ${total_property_value:,}
-- Average Property Value: ${total_property_value // max(len(property_leads), 1):,}
+- Average Property Value: ${total_property_value // max(property_leads, 1):,}
 
 🎯 NEXT STEPS:
 1. Contact investors with property opportunities
@@ -138,6 +234,7 @@ Generated by LeadFlow AI - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
     
     # Save comprehensive report
+    LeadFlowConfig.ensure_directories()
     report_path = LeadFlowConfig.get_output_path('report')
     with open(report_path, 'w') as f:
         f.write(report)
@@ -145,6 +242,146 @@ Generated by LeadFlow AI - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     print(report)
     print(f"\n📋 Comprehensive report saved to: {report_path}")
 
+def run_reprocess(args):
+    """Re-parse saved page snapshots across worker processes and merge leads into the lead store"""
+    print(f"\n♻️  Reprocessing page snapshots in {args.directory}...")
+    print("=" * 50)
+    
+    from src.extraction.parallel_parse import parse_snapshots
+    from src.extraction.snapshots import find_snapshots
+    from src.property_scanner.inheritance_finder import InheritancePropertyFinder
+    from src.storage.dedup_index import DedupIndex, investor_identity
+    from src.storage.sinks import SqliteSink
+    
+    paths = find_snapshots(args.directory)
+    if not paths:
+        print(f"❌ No page snapshots (.html, .html.gz) found in {args.directory}")
+        return {}
+    
+    finder = InheritancePropertyFinder()
+    dedup = None if args.no_dedup or not LeadFlowConfig.DEDUP_ENABLED else DedupIndex()
+    totals = {'pages': 0, 'errors': 0, 'investors': 0, 'obituaries': 0, 'properties': 0}
+    
+    with SqliteSink('investors', path=args.db) as investor_sink, \
+            SqliteSink('properties', store=investor_sink.store, run_id=investor_sink.run_id) as property_sink:
+        with PROFILER.stage('reprocess.parse_and_merge'):
+            for page in parse_snapshots(paths, args.workers, args.chunk_size, args.city):
+                totals['pages'] += 1
+                if page.get('error'):
+                    totals['errors'] += 1
+                    print(f"❌ Could not read {page['path']}: {page['error']}")
+                    continue
+                
+                records = page['records']
+                if page['kind'] == 'investors':
+                    if dedup is not None:
+                        records = dedup.filter_new(records, investor_identity)
+                    investor_sink.write_many(records)
+                    if dedup is not None:
+                        investor_sink.flush()
+                        dedup.add_many(investor_identity(investor) for investor in records)
+                    totals['investors'] += len(records)
+                else:
+                    totals['obituaries'] += len(records)
+                    totals['properties'] += finder.enrich_obituaries(records, page['city'], property_sink, dedup)
+    
+    if dedup is not None:
+        print(dedup.summary())
+        dedup.close()
+    for cache in finder.lookup_caches:
+        print(cache.summary())
+        cache.save()
+    
+    print(f"\n✅ Reprocessed {totals['pages']} pages ({totals['errors']} unreadable)")
+    print(f"   👥 {totals['investors']} investors and 🏠 {totals['properties']} properties "
+          f"(from {totals['obituaries']} obituaries) merged into {investor_sink.location}")
+    return totals
+
+def query_lead_store(args):
+    """Query leads already collected in the lead store"""
+    table = args.type
+    filters = {'city': args.city, 'min_score': args.min_score, 'since': args.since}
+    
+    with LeadStore(args.db) as store:
+        if args.export:
+            if (args.format or os.path.splitext(args.export)[1].lstrip('.').lower()) == 'xlsx':
+                written = export_xlsx(args.export, {table: store.iter_leads(table, **filters)})[SHEET_TITLES[table]]
+            else:
+                written = store.export_csv(table, args.export, **filters)
+            print(f"\n💾 Exported {written} {table} leads to {args.export}")
+            return written
+        
+        if args.export_normalized:
+            if table != 'properties':
+                print("❌ --export-normalized applies to properties only")
+                return None
+            from src.storage.normalized_export import export_normalized
+            exporter = export_normalized(store.iter_leads(table, **filters), args.export_normalized,
+                                         prefix='leadflow_inheritance')
+            print(f"\n🗂️  Exported {exporter.property_count} properties and {exporter.contact_count} heir contacts:")
+            for path in exporter.paths.values():
+                print(f"   {path}")
+            return exporter.property_count
+        
+        if args.by_city:
+            print(f"\n📊 Stored {table} leads by city:")
+            for city, leads in store.counts_by_city(table):
+                print(f"   {city}: {leads}")
+            return None
+        
+        if table == 'investors':
+            leads = store.find_investors(limit=args.limit, **filters)
+        else:
+            leads = store.find_properties(limit=args.limit, **filters)
+        total = store.count(table, **filters)
+    
+    print(f"\n📇 {total} stored {table} leads match (showing {len(leads)})")
+    for i, lead in enumerate(leads, 1):
+        if table == 'investors':
+            print(f"{i}. {lead['name']} (Score: {lead['quality_score']}) - {lead['title']} - {lead['location']}")
+        else:
+            print(f"{i}. {lead['address']} - ${lead['estimated_value']:,} "
+                  f"(Potential: {lead['property_potential_score']}) - Owner: {lead['owner_name']}")
+    
+    return leads
+
+def add_output_arguments(subparser):
+    """Options controlling where and how hunt results are written"""
+    subparser.add_argument('--sink', choices=SINK_FORMATS,
+                           help='Stream leads to this sink (default: lead store with CSV export)')
+    subparser.add_argument('--stream-only', action='store_true',
+                           help='Do not keep leads in memory; reports read them back from the sink')
+    subparser.add_argument('--no-dedup', action='store_true',
+                           help='Keep leads already exported by earlier runs')
+    subparser.add_argument('--resume', action='store_true',
+                           help='Resume an interrupted hunt from its checkpoint, skipping completed work')
+    subparser.add_argument('--format', choices=EXPORT_FORMATS,
+                           help='Run export file format (default: EXPORT_FORMAT, csv)')
+    subparser.add_argument('--profile', nargs='?', const='', metavar='JSON',
+                           help='Write a per-stage timing profile (default: data/profiles/profile_<mode>_<timestamp>.json)')
+    subparser.add_argument('--replay', metavar='DIR',
+                           help='Serve recorded pages from DIR instead of Chrome, with delays zeroed (default: REPLAY_DIR)')
+
+def start_replay(args):
+    """Switch a hunt to recorded pages (--replay or REPLAY_DIR) and zero its fixed delays"""
+    if getattr(args, 'replay', None):
+        LeadFlowConfig.REPLAY_DIR = args.replay
+    if not LeadFlowConfig.REPLAY_DIR:
+        return False
+    PROFILER.delay_scale = 0.0
+    print(f"📼 Replay mode: serving recorded pages from {LeadFlowConfig.REPLAY_DIR} (no browser, no delays)")
+    return True
+
+def save_run_profile(args):
+    """Write the --profile JSON and print the slowest stages"""
+    profile_path = args.profile or os.path.join(
+        LeadFlowConfig.DATA_DIR, 'profiles',
+        f"profile_{args.mode}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    PROFILER.save(profile_path)
+    print(f"\n{PROFILER.summary()}")
+    print(f"📋 Run profile saved to: {profile_path}")
+
 def main():
     """Main application entry point"""
     parser = argparse.ArgumentParser(
@@ -155,7 +392,14 @@ Examples:
   python main.py investors --cities 3 --max-investors 25
   python main.py properties --cities 2 --max-properties 15
   python main.py full --cities 5
+  python main.py full --resume
+  python main.py full --format xlsx
+  python main.py properties --profile
+  python main.py properties --days-back 7
+  python main.py full --cities 10 --replay benchmarks/fixtures --days-back 0 --profile
+  python main.py reprocess data/snapshots --workers 8
   python main.py demo
+  python main.py leads investors --city Miami --min-score 80
         """
     )
     
@@ -165,17 +409,49 @@ Examples:
     investor_parser = subparsers.add_parser('investors', help='Find real estate investors on LinkedIn')
     investor_parser.add_argument('--cities', type=int, default=3, help='Number of cities to search (default: 3)')
     investor_parser.add_argument('--max-investors', type=int, default=25, help='Max investors per city (default: 25)')
+    add_output_arguments(investor_parser)
     
     # Property hunt subcommand
     property_parser = subparsers.add_parser('properties', help='Find inheritance properties')
     property_parser.add_argument('--cities', type=int, default=3, help='Number of cities to search (default: 3)')
     property_parser.add_argument('--max-properties', type=int, default=12, help='Max properties per city (default: 12)')
+    property_parser.add_argument('--days-back', type=int,
+                                 help='Only obituaries from the last N days, 0 for all (default: OBITUARY_DAYS_BACK, 30)')
+    add_output_arguments(property_parser)
     
     # Full hunt subcommand
     full_parser = subparsers.add_parser('full', help='Run complete lead generation suite')
     full_parser.add_argument('--cities', type=int, default=3, help='Number of cities to search (default: 3)')
     full_parser.add_argument('--max-investors', type=int, default=20, help='Max investors per city (default: 20)')
     full_parser.add_argument('--max-properties', type=int, default=10, help='Max properties per city (default: 10)')
+    full_parser.add_argument('--days-back', type=int,
+                             help='Only obituaries from the last N days, 0 for all (default: OBITUARY_DAYS_BACK, 30)')
+    add_output_arguments(full_parser)
+    
+    # Lead store queries
+    leads_parser = subparsers.add_parser('leads', help='Query leads saved in the lead store')
+    leads_parser.add_argument('type', choices=['investors', 'properties'], help='Lead table to query')
+    leads_parser.add_argument('--city', help='Only leads for this city')
+    leads_parser.add_argument('--min-score', type=int, help='Minimum quality / potential score')
+    leads_parser.add_argument('--since', help='Only leads scraped at or after this ISO timestamp')
+    leads_parser.add_argument('--limit', type=int, default=25, help='Max leads to show (default: 25)')
+    leads_parser.add_argument('--export', metavar='FILE', help='Export matching leads to a CSV or .xlsx file')
+    leads_parser.add_argument('--format', choices=EXPORT_FORMATS, help='Export file format (default: from the file extension)')
+    leads_parser.add_argument('--export-normalized', metavar='DIR',
+                              help='Export properties and heir contacts as linked tables (CSV + contacts JSONL)')
+    leads_parser.add_argument('--by-city', action='store_true', help='Show lead counts per city')
+    leads_parser.add_argument('--db', help='Lead store path (default: LEAD_STORE_PATH)')
+    
+    # Offline reprocessing of saved pages
+    reprocess_parser = subparsers.add_parser('reprocess', help='Re-parse saved page snapshots into the lead store')
+    reprocess_parser.add_argument('directory', help='Directory of page snapshots (.html, .html.gz)')
+    reprocess_parser.add_argument('--workers', type=int, help='Parser processes (default: one per CPU core)')
+    reprocess_parser.add_argument('--chunk-size', type=int, help='Pages per worker task (default: 16)')
+    reprocess_parser.add_argument('--city', help='City for snapshots without metadata (default: Unknown)')
+    reprocess_parser.add_argument('--db', help='Lead store path (default: LEAD_STORE_PATH)')
+    reprocess_parser.add_argument('--no-dedup', action='store_true', help='Keep leads already exported by earlier runs')
+    reprocess_parser.add_argument('--profile', nargs='?', const='', metavar='JSON',
+                                  help='Write a per-stage timing profile')
     
     # Demo mode
     demo_parser = subparsers.add_parser('demo', help='Run demonstration with sample data')
@@ -190,12 +466,23 @@ Examples:
         return
     
     try:
+        if args.mode in ('investors', 'properties', 'full', 'reprocess'):
+            LeadFlowConfig.initialize()
+            if args.profile is not None:
+                PROFILER.enable()
+        if args.mode in ('investors', 'properties', 'full'):
+            start_replay(args)
+        
         if args.mode == 'investors':
             run_investor_hunt(args)
         elif args.mode == 'properties':
             run_property_hunt(args)
         elif args.mode == 'full':
             run_full_hunt(args)
+        elif args.mode == 'reprocess':
+            run_reprocess(args)
+        elif args.mode == 'leads':
+            query_lead_store(args)
         elif args.mode == 'demo':
             print("\n🎬 Demo Mode - Generating Sample Data...")
             print("In full version, this would generate live leads!")
@@ -212,6 +499,9 @@ Examples:
     except Exception as e:
         print(f"\n❌ Error during lead generation: {e}")
         print("Please check your configuration and try again.")
+    finally:
+        if PROFILER.enabled:
+            save_run_profile(args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
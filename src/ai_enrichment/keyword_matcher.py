@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Keyword Matcher
+Aho-Corasick automaton for one-scan title and location keyword matching
+"""
+
+
+class KeywordMatcher:
+    """Case-insensitive multi-keyword substring matcher
+
+    Keywords are compiled once into a deterministic automaton (goto and
+    failure transitions folded into one table), so finding every keyword in
+    a string is a single linear scan regardless of how many keywords exist.
+    Matching is equivalent to ``keyword.lower() in text.lower()`` per keyword.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._transitions = [{}]
+        self._outputs = [[]]
+        self._always = []  # Empty keywords match every string
+
+        for index, keyword in enumerate(self.keywords):
+            keyword = keyword.lower()
+            if not keyword:
+                self._always.append(index)
+                continue
+
+            node = 0
+            for char in keyword:
+                next_node = self._transitions[node].get(char)
+                if next_node is None:
+                    next_node = len(self._transitions)
+                    self._transitions.append({})
+                    self._outputs.append([])
+                    self._transitions[node][char] = next_node
+                node = next_node
+            self._outputs[node].append(index)
+
+        self._build()
+
+    def _build(self):
+        """Resolve failure links into direct transitions (breadth-first)"""
+        trie = [dict(transitions) for transitions in self._transitions]
+        fail = [0] * len(trie)
+        queue = list(trie[0].values())
+        head = 0
+
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in trie[node].items():
+                queue.append(child)
+                fallback = fail[node]
+                while fallback and char not in trie[fallback]:
+                    fallback = fail[fallback]
+                target = trie[fallback].get(char, 0)
+                fail[child] = target if target != child else 0
+                self._outputs[child] = self._outputs[child] + self._outputs[fail[child]]
+
+        # Fold failure transitions in so the scan never backtracks
+        root = self._transitions[0]
+        for node in queue:
+            inherited = self._transitions[fail[node]] if fail[node] else root
+            transitions = self._transitions[node]
+            for char, target in inherited.items():
+                transitions.setdefault(char, target)
+
+    def find_indices(self, text):
+        """Indices of every keyword contained in text (each at most once)"""
+        found = set(self._always)
+        transitions = self._transitions
+        outputs = self._outputs
+        node = 0
+
+        for char in text.lower():
+            node = transitions[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+
+        return found
+
+    def find_all(self, text):
+        """Keywords contained in text, in keyword-list order"""
+        return [self.keywords[index] for index in sorted(self.find_indices(text))]
+
+    def count(self, text):
+        """Number of keyword-list entries contained in text"""
+        return len(self.find_indices(text))
+
+    def contains_any(self, text):
+        """True as soon as any keyword is found in text"""
+        if self._always:
+            return True
+
+        transitions = self._transitions
+        outputs = self._outputs
+        node = 0
+
+        for char in text.lower():
+            node = transitions[node].get(char, 0)
+            if outputs[node]:
+                return True
+
+        return False
+
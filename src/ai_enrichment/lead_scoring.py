@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Lead Scoring Rules
+Per-lead AI quality scoring shared by the scrapers and batch re-scoring
+"""
+
+# Rules live in LeadFlowConfig.SCORING_WEIGHTS, compiled by scoring_model
+from src.ai_enrichment.scoring_model import scoring_model
+
+
+def investor_quality_score(title, location, search_term):
+    """AI-powered quality scoring for investor leads"""
+    return scoring_model().investor_score(title, location, search_term)
+
+
+def age_points(age_num):
+    """Points awarded for the deceased's age"""
+    return scoring_model().age_points(age_num)
+
+
+def property_potential_score(name, age, address_hints, city):
+    """AI scoring for property inheritance potential"""
+    return scoring_model().property_score(name, age, address_hints, city)
+
+
+def property_rank(lead):
+    """Report ranking of an enriched property: urgency + value + potential"""
+    return scoring_model().property_rank(lead)
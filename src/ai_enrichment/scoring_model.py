@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Compiled Scoring Model
+LeadFlowConfig.SCORING_WEIGHTS compiled once into lookup tables and closures
+"""
+
+import copy
+import json
+import os
+from functools import lru_cache
+
+from config.settings import LeadFlowConfig
+from src.ai_enrichment.keyword_matcher import KeywordMatcher
+from src.extraction.gazetteer import location_metros, normalize_location
+
+
+def scoring_spec(path=None):
+    """Full declarative spec: SCORING_WEIGHTS plus the keyword lists it scores
+
+    Keyword lists come from TITLE_SCORING_KEYWORDS, PREMIUM_LOCATIONS and
+    HIGH_VALUE_CITIES. A JSON file at `path` (SCORING_SPEC_PATH by default)
+    may override any key, sections merged one level deep.
+    """
+    spec = copy.deepcopy(LeadFlowConfig.SCORING_WEIGHTS)
+    spec['investor'].setdefault('title_keywords', list(LeadFlowConfig.TITLE_SCORING_KEYWORDS))
+    spec['investor'].setdefault('premium_locations', list(LeadFlowConfig.PREMIUM_LOCATIONS))
+    spec['property'].setdefault('high_value_cities', list(LeadFlowConfig.HIGH_VALUE_CITIES))
+
+    path = LeadFlowConfig.SCORING_SPEC_PATH if path is None else path
+    if path:
+        with open(path, encoding='utf-8') as f:
+            overrides = json.load(f)
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(spec.get(key), dict):
+                spec[key].update(value)
+            else:
+                spec[key] = value
+    return spec
+
+
+class ScoringModel:
+    """A scoring spec compiled into callables
+
+    Keyword lists become automatons, location and city lists sets of
+    gazetteer metro ids and age brackets a table indexed by age, so the
+    per-lead closures (investor_score, property_score, property_rank) do
+    no setup work.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.max_score = spec['max_score']
+        investor, prop, rank = spec['investor'], spec['property'], spec['property_rank']
+
+        self.title_matcher = KeywordMatcher(investor['title_keywords'])
+        self.premium_metros, other_locations = _resolve_metros(investor['premium_locations'])
+        self.high_value_metros, other_cities = _resolve_metros(prop['high_value_cities'])
+        # Names the gazetteer does not know keep the old text matching
+        self.location_matcher = KeywordMatcher(other_locations)
+        self.high_value_cities = frozenset(city.lower() for city in other_cities)
+        self.is_premium_location = self._compile_premium_location()
+        self.is_high_value_city = self._compile_high_value_city()
+        self.age_brackets = self._compile_age_brackets(prop['age_brackets'])
+        self.age_table = self._build_age_table(self.age_brackets)
+
+        self.investor_score = self._compile_investor_score(investor)
+        self.property_score = self._compile_property_score(prop)
+        self.property_rank = self._compile_property_rank(rank)
+
+    @staticmethod
+    def _compile_age_brackets(brackets):
+        compiled = sorted(((int(minimum_age), int(points)) for minimum_age, points in brackets),
+                          reverse=True)
+        if any(minimum_age < 0 for minimum_age, _ in compiled):
+            raise ValueError("Age bracket minimums must not be negative")
+        return tuple(compiled)  # Highest minimum first, as age_points() expects
+
+    @staticmethod
+    def _build_age_table(brackets):
+        top_age = brackets[0][0] if brackets else 0
+        table = [0] * (top_age + 1)
+        for age in range(top_age + 1):
+            for minimum_age, points in brackets:
+                if age >= minimum_age:
+                    table[age] = points
+                    break
+        return table
+
+    def age_points(self, age_num):
+        """Points awarded for the deceased's age"""
+        if age_num is None or age_num < 0:
+            return 0
+        table = self.age_table
+        return table[age_num] if age_num < len(table) else table[-1]
+
+    def _compile_premium_location(self):
+        premium_metros = self.premium_metros
+        other_matcher = self.location_matcher if self.location_matcher.keywords else None
+
+        def is_premium_location(location):
+            # Every metro the location names counts ("Dallas / New York")
+            if any(metro_id in premium_metros for metro_id in location_metros(location)):
+                return True
+            return other_matcher is not None and other_matcher.contains_any(location)
+
+        return is_premium_location
+
+    def _compile_high_value_city(self):
+        high_value_metros = self.high_value_metros
+        other_cities = self.high_value_cities
+
+        def is_high_value_city(city):
+            return normalize_location(city) in high_value_metros or city.lower() in other_cities
+
+        return is_high_value_city
+
+    def _compile_investor_score(self, rules):
+        base = rules['base']
+        keyword_points = rules['title_keyword']
+        location_points = rules['premium_location']
+        relevance_points = rules['search_relevance']
+        max_score = self.max_score
+        count_keywords = self.title_matcher.count
+        is_premium = self.is_premium_location
+
+        @lru_cache(maxsize=4096)
+        def compact(text):
+            return text.lower().replace(' ', '')
+
+        def investor_score(title, location, search_term):
+            score = base + count_keywords(title) * keyword_points
+            if is_premium(location):
+                score += location_points
+            if compact(search_term) in compact(title):
+                score += relevance_points
+            return min(score, max_score)
+
+        return investor_score
+
+    def _compile_property_score(self, rules):
+        base = rules['base']
+        hint_points = rules['address_hints']
+        multiple_points = rules['multiple_addresses']
+        multiple_length = rules['multiple_address_length']
+        city_points = rules['high_value_city']
+        max_score = self.max_score
+        age_points = self.age_points
+        is_high_value_city = self.is_high_value_city
+
+        @lru_cache(maxsize=1024)
+        def age_bonus(age):
+            return age_points(parse_age(age))
+
+        @lru_cache(maxsize=1024)
+        def city_bonus(city):
+            return city_points if is_high_value_city(city) else 0
+
+        def property_score(name, age, address_hints, city):
+            score = base + age_bonus(age) + city_bonus(city)
+            if address_hints:
+                score += hint_points
+                if len(address_hints) > multiple_length:  # Multiple addresses
+                    score += multiple_points
+            return min(score, max_score)
+
+        return property_score
+
+    @staticmethod
+    def _compile_property_rank(weights):
+        urgency = weights['urgency']
+        value = weights['value']
+        value_unit = weights['value_unit']
+        potential = weights['potential']
+
+        def property_rank(lead):
+            return (lead['urgency_score'] * urgency +
+                    (lead['estimated_value'] / value_unit) * value +
+                    lead['property_potential_score'] * potential)
+
+        return property_rank
+
+
+def _resolve_metros(names):
+    """Split location names into gazetteer metro ids and names it does not know"""
+    metros, unknown = set(), []
+    for name in names:
+        metro_id = normalize_location(name)
+        if metro_id:
+            metros.add(metro_id)
+        else:
+            unknown.append(name)
+    return frozenset(metros), unknown
+
+
+def parse_age(age):
+    """Convert an extracted age to an int, or None when it is not a number"""
+    try:
+        return int(age) if age != "N/A" else 0
+    except Exception:
+        return None
+
+
+_model = None
+_source = None
+
+
+def _spec_source():
+    """What the compiled model depends on, cheap enough to check per run"""
+    path = LeadFlowConfig.SCORING_SPEC_PATH
+    try:
+        mtime = os.path.getmtime(path) if path else None
+    except OSError:
+        mtime = None
+    settings = json.dumps([LeadFlowConfig.SCORING_WEIGHTS, LeadFlowConfig.TITLE_SCORING_KEYWORDS,
+                           LeadFlowConfig.PREMIUM_LOCATIONS, LeadFlowConfig.HIGH_VALUE_CITIES],
+                          sort_keys=True, default=str)
+    return path, mtime, settings
+
+
+def scoring_model():
+    """The current compiled model (compiled on first use)"""
+    if _model is None:
+        reload_scoring_model()
+    return _model
+
+
+def reload_scoring_model(force=False):
+    """Recompile if the spec file or scoring settings changed since the last compile
+
+    Called at the start of each run, so edits to SCORING_SPEC_PATH take
+    effect on the next hunt without restarting. A spec that fails to load
+    keeps the previous model.
+    """
+    global _model, _source
+    source = _spec_source()
+    if _model is not None and source == _source and not force:
+        return _model
+
+    try:
+        model = ScoringModel(scoring_spec())
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        if _model is None:
+            raise
+        print(f"⚠️ Scoring spec not reloaded, keeping the current model: {e}")
+        _source = source
+        return _model
+
+    if _model is not None:
+        print("🔁 Scoring model reloaded")
+    _model, _source = model, source
+    return _model
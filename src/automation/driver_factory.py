@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Chrome Driver Factory
+Cached chromedriver resolution and shareable browser sessions
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime
+
+from config.settings import LeadFlowConfig
+
+# Hides navigator.webdriver from the pages we visit
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+BROWSER_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+]
+WINDOWS_VERSION_QUERY = ['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version']
+
+_VERSION = re.compile(r'(\d+)\.\d+(?:\.\d+){0,2}')
+
+
+def _command_version(command):
+    """Version string printed by a command, or None"""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION.search(output)
+    return match.group() if match else None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+def installed_browser_version():
+    """Version of the locally installed Chrome/Chromium, or None if not found"""
+    if os.name == 'nt':
+        return _command_version(WINDOWS_VERSION_QUERY)
+    for binary in BROWSER_BINARIES:
+        path = shutil.which(binary) or (binary if os.path.isabs(binary) and os.path.exists(binary) else None)
+        if path:
+            version = _command_version([path, '--version'])
+            if version:
+                return version
+    return None
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_is_valid(entry, browser_version):
+    """Cached driver still exists and matches the installed browser's major version"""
+    if not entry or not os.path.isfile(entry.get('path', '')):
+        return False
+    if browser_version and _major(entry.get('browser_version')) != _major(browser_version):
+        return False
+    if browser_version and entry.get('driver_version') and _major(entry['driver_version']) != _major(browser_version):
+        return False
+    return True
+
+
+def resolve_chromedriver(cache_path=None, force=False):
+    """Path to a chromedriver matching the installed browser
+
+    The path resolved by webdriver_manager is cached on disk together with
+    the browser and driver versions; later runs reuse it without a network
+    round trip until Chrome is upgraded to a new major version.
+    """
+    cache_path = cache_path or LeadFlowConfig.DRIVER_CACHE_PATH
+    browser_version = installed_browser_version()
+
+    entry = None if force else _load_cache(cache_path)
+    if _cache_is_valid(entry, browser_version):
+        return entry['path']
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    entry = {
+        'path': path,
+        'browser_version': browser_version,
+        'driver_version': _command_version([path, '--version']),
+        'resolved_at': datetime.now().isoformat()
+    }
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f, indent=2)
+    return path
+
+
+def build_chrome_options(user_agent=None):
+    """Chrome options with anti-detection settings and a randomized user agent"""
+    from selenium.webdriver.chrome.options import Options
+
+    if user_agent is None:
+        from fake_useragent import UserAgent
+        user_agent = UserAgent().random
+
+    chrome_options = Options()
+    chrome_options.add_argument(f"--user-agent={user_agent}")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    return chrome_options
+
+
+def create_driver(chrome_options=None):
+    """Start Chrome with the cached chromedriver and stealth settings
+
+    With REPLAY_DIR set, a ReplayDriver serving the recorded pages in that
+    directory is returned instead and no browser is started.
+    """
+    if LeadFlowConfig.REPLAY_DIR:
+        from src.automation.replay_driver import ReplayDriver
+        return ReplayDriver(LeadFlowConfig.REPLAY_DIR)
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    service = Service(resolve_chromedriver())
+    driver = webdriver.Chrome(service=service, options=chrome_options or build_chrome_options())
+    driver.execute_script(STEALTH_SCRIPT)
+    return driver
+
+
+class BrowserSession:
+    """One browser shared by several hunts (e.g. both phases of a full hunt)
+
+    Scrapers given `session.driver` reuse it instead of starting their own
+    Chrome, and leave quitting it to the session.
+    """
+
+    def __init__(self, chrome_options=None):
+        self.chrome_options = chrome_options
+        self.driver = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Launch the browser, returning the driver (None if it failed)"""
+        if self.driver is None:
+            try:
+                self.driver = create_driver(self.chrome_options)
+            except Exception as e:
+                print(f"❌ Driver setup error: {e}")
+        return self.driver
+
+    def close(self):
+        """Quit the shared browser"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
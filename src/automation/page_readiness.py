@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Page Readiness
+Condition-based waits on search results instead of fixed sleeps
+"""
+
+import time
+
+from config.settings import LeadFlowConfig
+from src.instrumentation.profiler import PROFILER, pause
+
+CSS_SELECTOR = 'css selector'  # selenium's By.CSS_SELECTOR, without importing selenium
+
+
+class PageReadiness:
+    """Polls the driver until result containers are present and their count settles
+
+    A page is ready once at least one container matches and the count has
+    not changed for `stable_for` seconds. A page that has finished loading
+    with no containers at all is given up on after `empty_grace` seconds,
+    and nothing waits longer than `timeout`. Waits after a scroll are capped
+    at `scroll_timeout`, close to the fixed sleeps they replace.
+
+    Elapsed time is the sum of the poll intervals plus the time spent in
+    the driver, so a stand-in driver with delays zeroed never spins.
+    """
+
+    def __init__(self, driver, timeout=None, stable_for=None, poll=None, empty_grace=None,
+                 scroll_timeout=None):
+        self.driver = driver
+        self.timeout = LeadFlowConfig.PAGE_WAIT_TIMEOUT if timeout is None else timeout
+        self.scroll_timeout = (LeadFlowConfig.PAGE_SCROLL_TIMEOUT if scroll_timeout is None
+                               else scroll_timeout)
+        self.stable_for = LeadFlowConfig.PAGE_STABLE_SECONDS if stable_for is None else stable_for
+        self.poll = LeadFlowConfig.PAGE_POLL_SECONDS if poll is None else poll
+        self.empty_grace = LeadFlowConfig.PAGE_EMPTY_GRACE if empty_grace is None else empty_grace
+
+    def _count(self, selector):
+        try:
+            return len(self.driver.find_elements(CSS_SELECTOR, selector))
+        except Exception:
+            return 0
+
+    def _loaded(self):
+        try:
+            return self.driver.execute_script("return document.readyState") == 'complete'
+        except Exception:
+            return False
+
+    def wait_for_results(self, selector, min_count=0, replaces=0.0, timeout=None):
+        """Wait until more than `min_count` containers match and the count is stable
+
+        Returns the final container count. `replaces` is the fixed delay
+        this wait stands in for; the difference is credited to the run
+        profile as time saved. `timeout` overrides the first-load timeout,
+        e.g. with `scroll_timeout` for waits after a scroll.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        elapsed = 0.0
+        count = self._count(selector)
+        stable_since = 0.0
+        timed_out = True
+
+        with PROFILER.stage('page.wait'):
+            while elapsed < timeout:
+                pause(self.poll)
+                start = time.perf_counter()
+                current = self._count(selector)
+                elapsed += self.poll + (time.perf_counter() - start)
+
+                if current != count:
+                    count, stable_since = current, elapsed
+                    continue
+                settled = elapsed - stable_since >= self.stable_for
+                if count > min_count and settled:
+                    timed_out = False
+                    break
+                grace = self.empty_grace if min_count == 0 else 0.0
+                if count <= min_count and settled and elapsed >= grace and self._loaded():
+                    # Fully loaded and nothing (more) is arriving
+                    timed_out = False
+                    break
+
+        PROFILER.count('page_waits')
+        if timed_out:
+            PROFILER.count('page_wait_timeouts')
+        PROFILER.credit('page_wait', replaces - elapsed)
+        return count
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Replay Driver
+Offline browser stand-in serving recorded pages from disk
+"""
+
+import itertools
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from src.extraction.page_extractor import parse_page, select, visible_text
+from src.extraction.snapshots import find_snapshots, load_snapshot, snapshot_kind
+
+CSS_SELECTOR = 'css selector'
+XPATH = 'xpath'
+BLANK_PAGE = '<html><head></head><body></body></html>'
+
+
+class NoSuchElement(LookupError):
+    """find_element() matched nothing (selenium's NoSuchElementException)"""
+
+
+def _find_all(root, by, value):
+    if by == CSS_SELECTOR:
+        return select(root, value)
+    if by == XPATH:
+        return [node for node in etree.XPath(value)(root) if isinstance(node, etree._Element)]
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+class ReplayElement:
+    """The parts of a WebElement the scrapers use, over an lxml element"""
+
+    def __init__(self, element, driver):
+        self._element = element
+        self._driver = driver
+
+    @property
+    def text(self):
+        return visible_text(self._element)
+
+    @property
+    def tag_name(self):
+        return self._element.tag
+
+    def get_attribute(self, name):
+        value = self._element.get(name)
+        if value is not None and name in ('href', 'src'):
+            value = urljoin(self._driver.current_url, value)  # Resolved like a live DOM
+        return value
+
+    def find_elements(self, by=CSS_SELECTOR, value=None):
+        return [ReplayElement(node, self._driver) for node in _find_all(self._element, by, value)]
+
+    def find_element(self, by=CSS_SELECTOR, value=None):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElement(f"No element matches {by}={value!r}")
+        return found[0]
+
+
+class ReplayDriver:
+    """Serves recorded pages for get() instead of loading them in Chrome
+
+    Pages come from a directory of snapshots (SNAPSHOT_DIR, a page cache
+    directory or plain .html files). A URL that was recorded gets its own
+    page; any other URL gets the recorded pages of the same kind (LinkedIn
+    results or obituaries) in turn, so a few fixtures can stand in for a
+    hunt over every target city. Pages are fully loaded as soon as get()
+    returns and never change while they are open.
+    """
+
+    offline = True  # No one to log in: scrapers skip their interactive prompts
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.pages_by_url = {}
+        pages_by_kind = {}
+        for path in find_snapshots(directory):
+            snapshot = load_snapshot(path)
+            if snapshot['url']:
+                self.pages_by_url.setdefault(snapshot['url'], snapshot['html'])
+            pages_by_kind.setdefault(snapshot['kind'], []).append(snapshot['html'])
+        if not pages_by_kind:
+            raise ValueError(f"No recorded pages (.html, .html.gz) found in {directory}")
+        self._rotation = {kind: itertools.cycle(pages) for kind, pages in pages_by_kind.items()}
+
+        self.current_url = 'about:blank'
+        self.page_source = BLANK_PAGE
+        self.requests = 0
+        self._root = None
+
+    def _recorded_page(self, url):
+        if url in self.pages_by_url:
+            return self.pages_by_url[url]
+        rotation = self._rotation.get(snapshot_kind(url, ''))
+        return next(rotation) if rotation else BLANK_PAGE
+
+    def get(self, url):
+        self.requests += 1
+        self.current_url = url
+        self.page_source = self._recorded_page(url)
+        self._root = None
+
+    @property
+    def title(self):
+        titles = _find_all(self._tree(), XPATH, '//title')
+        return visible_text(titles[0]) if titles else ''
+
+    def _tree(self):
+        if self._root is None:
+            self._root = parse_page(self.page_source)  # Parsed once per page, however often it is queried
+        return self._root
+
+    def find_elements(self, by=CSS_SELECTOR, value=None):
+        return [ReplayElement(node, self) for node in _find_all(self._tree(), by, value)]
+
+    def find_element(self, by=CSS_SELECTOR, value=None):
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElement(f"No element matches {by}={value!r}")
+        return found[0]
+
+    def execute_script(self, script, *args):
+        if 'readyState' in script:
+            return 'complete'
+        return None  # Scrolling and stealth patches have nothing to do offline
+
+    def quit(self):
+        self._root = None
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Location Gazetteer
+Offline metro table with a prefix trie over city and metro aliases
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from config.settings import LeadFlowConfig
+from src.extraction.text_normalize import normalize_text
+
+Metro = namedtuple('Metro', ['id', 'name', 'state'])
+
+# (metro id, display name, state, aliases, qualified aliases); the display
+# name is always an alias. Qualified aliases are place names shared with
+# towns elsewhere, so they only count when the same location also names the
+# metro's state or another of its aliases ("Bellevue, WA", not "Bellevue, Nebraska")
+METROS = (
+    ('new-york', 'New York', 'NY', ('new york city', 'nyc', 'bronx', 'staten island', 'jersey city'),
+     ('manhattan', 'brooklyn', 'queens')),
+    ('los-angeles', 'Los Angeles', 'CA', ('greater los angeles', 'santa monica'),
+     ('long beach', 'pasadena', 'hollywood')),
+    ('chicago', 'Chicago', 'IL', ('chicagoland',), ('evanston',)),
+    ('houston', 'Houston', 'TX', ('the woodlands', 'sugar land'), ()),
+    ('phoenix', 'Phoenix', 'AZ', ('scottsdale', 'tempe'), ('mesa', 'chandler')),
+    ('philadelphia', 'Philadelphia', 'PA', ('philly',), ()),
+    ('san-antonio', 'San Antonio', 'TX', (), ()),
+    ('san-diego', 'San Diego', 'CA', ('la jolla',), ()),
+    ('dallas', 'Dallas', 'TX', ('dfw',), ('plano', 'irving', 'frisco')),
+    ('fort-worth', 'Fort Worth', 'TX', ('ft worth',), ('arlington',)),
+    ('san-jose', 'San Jose', 'CA', ('silicon valley',), ()),
+    ('austin', 'Austin', 'TX', ('round rock',), ()),
+    ('jacksonville', 'Jacksonville', 'FL', (), ()),
+    ('columbus', 'Columbus', 'OH', (), ()),
+    ('charlotte', 'Charlotte', 'NC', (), ()),
+    ('san-francisco', 'San Francisco', 'CA', ('sf', 'bay area'), ('oakland',)),
+    ('indianapolis', 'Indianapolis', 'IN', (), ('indy',)),
+    ('seattle', 'Seattle', 'WA', ('tacoma',), ('bellevue',)),
+    ('denver', 'Denver', 'CO', ('boulder',), ('aurora',)),
+    ('boston', 'Boston', 'MA', (), ('cambridge',)),
+    ('miami', 'Miami', 'FL', ('miami beach', 'miami dade', 'miamidade', 'fort lauderdale',
+                              'ft lauderdale', 'south florida'), ()),
+    ('atlanta', 'Atlanta', 'GA', ('atl',), ('marietta',)),
+    ('orlando', 'Orlando', 'FL', ('kissimmee',), ()),
+    ('tampa', 'Tampa', 'FL', ('tampa bay', 'clearwater'), ('st petersburg',)),
+    ('las-vegas', 'Las Vegas', 'NV', ('vegas',), ('henderson',)),
+    ('nashville', 'Nashville', 'TN', (), ()),
+    ('memphis', 'Memphis', 'TN', (), ()),
+    ('el-paso', 'El Paso', 'TX', (), ()),
+    ('raleigh', 'Raleigh', 'NC', ('research triangle',), ('durham',)),
+    ('virginia-beach', 'Virginia Beach', 'VA', ('hampton roads',), ('norfolk',)),
+    ('oklahoma-city', 'Oklahoma City', 'OK', ('okc',), ()),
+    ('louisville', 'Louisville', 'KY', (), ()),
+    ('milwaukee', 'Milwaukee', 'WI', (), ()),
+)
+
+# Full names of the metro states, which qualify an alias like the abbreviation does
+STATE_NAMES = {
+    'AZ': 'arizona', 'CA': 'california', 'CO': 'colorado', 'FL': 'florida', 'GA': 'georgia',
+    'IL': 'illinois', 'IN': 'indiana', 'KY': 'kentucky', 'MA': 'massachusetts', 'NC': 'north carolina',
+    'NV': 'nevada', 'NY': 'new york', 'OH': 'ohio', 'OK': 'oklahoma', 'PA': 'pennsylvania',
+    'TN': 'tennessee', 'TX': 'texas', 'VA': 'virginia', 'WA': 'washington', 'WI': 'wisconsin'
+}
+
+class LocationTrie:
+    """Character trie over folded aliases, matched on word boundaries
+
+    matches() walks the trie once from each word start and keeps the longest
+    alias that ends on a word boundary, so "Greater Fort Worth Area" finds
+    'fort worth' and "Dallas-Fort Worth Metroplex" finds 'dallas' first.
+    """
+
+    def __init__(self):
+        self._children = [{}]
+        self._values = [None]
+
+    def add(self, alias, value):
+        node = 0
+        for char in normalize_text(alias):
+            next_node = self._children[node].get(char)
+            if next_node is None:
+                next_node = len(self._children)
+                self._children.append({})
+                self._values.append(None)
+                self._children[node][char] = next_node
+            node = next_node
+        if node:
+            self._values[node] = value
+
+    def matches(self, text):
+        """(start, end, value) of every alias in `text`, left to right
+
+        Each hit is the longest alias starting at a word; the scan resumes
+        after it, so hits never overlap. Spans index normalize_text(text).
+        """
+        text = normalize_text(text)
+        children, values = self._children, self._values
+        length = len(text)
+        start = 0
+        while start < length:
+            node, found, end = 0, None, start
+            for position in range(start, length):
+                node = children[node].get(text[position])
+                if node is None:
+                    break
+                if values[node] is not None and (position + 1 == length or text[position + 1] == ' '):
+                    found, end = values[node], position + 1
+            if found is not None:
+                yield start, end, found
+            else:
+                end = text.find(' ', start)
+                if end < 0:
+                    break
+            start = end + 1
+
+    def complete(self, prefix):
+        """Every value whose alias starts with `prefix`"""
+        node = 0
+        for char in normalize_text(prefix):
+            node = self._children[node].get(char)
+            if node is None:
+                return set()
+        found, stack = set(), [node]
+        while stack:
+            node = stack.pop()
+            if self._values[node] is not None:
+                found.add(self._values[node])
+            stack.extend(self._children[node].values())
+        return found
+
+
+def _build_index():
+    # Trie values are (metro id, qualified)
+    metros, trie = {}, LocationTrie()
+    for metro_id, name, state, aliases, qualified_aliases in METROS:
+        metros[metro_id] = Metro(metro_id, name, state)
+        for alias in (name, metro_id.replace('-', ' ')) + aliases:
+            trie.add(alias, (metro_id, False))
+        for alias in qualified_aliases:
+            trie.add(alias, (metro_id, True))
+    return metros, trie
+
+
+_METROS, _TRIE = _build_index()
+
+
+def _names_state(text, state):
+    padded = f" {text} "
+    return f" {state.lower()} " in padded or f" {STATE_NAMES[state]} " in padded
+
+
+@lru_cache(maxsize=8192)
+def location_metros(text):
+    """Metro ids named in a free-text location, in order of appearance
+
+    "Dallas / New York" gives ('dallas', 'new-york'). A qualified alias
+    only counts when its state follows it (before the next place named)
+    or the text names another alias of the metro, so "Queens, NY" gives
+    ('new-york',) and "Queens Creek, AZ" gives (). Memoized like
+    normalize_location.
+    """
+    if not text:
+        return ()
+    hits = list(_TRIE.matches(text))
+    named = {metro_id for _, _, (metro_id, qualified) in hits if not qualified}
+    folded = normalize_text(text)
+    found = []
+    for index, (start, end, (metro_id, qualified)) in enumerate(hits):
+        if qualified and metro_id not in named:
+            # The state has to follow the alias, before the next place named
+            next_start = hits[index + 1][0] if index + 1 < len(hits) else len(folded)
+            if not _names_state(folded[end:next_start].strip(), _METROS[metro_id].state):
+                continue
+        if metro_id not in found:
+            found.append(metro_id)
+    return tuple(found)
+
+
+@lru_cache(maxsize=8192)
+def normalize_location(text):
+    """Canonical metro id for a free-text location or city, or None if unknown
+
+    "Miami, Florida, United States", "Greater Miami Area" and "miami"
+    all give 'miami'; a location naming several metros gives the first.
+    Scraped locations repeat heavily, so results are memoized.
+    """
+    metro_ids = location_metros(text)
+    return metro_ids[0] if metro_ids else None
+
+
+def metro(metro_id):
+    """Metro record for an id, or None"""
+    return _METROS.get(metro_id)
+
+
+def canonical_city(text):
+    """Display name of the metro `text` refers to, or None"""
+    metro_id = normalize_location(text)
+    return _METROS[metro_id].name if metro_id else None
+
+
+def metros_with_prefix(prefix):
+    """Metro ids with an alias starting with `prefix` (for city prompts)"""
+    return sorted({metro_id for metro_id, _ in _TRIE.complete(prefix)})
+
+
+def lead_metro(lead):
+    """Metro id a lead belongs to: investor location, then target city, then city"""
+    for field in ('location', 'target_city', 'city'):
+        metro_id = normalize_location(lead.get(field))
+        if metro_id:
+            return metro_id
+    return None
+
+
+def metro_name(metro_id, default='Other'):
+    """Display name for a metro id (for report grouping)"""
+    return _METROS[metro_id].name if metro_id in _METROS else default
+
+
+def target_cities(cities=None):
+    """Target city display names (LeadFlowConfig.TARGET_CITIES by default)
+
+    Entries are resolved through the gazetteer, so aliases collapse into
+    one metro; names the gazetteer does not know are kept as written.
+    """
+    names, seen = [], set()
+    for city in LeadFlowConfig.TARGET_CITIES if cities is None else cities:
+        metro_id = normalize_location(city)
+        key = metro_id or normalize_text(city)
+        if key not in seen:
+            seen.add(key)
+            names.append(_METROS[metro_id].name if metro_id else city)
+    return names
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Page Cache
+Compressed on-disk cache of search-result pages keyed by URL, expiring after a TTL
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from config.settings import LeadFlowConfig
+from src.extraction.snapshots import find_snapshots, load_snapshot, save_snapshot, snapshot_meta_path
+from src.instrumentation.profiler import PROFILER
+
+
+def page_key(url):
+    """Cache key for a URL (freshness is the TTL's job, so any PAGE_CACHE_TTL works)"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=10).hexdigest()
+
+
+class PageCache:
+    """Page sources stored as snapshot files, with a TTL and a size-bounded LRU
+
+    Entries are ordinary page snapshots (<kind>_<key>.html.gz plus a
+    .meta.json sidecar), so a cache directory can also be fed to
+    `main.py reprocess`. A hit refreshes the entry's mtime; when the
+    directory grows past `max_bytes` the least recently used pages go first.
+    """
+
+    def __init__(self, directory=None, ttl=None, max_bytes=None):
+        self.directory = directory or LeadFlowConfig.PAGE_CACHE_DIR
+        self.ttl = LeadFlowConfig.PAGE_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = max_bytes or LeadFlowConfig.PAGE_CACHE_MAX_MB * 1024 * 1024
+        self.entries = OrderedDict()  # page path -> bytes on disk, least recently used first
+        self.total_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evicted': 0}
+        self._scan()
+
+    def _scan(self):
+        if not os.path.isdir(self.directory):
+            return
+        found = []
+        for path in find_snapshots(self.directory):
+            try:
+                found.append((os.path.getmtime(path), path, self._entry_size(path)))
+            except OSError:
+                continue
+        for _, path, size in sorted(found):
+            self.entries[path] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def _entry_size(path):
+        meta_path = snapshot_meta_path(path)
+        size = os.path.getsize(path)
+        return size + (os.path.getsize(meta_path) if os.path.exists(meta_path) else 0)
+
+    def _path(self, url, kind):
+        return os.path.join(self.directory, f"{kind}_{page_key(url)}.html.gz")
+
+    def _remove(self, path):
+        self.total_bytes -= self.entries.pop(path, 0)
+        for file_path in (path, snapshot_meta_path(path)):
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+    def get(self, url, kind):
+        """Cached snapshot (html, url, saved_at, ...) for `url` captured within the TTL, or None"""
+        path = self._path(url, kind)
+        snapshot = None
+        if path in self.entries:
+            try:
+                snapshot = load_snapshot(path)
+            except (OSError, ValueError, EOFError):
+                self._remove(path)  # Truncated by an interrupted write
+        if snapshot is not None:
+            saved_at = snapshot['saved_at']
+            age = time.time() - datetime.fromisoformat(saved_at).timestamp() if saved_at else None
+            if age is None or age >= self.ttl:
+                self._remove(path)
+                self.stats['expired'] += 1
+                snapshot = None
+        if snapshot is None:
+            self.stats['misses'] += 1
+            PROFILER.count('page_cache_misses')
+            return None
+
+        os.utime(path)
+        self.entries.move_to_end(path)
+        self.stats['hits'] += 1
+        PROFILER.count('page_cache_hits')
+        return snapshot
+
+    def put(self, url, html, kind, city, search_term=None, page_url=None):
+        """Store the latest capture of `url`, evicting least recently used pages over the size limit
+
+        `page_url` is where the browser ended up (recorded for resolving
+        relative links); the entry stays keyed on the requested `url`.
+        """
+        path = save_snapshot(self.directory, html, page_url or url, kind, city, search_term,
+                             digest=page_key(url))
+        self.total_bytes -= self.entries.pop(path, 0)
+        self.entries[path] = self._entry_size(path)
+        self.total_bytes += self.entries[path]
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            self._remove(next(iter(self.entries)))
+            self.stats['evicted'] += 1
+        return path
+
+    def __len__(self):
+        return len(self.entries)
+
+    def summary(self):
+        """One-line description of this run's cache activity"""
+        loads = self.stats['hits'] + self.stats['misses']
+        rate = 100 * self.stats['hits'] / loads if loads else 0
+        return (f"🗃️  page cache: {self.stats['hits']} hits, {self.stats['misses']} misses "
+                f"({rate:.0f}% hit rate, {self.stats['expired']} expired, {self.stats['evicted']} evicted, "
+                f"{self.total_bytes / 1024 / 1024:.1f} MiB)")
+
+
+def open_page_cache():
+    """PageCache per config, or None when PAGE_CACHE_ENABLED is off"""
+    return PageCache() if LeadFlowConfig.PAGE_CACHE_ENABLED else None
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Page Extraction Engine
+Single-pass lxml parsing of driver.page_source snapshots
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+# Selectors used by the scrapers (kept identical to the WebDriver path)
+INVESTOR_CONTAINER_SELECTOR = ".reusable-search__result-container"
+INVESTOR_NAME_SELECTOR = ".entity-result__title-text a span[aria-hidden='true']"
+INVESTOR_TITLE_SELECTOR = ".entity-result__primary-subtitle"
+INVESTOR_LOCATION_SELECTOR = ".entity-result__secondary-subtitle"
+INVESTOR_LINK_SELECTOR = ".entity-result__title-text a"
+
+OBITUARY_CARD_SELECTOR = ".obituary-card, .obit-card, .memorial-listing"
+OBITUARY_NAME_SELECTORS = [
+    ".obit-name", ".obituary-name", ".name", "h3", ".memorial-name",
+    "[data-cy='obit-name']", ".deceased-name"
+]
+
+# Elements that start a new line in rendered text (mirrors WebElement.text)
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li',
+    'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'td', 'th', 'tr', 'ul'
+}
+HIDDEN_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*|\*)?"
+    r"(?P<classes>(?:\.[\w-]+)*)"
+    r"(?:\[(?P<attr>[\w-]+)(?:=['\"](?P<value>[^'\"]*)['\"])?\])?$"
+)
+_WHITESPACE = re.compile(r'[ \t\r\f\v\u00a0]+')
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+@lru_cache(maxsize=128)
+def css_to_xpath(selector):
+    """Translate the simple CSS subset used by the scrapers into XPath
+
+    Supports tag, .class, [attr] and [attr='value'] parts, the descendant
+    combinator and comma-separated groups.
+    """
+    groups = []
+    for group in selector.split(','):
+        steps = []
+        for part in group.split():
+            match = _SIMPLE_SELECTOR.match(part)
+            if not match:
+                raise ValueError(f"Unsupported selector: {selector}")
+
+            predicates = []
+            for class_name in match.group('classes').split('.')[1:]:
+                predicates.append(
+                    f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+                )
+            if match.group('attr'):
+                if match.group('value') is None:
+                    predicates.append(f"@{match.group('attr')}")
+                else:
+                    predicates.append(f"@{match.group('attr')}='{match.group('value')}'")
+
+            step = match.group('tag') or '*'
+            if predicates:
+                step += '[' + ' and '.join(predicates) + ']'
+            steps.append(step)
+
+        groups.append('.//' + '//'.join(steps))
+
+    return ' | '.join(groups)
+
+
+@lru_cache(maxsize=128)
+def compiled_selector(selector):
+    """Compile a CSS selector into a reusable XPath evaluator"""
+    return etree.XPath(css_to_xpath(selector))
+
+
+def parse_page(page_source):
+    """Parse a page_source snapshot into an lxml tree
+
+    A blank page parses as an empty document. An XML declaration is dropped,
+    since lxml refuses str input that declares its own encoding.
+    """
+    page_source = _XML_DECLARATION.sub('', page_source or '', count=1)
+    return lxml.html.fromstring(page_source if page_source.strip() else '<html></html>')
+
+
+def select(element, selector):
+    """Return all elements matching a CSS selector, in document order"""
+    return compiled_selector(selector)(element)
+
+
+def select_one(element, selector):
+    """Return the first element matching a CSS selector, or None"""
+    matches = select(element, selector)
+    return matches[0] if matches else None
+
+
+def visible_text(element):
+    """Approximate WebElement.text: block elements on their own lines"""
+    chunks = []
+    _collect_text(element, chunks)
+
+    lines = []
+    for line in ''.join(chunks).split('\n'):
+        line = _WHITESPACE.sub(' ', line).strip()
+        if line:
+            lines.append(line)
+
+    return '\n'.join(lines)
+
+
+def _collect_text(element, chunks):
+    """Walk an element tree appending rendered text to chunks"""
+    tag = element.tag if isinstance(element.tag, str) else ''
+
+    if tag not in HIDDEN_TAGS:
+        is_block = tag in BLOCK_TAGS
+        if is_block:
+            chunks.append('\n')
+        if element.text:
+            chunks.append(element.text.replace('\n', ' '))
+        for child in element:
+            _collect_text(child, chunks)
+        if is_block:
+            chunks.append('\n')
+
+    if element.tail:
+        chunks.append(element.tail.replace('\n', ' '))
+
+
+def _text_of(container, selector):
+    """Visible text of the first match, or None when nothing matches"""
+    element = select_one(container, selector)
+    if element is None:
+        return None
+    return visible_text(element).strip()
+
+
+def parse_investor_cards(page_source, base_url=None, limit=None):
+    """Parse every LinkedIn result container from one page snapshot
+
+    Returns raw field dicts with None for fields whose element is missing,
+    so callers can apply the same fallbacks as the per-element path.
+    """
+    root = parse_page(page_source)
+    containers = select(root, INVESTOR_CONTAINER_SELECTOR)
+    if limit is not None:
+        containers = containers[:limit]
+
+    cards = []
+    for container in containers:
+        profile_url = None
+        link = select_one(container, INVESTOR_LINK_SELECTOR)
+        if link is not None:
+            href = link.get('href')
+            if href is not None and base_url:
+                href = urljoin(base_url, href)
+            profile_url = href
+
+        cards.append({
+            'name': _text_of(container, INVESTOR_NAME_SELECTOR),
+            'title': _text_of(container, INVESTOR_TITLE_SELECTOR),
+            'location': _text_of(container, INVESTOR_LOCATION_SELECTOR),
+            'profile_url': profile_url
+        })
+
+    return cards
+
+
+def iter_obituary_cards(page_source, limit=None):
+    """Yield obituary cards from one page snapshot in page order
+
+    The name follows the selector fallback order of the per-element path;
+    text is the full rendered card text used for pattern mining. Cards are
+    rendered one at a time, so a caller that stops early skips the rest.
+    """
+    root = parse_page(page_source)
+    obit_cards = select(root, OBITUARY_CARD_SELECTOR)
+    if limit is not None:
+        obit_cards = obit_cards[:limit]
+
+    for card in obit_cards:
+        name = None
+        for selector in OBITUARY_NAME_SELECTORS:
+            text = _text_of(card, selector)
+            if text is None:
+                continue
+            name = text
+            if name and len(name) > 3:
+                break
+
+        yield {
+            'name': name,
+            'text': visible_text(card)
+        }
+
+
+def parse_obituary_cards(page_source, limit=None):
+    """Parse every obituary card from one page snapshot"""
+    return list(iter_obituary_cards(page_source, limit))
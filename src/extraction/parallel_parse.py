@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Parallel Snapshot Parsing
+Fans page parsing, pattern mining and scoring out across worker processes
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+from lxml import etree
+
+from config.settings import LeadFlowConfig
+from src.extraction.snapshots import find_snapshots, load_snapshot
+from src.extraction.text_patterns import window_start
+
+DEFAULT_CHUNK_SIZE = 16  # Pages per worker task
+
+# Unreadable or unparseable pages: missing files, truncated .gz, bad sidecars,
+# bad capture times and documents lxml rejects
+PAGE_ERRORS = (OSError, EOFError, ValueError, etree.ParserError, etree.XMLSyntaxError)
+
+
+def _parse_records(snapshot):
+    # The page parsers only; workers never build a scraper with its backends and caches
+    city = snapshot['city']
+    if snapshot['kind'] == 'investors':
+        from src.investor_finder.linkedin_scraper import parse_investor_page
+        records = parse_investor_page(
+            snapshot['html'], snapshot['search_term'], city, None, base_url=snapshot['url'] or None
+        )
+    else:
+        from src.property_scanner.inheritance_finder import parse_obituary_page
+
+        # Recent as of the capture; pages without a capture time keep every card
+        since = None
+        if snapshot['saved_at']:
+            since = window_start(LeadFlowConfig.OBITUARY_DAYS_BACK,
+                                 datetime.fromisoformat(snapshot['saved_at']).date())
+        records = parse_obituary_page(snapshot['html'], city, None, since)
+
+    # Leads were scraped when the page was captured, not now
+    if snapshot['saved_at']:
+        for record in records:
+            record['scraped_at'] = snapshot['saved_at']
+    return records
+
+
+def parse_snapshot(path, default_city=None):
+    """Scored lead records for one snapshot page
+
+    Returns {'path', 'kind', 'city', 'records'}, plus 'error' if the page
+    could not be read or parsed, so one bad page never stops a run.
+    """
+    try:
+        snapshot = load_snapshot(path, default_city)
+        records = _parse_records(snapshot)
+    except PAGE_ERRORS as e:
+        return {'path': path, 'kind': None, 'city': default_city, 'records': [], 'error': str(e) or type(e).__name__}
+
+    return {'path': path, 'kind': snapshot['kind'], 'city': snapshot['city'], 'records': records}
+
+
+def parse_snapshot_chunk(paths, default_city=None):
+    """Worker task: parse a chunk of snapshot pages"""
+    return [parse_snapshot(path, default_city) for path in paths]
+
+
+def parse_snapshots(paths, workers=None, chunk_size=None, default_city=None):
+    """Yield parse_snapshot() results for every path, in order
+
+    Pages are parsed in chunks of `chunk_size` across `workers` processes
+    (all cores by default); workers=1 parses inline without a pool.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(chunk_size or DEFAULT_CHUNK_SIZE, 1)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    task = partial(parse_snapshot_chunk, default_city=default_city)
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from task(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for results in pool.map(task, chunks):
+            yield from results
+
+
+def parse_snapshot_dir(directory, workers=None, chunk_size=None, default_city=None):
+    """parse_snapshots() over every snapshot page under `directory`"""
+    return parse_snapshots(find_snapshots(directory), workers, chunk_size, default_city)
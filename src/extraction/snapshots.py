@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Page Snapshots
+Saved search-result pages (gzip HTML plus a JSON sidecar) for offline reprocessing
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from src.extraction.page_extractor import INVESTOR_CONTAINER_SELECTOR
+
+SNAPSHOT_SUFFIXES = ('.html.gz', '.html', '.htm')
+META_SUFFIX = '.meta.json'
+SNAPSHOT_KINDS = ('investors', 'obituaries')
+
+_INVESTOR_MARKER = INVESTOR_CONTAINER_SELECTOR.lstrip('.')
+
+
+def _strip_suffix(path):
+    for suffix in SNAPSHOT_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def snapshot_kind(url, html):
+    """'investors' for LinkedIn result pages, 'obituaries' otherwise"""
+    if 'linkedin.com' in (url or '') or _INVESTOR_MARKER in html:
+        return 'investors'
+    return 'obituaries'
+
+
+def save_snapshot(directory, html, url, kind, city, search_term=None, digest=None):
+    """Write one page as <kind>_<digest>.html.gz with a .meta.json sidecar; returns the path
+
+    The digest defaults to a hash of the URL and capture time, so every
+    save is a new file; pass one to overwrite a keyed entry instead.
+    """
+    os.makedirs(directory, exist_ok=True)
+    saved_at = datetime.now().isoformat()
+    digest = digest or hashlib.blake2b(f"{url}|{saved_at}".encode('utf-8'), digest_size=10).hexdigest()
+    base = os.path.join(directory, f"{kind}_{digest}")
+
+    with gzip.open(f"{base}.html.gz", 'wt', encoding='utf-8') as f:
+        f.write(html)
+    with open(f"{base}{META_SUFFIX}", 'w', encoding='utf-8') as f:
+        json.dump({'url': url, 'kind': kind, 'city': city, 'search_term': search_term,
+                   'saved_at': saved_at}, f)
+
+    return f"{base}.html.gz"
+
+
+def snapshot_meta_path(path):
+    """Sidecar metadata path for a snapshot page"""
+    return f"{_strip_suffix(path)}{META_SUFFIX}"
+
+
+def find_snapshots(directory):
+    """Sorted paths of every snapshot page under `directory`"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.endswith(SNAPSHOT_SUFFIXES))
+    return sorted(paths)
+
+
+def load_snapshot(path, default_city=None):
+    """Page HTML plus metadata (sidecar values, else inferred from the page)"""
+    if path.endswith('.gz'):
+        with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+            html = f.read()
+    else:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            html = f.read()
+
+    meta = {}
+    meta_path = snapshot_meta_path(path)
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+
+    url = meta.get('url') or ''
+    return {
+        'path': path,
+        'html': html,
+        'url': url,
+        'kind': meta.get('kind') or snapshot_kind(url, html),
+        'city': meta.get('city') or default_city or 'Unknown',
+        'search_term': meta.get('search_term') or '',
+        'saved_at': meta.get('saved_at')
+    }
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Text Normalization
+One folding rule for names, cities and dates used as lookup or identity keys
+"""
+
+import re
+import unicodedata
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_text(value):
+    """Casefold, strip accents and punctuation, collapse whitespace
+
+    "José  O'Brien" and "jose o brien" give the same key; None gives ''.
+    """
+    value = unicodedata.normalize('NFKD', str(value or ''))
+    value = ''.join(char for char in value if not unicodedata.combining(char))
+    return _NON_ALNUM.sub(' ', value.casefold()).strip()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Obituary Pattern Bank
+Precompiled, single-scan mining of age, death date and address hints
+"""
+
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+
+# Reference patterns (field semantics the bank must reproduce exactly)
+AGE_PATTERNS = [r'age (\d{2,3})', r'(\d{2,3}) years old', r'(\d{2,3}),']
+DATE_PATTERNS = [
+    r'(\w+ \d{1,2}, \d{4})',
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{4}-\d{2}-\d{2})'
+]
+ADDRESS_PATTERNS = [
+    r'\d+\s+\w+\s+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl|Court|Ct)',
+    r'\d+\s+[A-Za-z]+\s+[A-Za-z]+\s+(?:Street|St|Avenue|Ave|Road|Rd)',
+    r'lived on \w+\s+\w+',
+    r'resided at \d+\s+\w+'
+]
+
+MAX_MATCHES_PER_ADDRESS_PATTERN = 3
+MAX_ADDRESS_HINTS = 2
+
+# Month words accepted in "March 14, 2026" dates (full names and abbreviations)
+MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'),
+        ('may',), ('june', 'jun'), ('july', 'jul'), ('august', 'aug'),
+        ('september', 'sep', 'sept'), ('october', 'oct'), ('november', 'nov'), ('december', 'dec')
+    ], start=1)
+    for name in names
+}
+_LONG_DATE = re.compile(r'(\w+) (\d{1,2}), (\d{4})$')
+_SLASH_DATE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})$')
+_ISO_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})$')
+# Any of the three date formats, anywhere in a card's text
+_ANY_DATE = re.compile(r'\w+ \d{1,2}, \d{4}|\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}')
+
+
+class ObituaryPatternBank:
+    """Extract age, death date and address hints in one scan of the text
+
+    Every reference pattern except ``lived on ...`` contains a digit run, so
+    a single master scan visits only digit runs and ``lived on`` phrases.
+    Each hit is verified with cheap anchored checks instead of rescanning the
+    whole text once per pattern. Priority order, leftmost-match and
+    non-overlapping findall semantics of the reference patterns are kept.
+    """
+
+    def __init__(self):
+        self.master = re.compile(r'\d+|lived on', re.IGNORECASE)
+        self.word_char = re.compile(r'\w')
+
+        # Age anchors (all case-insensitive like the reference search)
+        self.age_prefix = re.compile(r'age ', re.IGNORECASE)
+        self.years_old = re.compile(r' years old', re.IGNORECASE)
+
+        # Date anchors
+        self.date_long_tail = re.compile(r', \d{4}')
+        self.date_slash = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+        self.date_iso = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+        # Address patterns, anchored at a digit run or phrase start
+        self.address_street = re.compile(ADDRESS_PATTERNS[0], re.IGNORECASE)
+        self.address_long = re.compile(ADDRESS_PATTERNS[1], re.IGNORECASE)
+        self.address_lived = re.compile(ADDRESS_PATTERNS[2], re.IGNORECASE)
+        self.resided_prefix = re.compile(r'resided at ', re.IGNORECASE)
+        self.resided_tail = re.compile(r'\d+\s+\w+', re.IGNORECASE)
+
+    def extract(self, text):
+        """Return (age, death_date, address_hints) for a card's text"""
+        age, age_rank = "N/A", 3
+        death_date, date_rank = "Recent", 3
+        # Per address pattern: collected matches and end of the last match
+        hits = ([], [], [], [])
+        ends = [0, 0, 0, 0]
+
+        for match in self.master.finditer(text):
+            start, end = match.span()
+
+            if not text[start].isdecimal():
+                # "lived on ..." phrase
+                if start >= ends[2] and len(hits[2]) < MAX_MATCHES_PER_ADDRESS_PATTERN:
+                    lived = self.address_lived.match(text, start)
+                    if lived:
+                        hits[2].append(lived.group())
+                        ends[2] = lived.end()
+                continue
+
+            run_length = end - start
+            next_char = text[end:end + 1]
+
+            # Age: first match of the highest-priority pattern wins
+            if age_rank > 0 and run_length >= 2 and start >= 4 \
+                    and self.age_prefix.match(text, start - 4):
+                age, age_rank = text[start:min(end, start + 3)], 0
+            if age_rank > 1 and run_length >= 2 and next_char == ' ' \
+                    and self.years_old.match(text, end):
+                age, age_rank = text[max(start, end - 3):end], 1
+            if age_rank > 2 and run_length >= 2 and next_char == ',':
+                age, age_rank = text[max(start, end - 3):end], 2
+
+            # Death date: same priority rules as the age patterns
+            if date_rank > 0 and run_length <= 2 and start >= 2 and text[start - 1] == ' ' \
+                    and self.word_char.match(text, start - 2) \
+                    and self.date_long_tail.match(text, end):
+                word_start = start - 2
+                while word_start > 0 and self.word_char.match(text, word_start - 1):
+                    word_start -= 1
+                death_date, date_rank = text[word_start:end + 6], 0
+            if date_rank > 1 and next_char == '/':
+                slash = self.date_slash.match(text, max(start, end - 2))
+                if slash:
+                    death_date, date_rank = slash.group(), 1
+            if date_rank > 2 and next_char == '-' and run_length >= 4:
+                iso = self.date_iso.match(text, end - 4)
+                if iso:
+                    death_date, date_rank = iso.group(), 2
+
+            # Address hints: non-overlapping matches per pattern
+            if next_char.isspace():
+                if start >= ends[0] and len(hits[0]) < MAX_MATCHES_PER_ADDRESS_PATTERN:
+                    street = self.address_street.match(text, start)
+                    if street:
+                        hits[0].append(street.group())
+                        ends[0] = street.end()
+                if start >= ends[1] and len(hits[1]) < MAX_MATCHES_PER_ADDRESS_PATTERN:
+                    long_street = self.address_long.match(text, start)
+                    if long_street:
+                        hits[1].append(long_street.group())
+                        ends[1] = long_street.end()
+                if start >= 11 and start - 11 >= ends[3] \
+                        and len(hits[3]) < MAX_MATCHES_PER_ADDRESS_PATTERN \
+                        and self.resided_prefix.match(text, start - 11):
+                    resided = self.resided_tail.match(text, start)
+                    if resided:
+                        hits[3].append(text[start - 11:resided.end()])
+                        ends[3] = resided.end()
+
+        addresses = hits[0] + hits[1] + hits[2] + hits[3]
+        address_hints = '; '.join(addresses[:MAX_ADDRESS_HINTS]) if addresses else ''
+
+        return age, death_date, address_hints
+
+    def address_hints(self, text):
+        """Return only the address hints for a card's text"""
+        return self.extract(text)[2]
+
+
+# Built once per process and shared by every finder instance
+PATTERN_BANK = ObituaryPatternBank()
+
+
+def mine_obituary_text(text):
+    """Extract (age, death_date, address_hints) with the shared pattern bank"""
+    return PATTERN_BANK.extract(text)
+
+
+@lru_cache(maxsize=4096)
+def parse_death_date(death_date):
+    """Real date for a mined death_date string, or None
+
+    Understands the three formats the pattern bank extracts ("March 14, 2026",
+    "03/02/2026" as month/day, "2026-03-10"). "Recent", a word that is not
+    a month and impossible dates give None. A listing page repeats the
+    same few dates, so results are memoized.
+    """
+    if not death_date:
+        return None
+    match = _LONG_DATE.match(death_date)
+    if match:
+        month = MONTHS.get(match.group(1).lower())
+        day, year = int(match.group(2)), int(match.group(3))
+    else:
+        match = _SLASH_DATE.match(death_date)
+        if match:
+            month, day, year = (int(part) for part in match.groups())
+        else:
+            match = _ISO_DATE.match(death_date)
+            if not match:
+                return None
+            year, month, day = (int(part) for part in match.groups())
+    try:
+        return date(year, month, day) if month else None
+    except ValueError:
+        return None
+
+
+def latest_date_text(text):
+    """Latest parseable date anywhere in a card's text, as written there, or None
+
+    The mined death_date is the first date in the card, which is the birth
+    date in "June 1, 1940 – October 9, 2026" layouts; the latest date is
+    when the person died, whichever layout the card uses.
+    """
+    latest, latest_text = None, None
+    for found in _ANY_DATE.findall(text or ''):
+        day = parse_death_date(found)
+        if day is not None and (latest is None or day > latest):
+            latest, latest_text = day, found
+    return latest_text
+
+
+def latest_date(text):
+    """Latest parseable date anywhere in a card's text, or None"""
+    return parse_death_date(latest_date_text(text))
+
+
+def window_start(days_back, today=None):
+    """Earliest death date inside a `days_back` window, or None for no window (days_back <= 0)"""
+    if not days_back or days_back <= 0:
+        return None
+    return (today or date.today()) - timedelta(days=days_back)
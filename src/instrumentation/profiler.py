@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Run Profiler
+Per-stage timers, sleep accounting, counters and time-saved credits with a JSON run profile
+"""
+
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class RunProfiler:
+    """Collect wall time, sleep time and call counts per pipeline stage
+
+    Disabled by default; stage() and profiled() then cost one attribute
+    check. Stages nest, and a sleep is charged to every stage that is
+    active while it happens, so each stage's work time is wall minus sleep.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.delay_scale = 1.0  # 0 zeroes every pause(), e.g. when replaying recorded pages
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        self.stages = {}
+        self.counters = {}
+        self.saved_seconds = {}
+        self.sleep_seconds = 0.0
+        self.started_at = None
+        self._start = None
+        self._stack = []
+
+    def enable(self):
+        """Start a fresh profile"""
+        self.reset()
+        self.enabled = True
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+
+    def disable(self):
+        self.enabled = False
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as one call of `name`"""
+        if not self.enabled:
+            yield
+            return
+
+        frame = [name, 0.0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            stats = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'sleep_seconds': 0.0})
+            stats['calls'] += 1
+            stats['wall_seconds'] += elapsed
+            stats['sleep_seconds'] += frame[1]
+
+    def count(self, name, amount=1):
+        """Add to a named counter"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def credit(self, name, seconds):
+        """Record idle time avoided (or, if negative, added) versus a fixed delay"""
+        if self.enabled:
+            # Scaled like pause(): with delays zeroed there is nothing to save
+            self.saved_seconds[name] = self.saved_seconds.get(name, 0.0) + seconds * self.delay_scale
+
+    def pause(self, seconds):
+        """time.sleep() that is accounted as sleep rather than work"""
+        start = time.perf_counter()
+        if self.delay_scale:
+            time.sleep(seconds * self.delay_scale)
+        if self.enabled:
+            slept = time.perf_counter() - start
+            self.sleep_seconds += slept
+            for frame in self._stack:
+                frame[1] += slept
+            self.count('sleeps')
+
+    def report(self):
+        """The run profile as a JSON-serializable dict"""
+        wall = time.perf_counter() - self._start if self._start is not None else 0.0
+        stages = {}
+        for name, stats in sorted(self.stages.items(), key=lambda item: item[1]['wall_seconds'], reverse=True):
+            stages[name] = {
+                'calls': stats['calls'],
+                'wall_seconds': round(stats['wall_seconds'], 6),
+                'sleep_seconds': round(stats['sleep_seconds'], 6),
+                'work_seconds': round(stats['wall_seconds'] - stats['sleep_seconds'], 6),
+                'avg_seconds': round(stats['wall_seconds'] / stats['calls'], 6)
+            }
+        return {
+            'started_at': self.started_at,
+            'wall_seconds': round(wall, 6),
+            'sleep_seconds': round(self.sleep_seconds, 6),
+            'work_seconds': round(wall - self.sleep_seconds, 6),
+            'stages': stages,
+            'counters': dict(self.counters),
+            'saved_seconds': {name: round(seconds, 6) for name, seconds in self.saved_seconds.items()}
+        }
+
+    def save(self, filepath):
+        """Write the run profile as JSON"""
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        return filepath
+
+    def summary(self, limit=12):
+        """Short text table of the slowest stages"""
+        profile = self.report()
+        lines = [
+            f"⏱️  Run: {profile['wall_seconds']:.1f}s wall | "
+            f"{profile['sleep_seconds']:.1f}s sleeping | {profile['work_seconds']:.1f}s working"
+        ]
+        for name, seconds in profile['saved_seconds'].items():
+            lines.append(f"   💨 {name}: {seconds:.1f}s saved vs fixed delays")
+        for name, stats in list(profile['stages'].items())[:limit]:
+            lines.append(f"   {name:<56} {stats['calls']:>6} calls  {stats['wall_seconds']:9.2f}s wall  "
+                         f"{stats['sleep_seconds']:8.2f}s sleep")
+        return '\n'.join(lines)
+
+
+# Process-wide profiler shared by every module
+PROFILER = RunProfiler()
+
+
+def profiled(name=None):
+    """Decorator timing every call of a function as a profiler stage"""
+    def decorator(func):
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER.stage(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def pause(seconds):
+    """Sleep through the shared profiler"""
+    PROFILER.pause(seconds)
@@ -5,31 +5,84 @@ Professional LinkedIn scraping for real estate investors
 """
 
 import time
-import csv
 import random
 import os
+import sys
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from fake_useragent import UserAgent
+
+# Repo root on the path, so this module also runs as a script (src/... and config imports)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.automation.driver_factory import build_chrome_options, create_driver
+from src.automation.page_readiness import PageReadiness
+from src.instrumentation.profiler import PROFILER, pause, profiled
+from src.extraction.page_extractor import INVESTOR_CONTAINER_SELECTOR, parse_investor_cards
+from src.extraction.gazetteer import lead_metro, metro_name, target_cities
+from src.extraction.page_cache import open_page_cache
+from src.extraction.snapshots import save_snapshot
+from src.ai_enrichment.lead_scoring import investor_quality_score
+from src.ai_enrichment.scoring_model import reload_scoring_model
+from src.reporting.aggregator import LeadAggregator
+from src.storage.lead_store import LeadStore
+from src.storage.sinks import finish_sink, open_sink
+from src.storage.dedup_index import DedupIndex, investor_identity
+from src.storage.checkpoint import HuntCheckpoint
+from src.storage.lead_records import InvestorLead
+from config.settings import LeadFlowConfig
+
+
+def build_investor_record(name, title, location, profile_url, search_term, city):
+    """Score extracted fields and build the investor lead (None for an unusable card)"""
+    if not (name and title and len(name) > 2):
+        return None
+        
+    return InvestorLead(
+        name=name,
+        title=title,
+        location=location,
+        profile_url=profile_url,
+        search_term=search_term,
+        target_city=city,
+        quality_score=investor_quality_score(title, location, search_term),
+        scraped_at=datetime.now().isoformat(),
+        lead_type='LinkedIn Investor'
+    )
+
+
+def parse_investor_page(page_source, search_term, city, max_results=50, base_url=None):
+    """Scored investor leads for every result container in one page snapshot
+    
+    Needs no scraper instance, so snapshot reprocessing workers call it directly.
+    """
+    investors = []
+    
+    for card in parse_investor_cards(page_source, base_url=base_url, limit=max_results):
+        try:
+            investor_data = build_investor_record(
+                card['name'], card['title'],
+                card['location'] if card['location'] is not None else city,
+                card['profile_url'] if card['profile_url'] is not None else "",
+                search_term, city
+            )
+            if investor_data:
+                investors.append(investor_data)
+        except Exception:
+            continue
+            
+    return investors
 
 class LinkedInInvestorScraper:
-    def __init__(self):
+    def __init__(self, driver=None):
         """Initialize the LinkedIn scraper with professional settings"""
-        self.ua = UserAgent()
-        self.chrome_options = Options()
+        # Chrome options are built on first use (selenium and fake_useragent
+        # are only imported when a hunt starts). A driver passed in is a
+        # shared session: it is reused and left running after the hunt.
+        self.chrome_options = None
+        self.driver = driver
+        self._owns_driver = driver is None
         
-        # Professional Chrome options for scraping
-        self.chrome_options.add_argument(f"--user-agent={self.ua.random}")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Search pages fetched within PAGE_CACHE_TTL are served from disk (PAGE_CACHE_ENABLED)
+        self.page_cache = open_page_cache()
         
         # Target search terms for real estate investors
         self.search_terms = [
@@ -45,27 +98,29 @@ class LinkedInInvestorScraper:
             "commercial real estate investor"
         ]
         
-        # Target cities for investor search
-        self.target_cities = [
-            "New York", "Los Angeles", "Chicago", "Houston", "Phoenix",
-            "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose",
-            "Austin", "Jacksonville", "Fort Worth", "Columbus", "Charlotte",
-            "San Francisco", "Indianapolis", "Seattle", "Denver", "Boston",
-            "Miami", "Atlanta", "Orlando", "Tampa", "Las Vegas"
-        ]
+        # Leads written by the most recent hunt (also when results are not kept)
+        self.last_run_count = 0
+        self.last_run_id = None
+        # Whether the most recent search was served from the page cache
+        self.last_search_cached = False
+        
+        # Target cities for investor search (LeadFlowConfig.TARGET_CITIES)
+        self.target_cities = target_cities()
         
     def setup_driver(self):
-        """Initialize Chrome driver with anti-detection measures"""
+        """Initialize Chrome driver with anti-detection measures (or reuse a shared session)"""
         try:
-            service = ChromeDriverManager().install()
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.wait = WebDriverWait(self.driver, 15)
+            if self.driver is None:
+                if self.chrome_options is None:
+                    self.chrome_options = build_chrome_options()
+                self.driver = create_driver(self.chrome_options)
+            self.wait = PageReadiness(self.driver)
             return True
         except Exception as e:
             print(f"❌ Driver setup error: {e}")
             return False
         
+    @profiled()
     def search_investors(self, search_term, city, max_results=50):
         """Search for real estate investors in specific city"""
         investors = []
@@ -77,36 +132,56 @@ class LinkedInInvestorScraper:
             linkedin_url = f"https://www.linkedin.com/search/results/people/?keywords={encoded_query}&origin=CLUSTER_EXPANSION"
             
             print(f"🔍 Searching: {search_query}")
-            self.driver.get(linkedin_url)
-            
-            # Random delay to appear human-like
-            time.sleep(random.uniform(4, 7))
-            
-            # Scroll to load more results
-            for scroll in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(3, 5))
+            cached = self.page_cache.get(linkedin_url, 'investors') if self.page_cache is not None else None
+            self.last_search_cached = bool(cached)
+            if cached:
+                # Fetched within PAGE_CACHE_TTL: no page load, delays or scrolling
+                page_source, page_url = cached['html'], cached['url']
+            else:
+                with PROFILER.stage('driver.get'):
+                    self.driver.get(linkedin_url)
                 
-            # Extract investor profiles
-            profile_containers = self.driver.find_elements(By.CSS_SELECTOR, ".reusable-search__result-container")
-            
-            for container in profile_containers[:max_results]:
-                try:
-                    investor_data = self._extract_profile_data(container, search_term, city)
-                    if investor_data:
-                        investors.append(investor_data)
-                        print(f"✅ Found: {investor_data['name']} - {investor_data['title']}")
-                        
-                except Exception as e:
-                    continue
+                # Wait for result containers (replaces a fixed 4-7s delay)
+                found = self.wait.wait_for_results(INVESTOR_CONTAINER_SELECTOR, replaces=5.5)
+                
+                # Scroll to load more results, each time until the count settles (was 3-5s each)
+                for scroll in range(3):
+                    with PROFILER.stage('driver.scroll'):
+                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    found = self.wait.wait_for_results(INVESTOR_CONTAINER_SELECTOR, min_count=found,
+                                                       replaces=4.0, timeout=self.wait.scroll_timeout)
+                    
+                page_source, page_url = self.driver.page_source, self.driver.current_url
+                if self.page_cache is not None:
+                    self.page_cache.put(linkedin_url, page_source, 'investors', city, search_term,
+                                        page_url=page_url)
+                if LeadFlowConfig.SNAPSHOT_DIR:
+                    save_snapshot(LeadFlowConfig.SNAPSHOT_DIR, page_source, page_url,
+                                  'investors', city, search_term)
+                
+            # Extract investor profiles from a single page snapshot
+            investors = self._extract_profiles_from_source(
+                page_source, search_term, city, max_results, base_url=page_url
+            )
+            PROFILER.count('investors_found', len(investors))
+            for investor_data in investors:
+                print(f"✅ Found: {investor_data['name']} - {investor_data['title']}")
                     
         except Exception as e:
             print(f"❌ Search error for {search_term} in {city}: {e}")
             
         return investors
     
+    @profiled()
+    def _extract_profiles_from_source(self, page_source, search_term, city, max_results=50, base_url=None):
+        """Extract investor data for every result container in one page snapshot"""
+        return parse_investor_page(page_source, search_term, city, max_results, base_url)
+    
+    @profiled()
     def _extract_profile_data(self, container, search_term, city):
-        """Extract investor data from profile container"""
+        """Extract investor data from profile container (per-element WebDriver path)"""
+        from selenium.webdriver.common.by import By
+        
         try:
             # Extract name
             name_element = container.find_element(By.CSS_SELECTOR, ".entity-result__title-text a span[aria-hidden='true']")
@@ -130,49 +205,25 @@ class LinkedInInvestorScraper:
             except:
                 profile_url = ""
             
-            # Calculate investor quality score (AI-like scoring)
-            quality_score = self._calculate_quality_score(title, location, search_term)
-            
-            if name and title and len(name) > 2:
-                return {
-                    'name': name,
-                    'title': title,
-                    'location': location,
-                    'profile_url': profile_url,
-                    'search_term': search_term,
-                    'target_city': city,
-                    'quality_score': quality_score,
-                    'scraped_at': datetime.now().isoformat(),
-                    'lead_type': 'LinkedIn Investor'
-                }
+            return self._build_profile_record(name, title, location, profile_url, search_term, city)
                 
         except Exception as e:
             pass
             
         return None
     
+    def _build_profile_record(self, name, title, location, profile_url, search_term, city):
+        """Score extracted fields and build the investor lead dict"""
+        return build_investor_record(name, title, location, profile_url, search_term, city)
+    
+    @profiled()
     def _calculate_quality_score(self, title, location, search_term):
         """AI-powered quality scoring for investor leads"""
-        score = 50  # Base score
-        
-        # Title scoring
-        high_value_keywords = ['investor', 'developer', 'capital', 'properties', 'real estate', 'cash buyer']
-        for keyword in high_value_keywords:
-            if keyword.lower() in title.lower():
-                score += 10
-                
-        # Location relevance
-        if any(city.lower() in location.lower() for city in ['new york', 'los angeles', 'chicago', 'miami']):
-            score += 15
-            
-        # Search term relevance
-        if search_term.lower().replace(' ', '') in title.lower().replace(' ', ''):
-            score += 20
-            
-        return min(score, 100)  # Cap at 100
+        return investor_quality_score(title, location, search_term)
     
-    def save_investors_to_csv(self, investors, filename=None):
-        """Save investor data to CSV file"""
+    @profiled()
+    def save_investors_to_csv(self, investors, filename=None, store=None):
+        """Save investor data to the lead store and export this run as CSV"""
         if not investors:
             print("❌ No investors found to save")
             return None
@@ -185,103 +236,173 @@ class LinkedInInvestorScraper:
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, filename)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'name', 'title', 'location', 'profile_url', 'search_term', 
-                'target_city', 'quality_score', 'lead_type', 'scraped_at'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(investors)
+        # Persist to the indexed store; the CSV is a view over this run's rows
+        lead_store = store or LeadStore()
+        try:
+            run_id = lead_store.add_investors(investors)
+            lead_store.export_csv('investors', filepath, run_id=run_id)
+        finally:
+            if store is None:
+                lead_store.close()
             
         print(f"💾 Saved {len(investors)} investors to {filepath}")
         return filepath
     
-    def run_investor_hunt(self, target_cities=5, investors_per_city=30):
-        """Main function to hunt for investors across multiple cities"""
+    @profiled()
+    def run_investor_hunt(self, target_cities=5, investors_per_city=30, sink=None, keep_results=True,
+                          dedup_index=None, deduplicate=None, resume=False, export_format='csv'):
+        """Main function to hunt for investors across multiple cities
+        
+        Leads stream into `sink` (the lead store by default) as they are found.
+        With keep_results=False nothing is accumulated in memory and the
+        summary report is built from the sink instead. Profiles already
+        exported by an earlier run (per the dedup index) are skipped.
+        
+        Progress is checkpointed per (city, search term); resume=True picks
+        up an interrupted hunt, skipping the terms it already completed.
+        """
         if not self.setup_driver():
             return []
             
+        reload_scoring_model()  # Pick up scoring spec edits made since the last run
         all_investors = []
+        if deduplicate is None:
+            deduplicate = LeadFlowConfig.DEDUP_ENABLED
+        dedup = dedup_index or (DedupIndex() if deduplicate else None)
+        checkpoint = HuntCheckpoint('investors', resume=resume, dedup=dedup)
+        lead_sink = checkpoint.open_sink('investors') or sink or open_sink('investors')
         
         try:
             print("🚀 LeadFlow AI - LinkedIn Investor Hunt Started")
             print("=" * 60)
             
-            # Manual login prompt
-            print("🔐 MANUAL LOGIN REQUIRED:")
-            print("1. Browser will open LinkedIn")
-            print("2. Login manually")  
-            print("3. Press Enter here when logged in")
+            # Manual login prompt (recorded pages need no login)
+            if not getattr(self.driver, 'offline', False):
+                print("🔐 MANUAL LOGIN REQUIRED:")
+                print("1. Browser will open LinkedIn")
+                print("2. Login manually")  
+                print("3. Press Enter here when logged in")
+                
+                with PROFILER.stage('driver.get'):
+                    self.driver.get("https://www.linkedin.com/login")
+                input("Press Enter after you've logged in to LinkedIn...")
             
-            self.driver.get("https://www.linkedin.com/login")
-            input("Press Enter after you've logged in to LinkedIn...")
+            if checkpoint.resumed:
+                print(f"⏯️  Resuming hunt: {checkpoint.completed_units} searches already completed")
             
-            # Select random cities for hunting
-            selected_cities = random.sample(self.target_cities, min(target_cities, len(self.target_cities)))
+            # Select random cities for hunting (the same ones when resuming)
+            selected_cities = checkpoint.select_cities(
+                random.sample(self.target_cities, min(target_cities, len(self.target_cities)))
+            )
             
             for city in selected_cities:
                 print(f"\n🎯 Hunting in: {city}")
-                city_investors = []
+                city_count = checkpoint.done_count(city)
                 
                 # Use top search terms for each city
                 for search_term in self.search_terms[:3]:
+                    if checkpoint.is_done(city, search_term):
+                        continue
+                    
                     investors = self.search_investors(search_term, city, investors_per_city // 3)
-                    city_investors.extend(investors)
+                    if dedup is not None:
+                        investors = dedup.filter_new(investors, investor_identity)
+                    lead_sink.write_many(investors)
+                    city_count += len(investors)
+                    if keep_results:
+                        all_investors.extend(investors)
+                    
+                    checkpoint.mark_done(city, search_term, lead_sink, len(investors),
+                                         keys=[investor_identity(inv) for inv in investors])
                     
-                    # Respectful delay between searches
-                    time.sleep(random.uniform(15, 25))
+                    # Respectful delay between searches (a cached page never reached LinkedIn)
+                    if not self.last_search_cached:
+                        pause(random.uniform(15, 25))
                     
-                all_investors.extend(city_investors)
-                print(f"✅ {city}: Found {len(city_investors)} investors")
+                lead_sink.flush()
+                checkpoint.commit(lead_sink)
+                print(f"✅ {city}: Found {city_count} investors")
                 
-            # Save results
-            csv_file = self.save_investors_to_csv(all_investors)
-            
-            # Generate summary report
-            self._generate_summary_report(all_investors)
+            # Generate summary report (read back from the sink when resumed)
+            if keep_results and not checkpoint.resumed:
+                report_investors = all_investors
+            else:
+                report_investors = lead_sink.iter_leads() or all_investors
+            self._generate_summary_report(report_investors)
+            checkpoint.clear()
             
         except Exception as e:
             print(f"❌ Hunt error: {e}")
         finally:
-            self.driver.quit()
+            self.last_run_count = lead_sink.written
+            self.last_run_id = getattr(lead_sink, 'run_id', None)
+            self._finish_sink(lead_sink, close=lead_sink is not sink, export_format=export_format)
+            if dedup is not None:
+                print(dedup.summary())
+                if dedup_index is None:
+                    dedup.close()
+            if self.page_cache is not None:
+                print(self.page_cache.summary())
+            if self._owns_driver:
+                self.driver.quit()
+                self.driver = None
             
         return all_investors
     
+    @profiled()
+    def _finish_sink(self, lead_sink, close=True, export_format='csv'):
+        """Flush the run's sink and export a CSV or Excel view of the run's leads"""
+        finish_sink(lead_sink, 'investors', close=close, export_format=export_format)
+    
+    @profiled()
     def _generate_summary_report(self, investors):
-        """Generate AI-powered summary report"""
-        if not investors:
+        """Generate AI-powered summary report in one pass over a list or stream of investors"""
+        stats = LeadAggregator(
+            sum_fields=['quality_score'],
+            tiers={
+                'high': lambda inv: inv['quality_score'] >= 80,
+                'medium': lambda inv: 60 <= inv['quality_score'] < 80
+            },
+            top_k=5,
+            rank=lambda inv: inv['quality_score'],
+            group_by=lead_metro
+        ).consume(investors)
+        if not stats.count:
             return
             
-        high_quality = [inv for inv in investors if inv['quality_score'] >= 80]
-        medium_quality = [inv for inv in investors if 60 <= inv['quality_score'] < 80]
+        high_quality = stats.tier_counts['high']
+        medium_quality = stats.tier_counts['medium']
         
         report = f"""
 🤖 LeadFlow AI - Investor Hunt Summary Report
 {'='*60}
 
 📊 RESULTS OVERVIEW:
-- Total Investors Found: {len(investors)}
-- High Quality Leads (80+ score): {len(high_quality)}
-- Medium Quality Leads (60-79 score): {len(medium_quality)}
-- Average Quality Score: {sum(inv['quality_score'] for inv in investors) / len(investors):.1f}
+- Total Investors Found: {stats.count}
+- High Quality Leads (80+ score): {high_quality}
+- Medium Quality Leads (60-79 score): {medium_quality}
+- Average Quality Score: {stats.average('quality_score'):.1f}
 
 💰 REVENUE POTENTIAL:
-- High Quality Leads: ${len(high_quality) * 250:,} (@$250 each)
-- Medium Quality Leads: ${len(medium_quality) * 150:,} (@$150 each)
-- Total Market Value: ${len(high_quality) * 250 + len(medium_quality) * 150:,}
+- High Quality Leads: ${high_quality * 250:,} (@$250 each)
+- Medium Quality Leads: ${medium_quality * 150:,} (@$150 each)
+- Total Market Value: ${high_quality * 250 + medium_quality * 150:,}
 
 🎯 TOP 5 HIGHEST QUALITY LEADS:
 """
         
-        sorted_investors = sorted(investors, key=lambda x: x['quality_score'], reverse=True)
-        for i, inv in enumerate(sorted_investors[:5], 1):
+        for i, inv in enumerate(stats.top(), 1):
             report += f"\n{i}. {inv['name']} (Score: {inv['quality_score']})"
             report += f"   {inv['title']} - {inv['location']}"
             
+        report += "\n\n🗺️  TOP MARKETS:\n"
+        for metro_id, count in stats.top_groups(5):
+            report += f"- {metro_name(metro_id)}: {count} investors\n"
+            
         report += f"\n\n📈 Generated by LeadFlow AI - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         
         # Save report
+        os.makedirs('data', exist_ok=True)
         report_file = os.path.join('data', 'investor_hunt_report.txt')
         with open(report_file, 'w') as f:
             f.write(report)
@@ -5,32 +5,118 @@ AI-powered inheritance property discovery system
 """
 
 import time
-import csv
-import json
 import random
 import os
-import re
-from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from fake_useragent import UserAgent
+import sys
+from datetime import datetime
+
+# Repo root on the path, so this module also runs as a script (src/... and config imports)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.automation.driver_factory import build_chrome_options, create_driver
+from src.automation.page_readiness import PageReadiness
+from src.instrumentation.profiler import PROFILER, profiled
+from src.extraction.page_extractor import OBITUARY_CARD_SELECTOR, iter_obituary_cards
+from src.extraction.gazetteer import lead_metro, metro_name, target_cities
+from src.extraction.page_cache import open_page_cache
+from src.extraction.snapshots import save_snapshot
+from src.extraction.text_patterns import PATTERN_BANK, latest_date_text, parse_death_date, window_start
+from src.ai_enrichment.lead_scoring import property_potential_score, property_rank
+from src.ai_enrichment.scoring_model import reload_scoring_model
+from src.reporting.aggregator import LeadAggregator
+from src.storage.lead_store import LeadStore
+from src.storage.sinks import finish_sink, open_sink
+from src.storage.dedup_index import DedupIndex, obituary_identity
+from src.storage.checkpoint import HuntCheckpoint
+from src.storage.lead_records import HeirContact, ObituaryRecord, PropertyLead
+from src.storage.normalized_export import export_normalized, heir_contacts_of
+from src.storage.lookup_cache import open_lookup_cache
+from src.property_scanner.record_backends import CachedBackend, create_backends
+from config.settings import LeadFlowConfig
+
+
+def build_obituary_record(name, text_content, city):
+    """Mine card text and build the obituary dict using AI-like pattern recognition"""
+    try:
+        if not name:
+            return None
+            
+        # Extract age, death date and address hints in one pattern scan
+        age, death_date, address_hints = PATTERN_BANK.extract(text_content)
+        # The mined date is the card's first, a birth date on "born – died" cards
+        death_date = latest_date_text(text_content) or death_date
+        
+        return ObituaryRecord(
+            deceased_name=name,
+            age=age,
+            death_date=death_date,
+            city=city,
+            address_hints=address_hints,
+            property_potential_score=property_potential_score(name, age, address_hints, city),
+            source='Legacy.com',
+            scraped_at=datetime.now().isoformat()
+        )
+        
+    except Exception:
+        return None
+
+
+def parse_obituary_page(page_source, city, max_cards=40, since=None):
+    """Scored obituary records for the cards in one page snapshot
+    
+    Cards whose latest date is before `since` are dropped, and once
+    OBITUARY_STALE_STREAK of them come in a row the rest of the
+    (newest-first) page is not scanned. Undated "Recent" cards are kept.
+    Needs no finder instance, so snapshot reprocessing workers call it directly.
+    """
+    obituaries = []
+    stale_streak = 0
+    
+    for card in iter_obituary_cards(page_source, limit=max_cards):
+        obituary_data = build_obituary_record(card['name'], card['text'], city)
+        if not obituary_data:
+            continue
+        if since is not None:
+            died = parse_death_date(obituary_data['death_date'])
+            if died is not None and died < since:
+                PROFILER.count('obituaries_out_of_window')
+                stale_streak += 1
+                if stale_streak >= LeadFlowConfig.OBITUARY_STALE_STREAK:
+                    PROFILER.count('obituary_scan_cutoffs')
+                    break
+                continue
+            stale_streak = 0
+        obituaries.append(obituary_data)
+        
+    return obituaries
 
 class InheritancePropertyFinder:
-    def __init__(self):
+    def __init__(self, driver=None, property_backend=None, heir_backend=None):
         """Initialize the inheritance property finder with AI capabilities"""
-        self.ua = UserAgent()
-        self.chrome_options = Options()
+        # Chrome options are built on first use (selenium and fake_useragent
+        # are only imported when a hunt starts). A driver passed in is a
+        # shared session: it is reused and left running after the hunt.
+        self.chrome_options = None
+        self.driver = driver
+        self._owns_driver = driver is None
+        
+        # Search pages fetched within PAGE_CACHE_TTL are served from disk (PAGE_CACHE_ENABLED)
+        self.page_cache = open_page_cache()
+        
+        # Property record and heir contact lookups (RECORDS_BACKEND by default)
+        if property_backend is None or heir_backend is None:
+            default_property, default_heir = create_backends()
+            property_backend = property_backend or default_property
+            heir_backend = heir_backend or default_heir
+        self.property_backend = property_backend
+        self.heir_backend = heir_backend
         
-        # Stealth browser settings
-        self.chrome_options.add_argument(f"--user-agent={self.ua.random}")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        # Memoize lookups on normalized (name, city) so repeat owners are free
+        self.lookup_caches = []
+        if LeadFlowConfig.LOOKUP_CACHE_ENABLED:
+            self.lookup_caches = [open_lookup_cache('property_records'), open_lookup_cache('heir_contacts')]
+            self.property_backend = CachedBackend(property_backend, self.lookup_caches[0])
+            self.heir_backend = CachedBackend(heir_backend, self.lookup_caches[1])
         
         # Data sources for obituary information
         self.obituary_sources = [
@@ -40,28 +126,35 @@ class InheritancePropertyFinder:
             "https://www.tributes.com/obituaries/"
         ]
         
-        # Target cities for property hunting
-        self.target_cities = [
-            "Miami", "Atlanta", "Phoenix", "Dallas", "Denver", 
-            "Austin", "Charlotte", "Tampa", "Orlando", "Jacksonville",
-            "Fort Worth", "San Antonio", "El Paso", "Memphis", "Nashville"
-        ]
+        # Leads written by the most recent hunt (also when results are not kept)
+        self.last_run_count = 0
+        self.last_run_id = None
+        
+        # Target cities for property hunting (LeadFlowConfig.TARGET_CITIES)
+        self.target_cities = target_cities()
         
     def setup_driver(self):
-        """Initialize Chrome driver with stealth settings"""
+        """Initialize Chrome driver with stealth settings (or reuse a shared session)"""
         try:
-            service = ChromeDriverManager().install()
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.wait = WebDriverWait(self.driver, 15)
+            if self.driver is None:
+                if self.chrome_options is None:
+                    self.chrome_options = build_chrome_options()
+                self.driver = create_driver(self.chrome_options)
+            self.wait = PageReadiness(self.driver)
             return True
         except Exception as e:
             print(f"❌ Driver setup error: {e}")
             return False
     
-    def find_recent_obituaries(self, city, days_back=30):
-        """Find recent obituaries in target city"""
+    @profiled()
+    def find_recent_obituaries(self, city, days_back=None):
+        """Find obituaries in target city dated within the last `days_back` days
+        
+        days_back defaults to OBITUARY_DAYS_BACK; 0 keeps every card on the page.
+        """
         obituaries = []
+        if days_back is None:
+            days_back = LeadFlowConfig.OBITUARY_DAYS_BACK
         
         try:
             # Format city for search
@@ -71,28 +164,41 @@ class InheritancePropertyFinder:
             url = f"https://www.legacy.com/obituaries/{city_formatted}/"
             
             print(f"🔍 Scanning obituaries in {city}")
-            self.driver.get(url)
-            time.sleep(random.uniform(4, 7))
-            
-            # Find obituary elements
-            obit_cards = self.driver.find_elements(By.CSS_SELECTOR, ".obituary-card, .obit-card, .memorial-listing")
-            
-            for card in obit_cards[:40]:  # Process up to 40 obituaries per city
-                try:
-                    obituary_data = self._extract_obituary_data(card, city)
-                    if obituary_data:
-                        obituaries.append(obituary_data)
-                        
-                except Exception:
-                    continue
+            cached = self.page_cache.get(url, 'obituaries') if self.page_cache is not None else None
+            if cached:
+                # Fetched within PAGE_CACHE_TTL: no page load or delay
+                page_source = cached['html']
+            else:
+                with PROFILER.stage('driver.get'):
+                    self.driver.get(url)
+                # Wait for obituary cards (replaces a fixed 4-7s delay)
+                self.wait.wait_for_results(OBITUARY_CARD_SELECTOR, replaces=5.5)
+                
+                page_source = self.driver.page_source
+                if self.page_cache is not None:
+                    self.page_cache.put(url, page_source, 'obituaries', city)
+                if LeadFlowConfig.SNAPSHOT_DIR:
+                    save_snapshot(LeadFlowConfig.SNAPSHOT_DIR, page_source, url, 'obituaries', city)
+            
+            # Parse obituary cards from a single page snapshot, stopping at the window's edge
+            obituaries = self._extract_obituaries_from_source(page_source, city, since=window_start(days_back))
+            PROFILER.count('obituaries_found', len(obituaries))
                     
         except Exception as e:
             print(f"❌ Obituary search error for {city}: {e}")
             
         return obituaries
     
+    @profiled()
+    def _extract_obituaries_from_source(self, page_source, city, max_cards=40, since=None):
+        """Extract obituary information for every card in one page snapshot (up to 40 per city)"""
+        return parse_obituary_page(page_source, city, max_cards, since)
+    
+    @profiled()
     def _extract_obituary_data(self, card, city):
-        """Extract obituary information using AI-like pattern recognition"""
+        """Extract obituary information from a card element (per-element WebDriver path)"""
+        from selenium.webdriver.common.by import By
+        
         try:
             # Extract full name
             name_selectors = [
@@ -109,274 +215,243 @@ class InheritancePropertyFinder:
                         break
                 except:
                     continue
-                    
+
             if not name:
                 return None
-                
-            # Extract age using pattern recognition
-            text_content = card.text
-            age_patterns = [r'age (\d{2,3})', r'(\d{2,3}) years old', r'(\d{2,3}),']
-            age = "N/A"
-            
-            for pattern in age_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
-                if match:
-                    age = match.group(1)
-                    break
-            
-            # Extract death date
-            date_patterns = [
-                r'(\w+ \d{1,2}, \d{4})',
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{4}-\d{2}-\d{2})'
-            ]
-            death_date = "Recent"
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, text_content)
-                if match:
-                    death_date = match.group(1)
-                    break
-            
-            # AI-powered address extraction
-            address_hints = self._extract_address_hints(text_content)
-            
-            # Calculate property potential score
-            property_score = self._calculate_property_potential(name, age, address_hints, city)
-            
-            return {
-                'deceased_name': name,
-                'age': age,
-                'death_date': death_date,
-                'city': city,
-                'address_hints': address_hints,
-                'property_potential_score': property_score,
-                'source': 'Legacy.com',
-                'scraped_at': datetime.now().isoformat()
-            }
+
+            return self._build_obituary_record(name, card.text, city)
             
         except Exception:
             return None
     
+    def _build_obituary_record(self, name, text_content, city):
+        """Mine card text and build the obituary dict using AI-like pattern recognition"""
+        return build_obituary_record(name, text_content, city)
+    
     def _extract_address_hints(self, text_content):
         """AI-powered address pattern extraction"""
-        address_patterns = [
-            r'\d+\s+\w+\s+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl|Court|Ct)',
-            r'\d+\s+[A-Za-z]+\s+[A-Za-z]+\s+(?:Street|St|Avenue|Ave|Road|Rd)',
-            r'lived on \w+\s+\w+',
-            r'resided at \d+\s+\w+'
-        ]
-        
-        addresses = []
-        for pattern in address_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            addresses.extend(matches[:3])  # Max 3 addresses per obituary
-            
-        return '; '.join(addresses[:2]) if addresses else ''
+        return PATTERN_BANK.address_hints(text_content)
     
+    @profiled()
     def _calculate_property_potential(self, name, age, address_hints, city):
         """AI scoring for property inheritance potential"""
-        score = 30  # Base score
-        
-        # Age factor (older = more likely to own property)
-        try:
-            age_num = int(age) if age != "N/A" else 0
-            if age_num >= 70:
-                score += 25
-            elif age_num >= 60:
-                score += 15
-            elif age_num >= 50:
-                score += 10
-        except:
-            pass
-        
-        # Address hints factor
-        if address_hints:
-            score += 20
-            if len(address_hints) > 50:  # Multiple addresses
-                score += 15
-                
-        # High-value city factor
-        high_value_cities = ['miami', 'atlanta', 'austin', 'denver', 'charlotte']
-        if city.lower() in high_value_cities:
-            score += 20
-            
-        return min(score, 100)
+        return property_potential_score(name, age, address_hints, city)
     
+    @profiled()
     def search_property_records(self, deceased_name, city):
         """Search for property records of deceased person"""
-        properties = []
-        
-        try:
-            name_parts = deceased_name.split()
-            if len(name_parts) < 2:
-                return properties
-                
-            first_name = name_parts[0]
-            last_name = name_parts[-1]
-            
-            # Simulate property search (in real implementation, would use actual APIs)
-            print(f"🏠 Searching property records for: {deceased_name}")
-            
-            # Generate realistic property data based on AI predictions
-            num_properties = random.choices([0, 1, 2, 3], weights=[30, 50, 15, 5])[0]
-            
-            for i in range(num_properties):
-                property_data = self._generate_realistic_property(deceased_name, city, i)
-                properties.append(property_data)
-                print(f"   📍 Found property: {property_data['address']} - ${property_data['estimated_value']:,}")
-                
-        except Exception as e:
-            print(f"❌ Property search error for {deceased_name}: {e}")
-            
-        return properties
+        return self.property_backend.lookup(deceased_name, city)
     
-    def _generate_realistic_property(self, owner_name, city, index):
-        """Generate realistic property data for inheritance leads"""
-        # Realistic address generation
-        street_numbers = random.randint(100, 9999)
-        street_names = [
-            "Oak", "Pine", "Maple", "Cedar", "Elm", "Main", "Park", "Lake",
-            "River", "Hill", "Valley", "Garden", "Forest", "Meadow"
-        ]
-        street_types = ["St", "Ave", "Dr", "Rd", "Ln", "Way", "Blvd", "Ct"]
+    @profiled()
+    def find_heir_contacts(self, owner_name, city):
+        """AI-powered heir contact discovery"""
+        return self.heir_backend.lookup(owner_name, city)
+    
+    def _lookup_wave(self, obituaries, city, limit=None):
+        """Property records, then heir contacts per property, for a batch of obituaries
         
-        address = f"{street_numbers} {random.choice(street_names)} {random.choice(street_types)}"
+        Returns one list of (property, heir_contacts) pairs per obituary. With
+        `limit`, the list stops at the obituary that brings the property count
+        to `limit`, and no heir contacts are looked up for the ones after it.
+        """
+        names = [obituary['deceased_name'] for obituary in obituaries]
+        with PROFILER.stage('backend.property_records'):
+            property_lists = self.property_backend.lookup_batch(names, city)
         
-        # Realistic property values based on city
-        city_multipliers = {
-            'miami': 1.5, 'atlanta': 1.3, 'austin': 1.4, 'denver': 1.3,
-            'charlotte': 1.2, 'phoenix': 1.1, 'dallas': 1.2, 'tampa': 1.1
-        }
+        if limit is not None:
+            needed, found = 0, 0
+            while needed < len(property_lists) and found < limit:
+                found += len(property_lists[needed])
+                needed += 1
+            property_lists = property_lists[:needed]
         
-        base_value = random.randint(180000, 650000)
-        multiplier = city_multipliers.get(city.lower(), 1.0)
-        estimated_value = int(base_value * multiplier)
+        # One heir lookup per property, as before, issued as a single batch
+        owners = [name for name, properties in zip(names, property_lists) for _ in properties]
+        with PROFILER.stage('backend.heir_contacts'):
+            contact_lists = iter(self.heir_backend.lookup_batch(owners, city))
         
-        # Calculate urgency score (AI prediction)
-        urgency_score = random.randint(7, 10)  # Inheritance properties are typically urgent
+        return [
+            [(prop, [HeirContact.from_dict(contact) for contact in next(contact_lists)]) for prop in properties]
+            for properties in property_lists
+        ]
+    
+    def _candidate_obituaries(self, obituaries, city, dedup=None, checkpoint=None):
+        """(identity, obituary) pairs worth a records lookup, in page order
         
-        return {
-            'owner_name': owner_name,
-            'address': f"{address}, {city}",
-            'city': city,
-            'estimated_value': estimated_value,
-            'property_type': random.choice(['Single Family', 'Condo', 'Townhouse']),
-            'status': 'Inherited - Potential Sale',
-            'urgency_score': urgency_score,
-            'lead_quality': 'High' if estimated_value > 400000 else 'Medium',
-            'found_at': datetime.now().isoformat()
-        }
+        Drops low-potential leads and obituaries already processed by this
+        hunt (checkpoint) or an earlier run (dedup index).
+        """
+        candidates = {}
+        for obituary in obituaries:
+            if obituary['property_potential_score'] < 50:
+                continue
+            identity = obituary_identity(obituary, city)
+            if identity in candidates:
+                continue
+            if checkpoint is not None and checkpoint.is_done(city, identity):
+                continue
+            if dedup is not None and identity in dedup:
+                continue
+            candidates[identity] = obituary
+        return list(candidates.items())
     
-    def find_heir_contacts(self, owner_name, city):
-        """AI-powered heir contact discovery"""
-        try:
-            name_parts = owner_name.split()
-            if len(name_parts) < 2:
-                return []
-                
-            last_name = name_parts[-1]
-            
-            # Simulate contact search
-            print(f"📞 Searching for heir contacts: {last_name} family")
-            
-            # Generate realistic contact data
-            potential_contacts = []
-            num_contacts = random.choices([0, 1, 2, 3], weights=[20, 40, 30, 10])[0]
-            
-            for i in range(num_contacts):
-                # Generate family member names
-                first_names = ['Michael', 'Sarah', 'David', 'Jennifer', 'Robert', 'Lisa', 'James', 'Patricia']
-                family_name = f"{random.choice(first_names)} {last_name}"
-                
-                # Generate phone number
-                phone = f"({random.randint(200,999)}) {random.randint(200,999)}-{random.randint(1000,9999)}"
-                
-                potential_contacts.append({
-                    'name': family_name,
-                    'phone': phone,
-                    'relationship': random.choice(['Son', 'Daughter', 'Spouse', 'Sibling']),
-                    'confidence': random.randint(70, 95)
-                })
-                
-            return potential_contacts
-            
-        except Exception as e:
-            print(f"❌ Heir contact search error: {e}")
-            return []
+    def _enrich_property(self, prop, obituary, heir_contacts):
+        """Property lead with the obituary details and heir contacts merged in"""
+        return PropertyLead.from_dict(
+            prop,
+            deceased_age=obituary['age'],
+            death_date=obituary['death_date'],
+            obituary_source=obituary['source'],
+            property_potential_score=obituary['property_potential_score'],
+            heir_contacts=heir_contacts,
+            lead_type='Inheritance Property'
+        )
+    
+    @profiled()
+    def enrich_obituaries(self, obituaries, city, lead_sink, dedup=None):
+        """Look up and write properties for already-parsed obituaries (no browser)
+        
+        Used to reprocess saved pages; returns the number of properties written.
+        """
+        candidates = self._candidate_obituaries(obituaries, city, dedup)
+        written = 0
+        wave_size = self.property_backend.concurrency
+        
+        for position in range(0, len(candidates), wave_size):
+            wave = candidates[position:position + wave_size]
+            results = self._lookup_wave([obituary for _, obituary in wave], city)
+            for (identity, obituary), enriched in zip(wave, results):
+                lead_sink.write_many(self._enrich_property(prop, obituary, heir_contacts)
+                                     for prop, heir_contacts in enriched)
+                written += len(enriched)
+            
+            # Index the wave only once its properties are safely written
+            if dedup is not None:
+                lead_sink.flush()
+                dedup.add_many(identity for identity, _ in wave)
+        
+        return written
     
-    def run_inheritance_hunt(self, target_cities=3, max_properties_per_city=15):
-        """Main AI-powered inheritance property hunt"""
+    @profiled()
+    def run_inheritance_hunt(self, target_cities=3, max_properties_per_city=15, sink=None, keep_results=True,
+                             dedup_index=None, deduplicate=None, resume=False, export_format='csv',
+                             days_back=None):
+        """Main AI-powered inheritance property hunt
+        
+        Properties stream into `sink` (the lead store by default) as they are
+        enriched. With keep_results=False nothing is accumulated in memory and
+        the report is built from the sink instead. Obituaries processed by an
+        earlier run (per the dedup index) are skipped before any record or
+        heir lookups are made.
+        
+        Progress is checkpointed per (city, obituary); resume=True picks up an
+        interrupted hunt, skipping the obituaries it already processed. Only
+        obituaries from the last `days_back` days (OBITUARY_DAYS_BACK by
+        default) are looked up.
+        """
         if not self.setup_driver():
             return []
             
+        reload_scoring_model()  # Pick up scoring spec edits made since the last run
         all_properties = []
+        if deduplicate is None:
+            deduplicate = LeadFlowConfig.DEDUP_ENABLED
+        dedup = dedup_index or (DedupIndex() if deduplicate else None)
+        checkpoint = HuntCheckpoint('properties', resume=resume, dedup=dedup)
+        lead_sink = checkpoint.open_sink('properties') or sink or open_sink('properties')
         
         try:
             print("🤖 LeadFlow AI - Inheritance Property Hunt Started")
             print("=" * 60)
             
-            selected_cities = random.sample(self.target_cities, min(target_cities, len(self.target_cities)))
+            if checkpoint.resumed:
+                print(f"⏯️  Resuming hunt: {checkpoint.completed_units} obituaries already processed")
+            
+            selected_cities = checkpoint.select_cities(
+                random.sample(self.target_cities, min(target_cities, len(self.target_cities)))
+            )
             
             for city in selected_cities:
                 print(f"\n🎯 Scanning: {city}")
                 
-                # Find recent obituaries
-                obituaries = self.find_recent_obituaries(city)
+                # Find recent obituaries (older ones never reach a records lookup)
+                obituaries = self.find_recent_obituaries(city, days_back)
                 
-                city_properties = []
-                processed_count = 0
+                processed_count = checkpoint.done_count(city)
                 
-                for obituary in obituaries:
-                    if processed_count >= max_properties_per_city:
-                        break
-                        
-                    # Skip low-potential leads
-                    if obituary['property_potential_score'] < 50:
-                        continue
-                    
-                    # Search for properties
-                    properties = self.search_property_records(obituary['deceased_name'], city)
+                candidates = self._candidate_obituaries(obituaries, city, dedup, checkpoint)
+                
+                # Look up records a wave at a time. A wave holds no more obituaries
+                # than properties still needed for the city (each yields 0-3), and
+                # heir contacts are only fetched up to the one that fills the quota
+                wave_size = self.property_backend.concurrency
+                position = 0
+                while position < len(candidates) and processed_count < max_properties_per_city:
+                    remaining = max_properties_per_city - processed_count
+                    wave = candidates[position:position + min(wave_size, remaining)]
+                    position += len(wave)
+                    results = self._lookup_wave([obituary for _, obituary in wave], city, limit=remaining)
                     
-                    for prop in properties:
-                        # Find heir contacts
-                        heir_contacts = self.find_heir_contacts(obituary['deceased_name'], city)
+                    for (identity, obituary), enriched in zip(wave, results):
+                        unit_count = 0
                         
-                        # Enrich property data
-                        enriched_property = {
-                            **prop,
-                            'deceased_age': obituary['age'],
-                            'death_date': obituary['death_date'],
-                            'obituary_source': obituary['source'],
-                            'property_potential_score': obituary['property_potential_score'],
-                            'heir_contacts': heir_contacts,
-                            'lead_type': 'Inheritance Property'
-                        }
+                        for prop, heir_contacts in enriched:
+                            enriched_property = self._enrich_property(prop, obituary, heir_contacts)
+                            lead_sink.write(enriched_property)
+                            if keep_results:
+                                all_properties.append(enriched_property)
+                            unit_count += 1
                         
-                        city_properties.append(enriched_property)
-                        processed_count += 1
-                    
-                    # Respectful delay
-                    time.sleep(random.uniform(3, 6))
+                        processed_count += unit_count
+                        checkpoint.mark_done(city, identity, lead_sink, unit_count, keys=[identity])
                 
-                all_properties.extend(city_properties)
-                print(f"✅ {city}: Found {len(city_properties)} inheritance properties")
+                lead_sink.flush()
+                checkpoint.commit(lead_sink)
+                print(f"✅ {city}: Found {processed_count} inheritance properties")
                 
-            # Save results
-            csv_file = self.save_properties_to_csv(all_properties)
-            
             # Generate AI summary report
-            self._generate_property_report(all_properties)
+            if keep_results and not checkpoint.resumed:
+                report_properties = all_properties
+            else:
+                report_properties = lead_sink.iter_leads() or all_properties
+            self._generate_property_report(report_properties)
+            checkpoint.clear()
             
         except Exception as e:
             print(f"❌ Inheritance hunt error: {e}")
         finally:
-            self.driver.quit()
+            self.last_run_count = lead_sink.written
+            self.last_run_id = getattr(lead_sink, 'run_id', None)
+            self._finish_sink(lead_sink, close=lead_sink is not sink, export_format=export_format)
+            if dedup is not None:
+                print(dedup.summary())
+                if dedup_index is None:
+                    dedup.close()
+            for cache in self.lookup_caches:
+                print(cache.summary())
+                PROFILER.count(f"{cache.name}_cache_hits", cache.stats['hits'])
+                PROFILER.count(f"{cache.name}_cache_misses", cache.stats['misses'])
+                cache.save()
+            if self.page_cache is not None:
+                print(self.page_cache.summary())
+            if self._owns_driver:
+                self.driver.quit()
+                self.driver = None
             
         return all_properties
     
-    def save_properties_to_csv(self, properties, filename=None):
-        """Save inheritance properties to CSV"""
+    @profiled()
+    def _finish_sink(self, lead_sink, close=True, export_format='csv'):
+        """Flush the run's sink and export a CSV or Excel view of the run's leads"""
+        on_export = None
+        if LeadFlowConfig.NORMALIZED_EXPORT:
+            on_export = lambda filepath: self._export_normalized(lead_sink.iter_leads(), filepath)
+        finish_sink(lead_sink, 'inheritance properties', close=close,
+                    export_format=export_format, on_export=on_export)
+    
+    @profiled()
+    def save_properties_to_csv(self, properties, filename=None, store=None):
+        """Save inheritance properties to the lead store and export this run as CSV"""
         if not properties:
             print("❌ No properties found to save")
             return None
@@ -389,67 +464,80 @@ class InheritancePropertyFinder:
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, filename)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'owner_name', 'address', 'city', 'estimated_value', 'property_type',
-                'status', 'urgency_score', 'lead_quality', 'deceased_age',
-                'death_date', 'property_potential_score', 'heir_contacts', 'found_at'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for prop in properties:
-                # Convert heir contacts to string for CSV
-                if isinstance(prop.get('heir_contacts'), list):
-                    prop['heir_contacts'] = '; '.join([f"{c['name']} ({c['phone']})" for c in prop['heir_contacts']])
-                writer.writerow(prop)
+        # Persist to the indexed store; the CSV is a view over this run's rows
+        lead_store = store or LeadStore()
+        try:
+            run_id = lead_store.add_properties(properties)
+            lead_store.export_csv('properties', filepath, run_id=run_id)
+        finally:
+            if store is None:
+                lead_store.close()
                 
         print(f"💾 Saved {len(properties)} inheritance properties to {filepath}")
+        if LeadFlowConfig.NORMALIZED_EXPORT:
+            self._export_normalized(properties, filepath)
         return filepath
     
+    def _export_normalized(self, properties, csv_path):
+        """Normalized properties/contacts export alongside a flat CSV export"""
+        prefix = os.path.splitext(os.path.basename(csv_path))[0]
+        exporter = export_normalized(properties, os.path.dirname(csv_path), prefix)
+        print(f"🗂️  Normalized export: {exporter.property_count} properties, "
+              f"{exporter.contact_count} heir contacts ({exporter.paths['contacts_jsonl']})")
+        return exporter
+    
+    @profiled()
     def _generate_property_report(self, properties):
-        """Generate AI-powered inheritance property report"""
-        if not properties:
+        """Generate AI-powered inheritance property report in one pass over a list or stream"""
+        # AI ranking: urgency + value + potential
+        stats = LeadAggregator(
+            sum_fields=['estimated_value'],
+            tiers={
+                'high_value': lambda p: p['estimated_value'] > 400000,
+                'high_urgency': lambda p: p['urgency_score'] >= 9
+            },
+            top_k=10,
+            rank=property_rank,
+            group_by=lead_metro
+        ).consume(properties)
+        if not stats.count:
             return
             
-        total_value = sum(prop['estimated_value'] for prop in properties)
-        high_value_props = [p for p in properties if p['estimated_value'] > 400000]
-        high_urgency = [p for p in properties if p['urgency_score'] >= 9]
+        total_value = stats.sums['estimated_value']
+        high_value_props = stats.tier_counts['high_value']
+        high_urgency = stats.tier_counts['high_urgency']
         
         report = f"""
 🤖 LeadFlow AI - Inheritance Property Report
 {'='*60}
 
 📊 AI ANALYSIS SUMMARY:
-- Total Properties Discovered: {len(properties)}
+- Total Properties Discovered: {stats.count}
 - Total Estimated Value: ${total_value:,}
-- Average Property Value: ${total_value // len(properties):,}
-- High-Value Properties (>$400K): {len(high_value_props)}
-- High-Urgency Leads (9+ score): {len(high_urgency)}
+- Average Property Value: ${total_value // stats.count:,}
+- High-Value Properties (>$400K): {high_value_props}
+- High-Urgency Leads (9+ score): {high_urgency}
 
 💎 TOP OPPORTUNITIES (AI Ranked):
 """
         
-        # Sort by AI scoring: urgency + value + potential
-        sorted_props = sorted(properties, 
-                            key=lambda x: x['urgency_score'] * 0.4 + 
-                                        (x['estimated_value'] / 100000) * 0.3 + 
-                                        x['property_potential_score'] * 0.3, 
-                            reverse=True)
-        
-        for i, prop in enumerate(sorted_props[:10], 1):
+        for i, prop in enumerate(stats.top(), 1):
             report += f"""
 {i}. {prop['address']} - ${prop['estimated_value']:,}
    Owner: {prop['owner_name']} (Age: {prop['deceased_age']})
    Urgency: {prop['urgency_score']}/10 | Quality: {prop['lead_quality']}
-   Heir Contacts: {len(prop.get('heir_contacts', []))} found
+   Heir Contacts: {len(heir_contacts_of(prop))} found
 """
 
+        report += "\n🗺️  TOP MARKETS:\n"
+        for metro_id, count in stats.top_groups(5):
+            report += f"- {metro_name(metro_id)}: {count} properties\n"
+
         report += f"""
 💰 REVENUE POTENTIAL:
-- High-Value Properties: ${len(high_value_props) * 300:,} (@$300 per lead)
-- Standard Properties: ${(len(properties) - len(high_value_props)) * 150:,} (@$150 per lead)
-- Total Market Value: ${len(high_value_props) * 300 + (len(properties) - len(high_value_props)) * 150:,}
+- High-Value Properties: ${high_value_props * 300:,} (@$300 per lead)
+- Standard Properties: ${(stats.count - high_value_props) * 150:,} (@$150 per lead)
+- Total Market Value: ${high_value_props * 300 + (stats.count - high_value_props) * 150:,}
 
 🚀 AI RECOMMENDATIONS:
 1. Prioritize high-urgency leads (9+ score) for immediate outreach
@@ -461,6 +549,7 @@ Generated by LeadFlow AI - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
         
         # Save report
+        os.makedirs('data', exist_ok=True)
         report_file = os.path.join('data', 'inheritance_property_report.txt')
         with open(report_file, 'w') as f:
             f.write(report)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Property Record & Heir Contact Backends
+Pluggable lookup sources with an asyncio batch API and bounded concurrency
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime
+from urllib.error import URLError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from config.settings import LeadFlowConfig
+from src.extraction.gazetteer import normalize_location
+from src.instrumentation.profiler import PROFILER
+from src.storage.lookup_cache import lookup_key
+
+BACKEND_KINDS = ['local', 'http']
+
+
+class LookupBackend:
+    """A source that maps (name, city) to a list of records
+
+    Subclasses implement lookup(); lookup_many() runs a batch of names with
+    at most `concurrency` lookups in flight. Only remote backends wait
+    between requests.
+    """
+
+    remote = False
+
+    def __init__(self, concurrency=None, delay_range=None):
+        self.concurrency = max(concurrency or LeadFlowConfig.BACKEND_CONCURRENCY, 1)
+        self.delay_range = delay_range if self.remote else None
+
+    @property
+    def label(self):
+        return type(self).__name__
+
+    def lookup(self, name, city):
+        """Records for one name (blocking)"""
+        raise NotImplementedError
+
+    async def lookup_async(self, name, city):
+        """Records for one name without blocking the event loop"""
+        if not self.remote:
+            return self.lookup(name, city)
+        if self.delay_range:
+            # Respectful delay, charged per request to the remote source
+            delay = random.uniform(*self.delay_range)
+            PROFILER.count('backend_delay_seconds', delay)
+            await asyncio.sleep(delay)
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        return await asyncio.get_running_loop().run_in_executor(None, self.lookup, name, city)
+
+    async def lookup_many(self, names, city):
+        """Records for every name, in input order"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(name):
+            async with semaphore:
+                return await self.lookup_async(name, city)
+
+        return await asyncio.gather(*(bounded(name) for name in names))
+
+    def lookup_batch(self, names, city):
+        """Blocking wrapper around lookup_many() for synchronous callers"""
+        if not names:
+            return []
+        PROFILER.count(f"{self.label}.lookups", len(names))
+        return asyncio.run(self.lookup_many(names, city))
+
+
+class LocalPropertyRecords(LookupBackend):
+    """Simulated property records (in real implementation, would use actual APIs)"""
+
+    def lookup(self, deceased_name, city):
+        properties = []
+
+        try:
+            name_parts = deceased_name.split()
+            if len(name_parts) < 2:
+                return properties
+
+            # Simulate property search
+            print(f"🏠 Searching property records for: {deceased_name}")
+
+            # Generate realistic property data based on AI predictions
+            num_properties = random.choices([0, 1, 2, 3], weights=[30, 50, 15, 5])[0]
+
+            for i in range(num_properties):
+                property_data = self._generate_realistic_property(deceased_name, city, i)
+                properties.append(property_data)
+                print(f"   📍 Found property: {property_data['address']} - ${property_data['estimated_value']:,}")
+
+        except Exception as e:
+            print(f"❌ Property search error for {deceased_name}: {e}")
+
+        return properties
+
+    def _generate_realistic_property(self, owner_name, city, index):
+        """Generate realistic property data for inheritance leads"""
+        # Realistic address generation
+        street_numbers = random.randint(100, 9999)
+        street_names = [
+            "Oak", "Pine", "Maple", "Cedar", "Elm", "Main", "Park", "Lake",
+            "River", "Hill", "Valley", "Garden", "Forest", "Meadow"
+        ]
+        street_types = ["St", "Ave", "Dr", "Rd", "Ln", "Way", "Blvd", "Ct"]
+
+        address = f"{street_numbers} {random.choice(street_names)} {random.choice(street_types)}"
+
+        # Realistic property values based on metro
+        metro_multipliers = {
+            'miami': 1.5, 'atlanta': 1.3, 'austin': 1.4, 'denver': 1.3,
+            'charlotte': 1.2, 'phoenix': 1.1, 'dallas': 1.2, 'tampa': 1.1
+        }
+
+        base_value = random.randint(180000, 650000)
+        multiplier = metro_multipliers.get(normalize_location(city), 1.0)
+        estimated_value = int(base_value * multiplier)
+
+        # Calculate urgency score (AI prediction)
+        urgency_score = random.randint(7, 10)  # Inheritance properties are typically urgent
+
+        return {
+            'owner_name': owner_name,
+            'address': f"{address}, {city}",
+            'city': city,
+            'estimated_value': estimated_value,
+            'property_type': random.choice(['Single Family', 'Condo', 'Townhouse']),
+            'status': 'Inherited - Potential Sale',
+            'urgency_score': urgency_score,
+            'lead_quality': 'High' if estimated_value > 400000 else 'Medium',
+            'found_at': datetime.now().isoformat()
+        }
+
+
+class LocalHeirContacts(LookupBackend):
+    """Simulated heir contact discovery"""
+
+    def lookup(self, owner_name, city):
+        try:
+            name_parts = owner_name.split()
+            if len(name_parts) < 2:
+                return []
+
+            last_name = name_parts[-1]
+
+            # Simulate contact search
+            print(f"📞 Searching for heir contacts: {last_name} family")
+
+            # Generate realistic contact data
+            potential_contacts = []
+            num_contacts = random.choices([0, 1, 2, 3], weights=[20, 40, 30, 10])[0]
+
+            for i in range(num_contacts):
+                # Generate family member names
+                first_names = ['Michael', 'Sarah', 'David', 'Jennifer', 'Robert', 'Lisa', 'James', 'Patricia']
+                family_name = f"{random.choice(first_names)} {last_name}"
+
+                # Generate phone number
+                phone = f"({random.randint(200,999)}) {random.randint(200,999)}-{random.randint(1000,9999)}"
+
+                potential_contacts.append({
+                    'name': family_name,
+                    'phone': phone,
+                    'relationship': random.choice(['Son', 'Daughter', 'Spouse', 'Sibling']),
+                    'confidence': random.randint(70, 95)
+                })
+
+            return potential_contacts
+
+        except Exception as e:
+            print(f"❌ Heir contact search error: {e}")
+            return []
+
+
+class HttpLookupBackend(LookupBackend):
+    """JSON-over-HTTP lookup: GET {base_url}{endpoint}?name=...&city=... -> [records]"""
+
+    remote = True
+    endpoint = ''
+
+    def __init__(self, base_url=None, concurrency=None, delay_range=None, timeout=None):
+        super().__init__(
+            concurrency,
+            LeadFlowConfig.REMOTE_LOOKUP_DELAY if delay_range is None else delay_range
+        )
+        self.base_url = (base_url or LeadFlowConfig.RECORDS_API_URL).rstrip('/')
+        self.timeout = timeout or LeadFlowConfig.RECORDS_API_TIMEOUT
+
+    def lookup(self, name, city):
+        url = f"{self.base_url}{self.endpoint}?{urlencode({'name': name, 'city': city})}"
+        try:
+            with urlopen(url, timeout=self.timeout) as response:
+                records = json.loads(response.read().decode('utf-8'))
+            return records if isinstance(records, list) else []
+        except (URLError, OSError, ValueError) as e:
+            print(f"❌ Lookup error for {name} ({url}): {e}")
+            return []
+
+
+class HttpPropertyRecords(HttpLookupBackend):
+    """Property records from a remote records API"""
+
+    endpoint = '/properties'
+
+
+class HttpHeirContacts(HttpLookupBackend):
+    """Heir contacts from a remote records API"""
+
+    endpoint = '/heirs'
+
+
+class CachedBackend(LookupBackend):
+    """Memoizes another backend's lookups in a LookupCache
+
+    A batch only sends the backend the (normalized) names it has not seen,
+    each once, so repeated owners cost a single lookup.
+    """
+
+    def __init__(self, backend, cache):
+        self.backend = backend
+        self.cache = cache
+        self.remote = backend.remote
+        self.concurrency = backend.concurrency
+        self.delay_range = backend.delay_range
+
+    @property
+    def label(self):
+        return f"{self.backend.label}.cached"
+
+    def lookup(self, name, city):
+        records = self.cache.get(name, city)
+        if records is None:
+            records = self.backend.lookup(name, city)
+            self.cache.put(name, city, records)
+        return records
+
+    async def lookup_many(self, names, city):
+        results = {}
+        missing = {}
+        for name in names:
+            key = lookup_key(name, city)
+            if key in results or key in missing:
+                continue
+            records = self.cache.get(name, city)
+            if records is None:
+                missing[key] = name
+            else:
+                results[key] = records
+
+        PROFILER.count(f"{self.backend.label}.lookups", len(missing))
+        fetched = await self.backend.lookup_many(list(missing.values()), city)
+        for (key, name), records in zip(missing.items(), fetched):
+            self.cache.put(name, city, records)
+            results[key] = records
+
+        return [results[lookup_key(name, city)] for name in names]
+
+
+def create_backends(kind=None):
+    """(property_backend, heir_backend) for 'local' or 'http'"""
+    kind = kind or LeadFlowConfig.RECORDS_BACKEND
+    if kind == 'local':
+        return LocalPropertyRecords(), LocalHeirContacts()
+    if kind == 'http':
+        return HttpPropertyRecords(), HttpHeirContacts()
+    raise ValueError(f"Unknown records backend: {kind} (choose from {', '.join(BACKEND_KINDS)})")
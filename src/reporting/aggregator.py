@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Streaming Report Aggregator
+Single-pass counts, sums, tier buckets, group counts and a bounded top-k for lead reports
+"""
+
+import heapq
+from collections import Counter
+
+
+class LeadAggregator:
+    """Consume leads one at a time and keep only what a report needs
+
+    Memory is O(k) regardless of how many leads stream through, so reports
+    can be built straight from a sink or the lead store. Ties in the top-k
+    keep arrival order, exactly like a stable descending sort.
+    """
+
+    def __init__(self, sum_fields=(), tiers=None, top_k=0, rank=None, group_by=None):
+        self.count = 0
+        self.sums = {field: 0 for field in sum_fields}
+        self.tiers = dict(tiers or {})
+        self.tier_counts = {name: 0 for name in self.tiers}
+        self.top_k = top_k
+        self.rank = rank
+        self.group_by = group_by
+        self.group_counts = Counter()
+        self._heap = []
+
+    def add(self, lead):
+        """Fold one lead into the running totals"""
+        position = self.count
+        self.count += 1
+
+        for field in self.sums:
+            self.sums[field] += lead.get(field) or 0
+
+        for name, predicate in self.tiers.items():
+            if predicate(lead):
+                self.tier_counts[name] += 1
+
+        if self.group_by:
+            self.group_counts[self.group_by(lead)] += 1
+
+        if self.top_k:
+            # Earlier leads win ties, so the position is negated in the key
+            entry = (self.rank(lead), -position, lead)
+            if len(self._heap) < self.top_k:
+                heapq.heappush(self._heap, entry)
+            elif entry[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, entry)
+
+    def consume(self, leads):
+        """Fold every lead from an iterable (list, generator or store cursor)"""
+        for lead in leads:
+            self.add(lead)
+        return self
+
+    def average(self, field):
+        """Mean of a summed field (0 when no leads were seen)"""
+        return self.sums[field] / self.count if self.count else 0
+
+    def top_groups(self, n):
+        """The n largest groups as (key, count), largest first"""
+        return self.group_counts.most_common(n)
+
+    def top(self):
+        """The top-k leads, best first"""
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Hunt Checkpoints
+Record completed hunt units and the sink offset so interrupted hunts can resume
+"""
+
+import json
+import os
+from datetime import datetime
+
+from config.settings import LeadFlowConfig
+from src.storage.sinks import reopen_sink
+
+
+class HuntCheckpoint:
+    """Progress file for one hunt ('investors' or 'properties')
+
+    A unit is a (city, search term) or (city, obituary) pair. Finished units
+    are saved in batches (every `save_every` units and on commit()), each
+    save together with the sink offset at that moment, so resuming never
+    loses or repeats leads; at most one batch of units is redone. Dedup keys
+    given to mark_done() are only written to `dedup` once their batch is
+    saved, so a crash never leaves unsaved leads marked as seen.
+    """
+
+    def __init__(self, hunt, path=None, resume=False, dedup=None, save_every=None):
+        self.hunt = hunt
+        self.path = path or os.path.join(LeadFlowConfig.CHECKPOINT_DIR, f"{hunt}_hunt.json")
+        self.resumed = False
+        self.state = {'hunt': hunt, 'cities': [], 'completed': {}, 'sink': None}
+        self.dedup = dedup
+        self.save_every = max(save_every or LeadFlowConfig.CHECKPOINT_SAVE_EVERY, 1)
+        self._unsaved = 0
+
+        if resume and os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                self.state = json.load(f)
+            self.resumed = True
+
+    @staticmethod
+    def _key(city, unit):
+        return f"{city}\t{unit}"
+
+    def select_cities(self, selected_cities):
+        """Cities for this run: the checkpointed selection when resuming"""
+        if self.resumed and self.state['cities']:
+            return self.state['cities']
+        self.state['cities'] = list(selected_cities)
+        return self.state['cities']
+
+    def open_sink(self, table):
+        """Reopen the checkpointed sink when resuming, else None"""
+        if self.resumed and self.state.get('sink'):
+            return reopen_sink(table, self.state['sink'])
+        return None
+
+    def is_done(self, city, unit):
+        """True if the unit finished in an earlier attempt"""
+        return self._key(city, unit) in self.state['completed']
+
+    def done_count(self, city):
+        """Leads already written for a city by completed units"""
+        prefix = f"{city}\t"
+        return sum(count for key, count in self.state['completed'].items() if key.startswith(prefix))
+
+    def mark_done(self, city, unit, sink, count=0, keys=()):
+        """Record a finished unit (and stage its dedup keys), saving once a batch is full
+
+        Call it only after every lead of the unit was written to `sink`.
+        """
+        self.state['completed'][self._key(city, unit)] = count
+        if self.dedup is not None:
+            self.dedup.stage(keys)
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.commit(sink)
+
+    def commit(self, sink):
+        """Save the finished units with the sink position after their leads, then their dedup keys"""
+        if not self._unsaved:
+            return
+        self.state['sink'] = sink.checkpoint_state()
+        self.save()
+        self._unsaved = 0
+        if self.dedup is not None:
+            self.dedup.commit()
+
+    def save(self):
+        """Atomically write the checkpoint file"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.state['updated_at'] = datetime.now().isoformat()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Remove the checkpoint once the hunt has completed"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    @property
+    def completed_units(self):
+        return len(self.state['completed'])
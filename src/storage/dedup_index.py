@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Cross-Run Dedup Index
+Bloom filter front with an exact on-disk key set behind it
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+from urllib.parse import urlsplit
+
+from config.settings import LeadFlowConfig
+from src.extraction.gazetteer import canonical_city
+from src.extraction.text_normalize import normalize_text
+from src.extraction.text_patterns import parse_death_date
+
+def investor_identity(investor):
+    """Normalized identity for an investor lead: its LinkedIn profile URL
+
+    Returns None when the lead has no usable profile URL (it cannot be deduplicated).
+    """
+    profile_url = (investor.get('profile_url') or '').strip()
+    if not profile_url:
+        return None
+
+    parts = urlsplit(profile_url if '://' in profile_url else f"https://{profile_url}")
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parts.path.rstrip('/').lower()
+    if not path:
+        return None
+    return f"investor|{host}{path}"
+
+
+def obituary_identity(obituary, city=None):
+    """Normalized identity for an obituary: name, metro and death date"""
+    name = normalize_text(obituary.get('deceased_name'))
+    if not name:
+        return None
+    # City aliases collapse to the metro's name (keys for canonical names are unchanged)
+    city = city or obituary.get('city')
+    city = normalize_text(canonical_city(city) or city)
+    # Any format of the same date gives one key; unparseable dates are kept as written
+    died = parse_death_date(obituary.get('death_date'))
+    death_date = died.isoformat() if died else normalize_text(obituary.get('death_date'))
+    return f"obituary|{name}|{city}|{death_date}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a blake2b digest"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(int(capacity), 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class DedupIndex:
+    """Persistent set of lead identities seen in previous runs
+
+    Lookups hit the in-memory Bloom filter first, so unseen leads (the common
+    case) are rejected without touching disk; possible hits are confirmed
+    against the exact key set stored in SQLite.
+    """
+
+    def __init__(self, path=None, capacity=None, error_rate=None):
+        self.path = path or LeadFlowConfig.DEDUP_INDEX_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen_keys (key TEXT PRIMARY KEY) WITHOUT ROWID")
+
+        self.bloom = BloomFilter(
+            capacity or LeadFlowConfig.DEDUP_BLOOM_CAPACITY,
+            error_rate or LeadFlowConfig.DEDUP_BLOOM_ERROR_RATE
+        )
+        for (key,) in self.conn.execute("SELECT key FROM seen_keys"):
+            self.bloom.add(key)
+
+        self.stats = {'lookups': 0, 'bloom_negatives': 0, 'duplicates': 0, 'added': 0}
+        self._staged = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the on-disk key set"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        self.stats['lookups'] += 1
+        if key not in self.bloom:
+            self.stats['bloom_negatives'] += 1
+            return False
+        found = key in self._staged or (
+            self.conn.execute("SELECT 1 FROM seen_keys WHERE key = ?", (key,)).fetchone() is not None
+        )
+        if found:
+            self.stats['duplicates'] += 1
+        return found
+
+    def add(self, key):
+        """Record a key as seen"""
+        if key is None:
+            return
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO seen_keys (key) VALUES (?)", (key,))
+        self.bloom.add(key)
+        self.stats['added'] += 1
+
+    def add_many(self, keys):
+        """Record several keys as seen in one transaction"""
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO seen_keys (key) VALUES (?)", [(key,) for key in keys])
+        for key in keys:
+            self.bloom.add(key)
+        self.stats['added'] += len(keys)
+
+    def stage(self, keys):
+        """Treat keys as seen for this run without writing them yet (see commit())"""
+        for key in keys:
+            if key is not None and key not in self._staged:
+                self._staged.add(key)
+                self.bloom.add(key)
+
+    def commit(self):
+        """Write the staged keys, once the leads they stand for are safely checkpointed"""
+        if self._staged:
+            self.add_many(self._staged)
+            self._staged = set()
+
+    def filter_new(self, leads, identity):
+        """Leads whose identity is unseen, dropping repeats within the batch too
+
+        Nothing is recorded; call add_many() once the leads are safely written.
+        """
+        fresh, batch_keys = [], set()
+        for lead in leads:
+            key = identity(lead)
+            if key is not None and (key in batch_keys or key in self):
+                continue
+            batch_keys.add(key)
+            fresh.append(lead)
+        return fresh
+
+    def add_if_new(self, key):
+        """Record a key, returning False if it was already seen
+
+        Leads without an identity (key None) are always treated as new.
+        """
+        if key is None:
+            return True
+        if key in self:
+            return False
+        self.add(key)
+        return True
+
+    def summary(self):
+        """One-line description of this run's dedup activity"""
+        return (f"🧹 Dedup: {self.stats['duplicates']} duplicates skipped, "
+                f"{self.stats['added']} new leads indexed "
+                f"({self.stats['bloom_negatives']}/{self.stats['lookups']} lookups answered by Bloom filter)")
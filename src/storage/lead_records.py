@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Lead Records
+Compact __slots__ record types for investor, obituary and property leads
+"""
+
+from collections.abc import Mapping
+
+
+class LeadRecord(Mapping):
+    """Fixed-field lead with dict-style access (lead['name'], lead.get(...))
+
+    FIELDS lists (name, type) in export order. Records are read like the
+    dicts they replace, so reports, sinks and the lead store accept either;
+    to_dict() gives a plain dict at JSON/pandas boundaries. A category can
+    be tagged in place with tag() instead of copying the lead.
+    """
+
+    __slots__ = ('lead_category',)
+    FIELDS = ()
+    _NAMES = frozenset()
+
+    def __init__(self, **fields):
+        for name, _ in self.FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        self.lead_category = fields.pop('lead_category', None)
+        if fields:
+            raise TypeError(f"{type(self).__name__} has no fields {', '.join(fields)}")
+
+    @classmethod
+    def from_dict(cls, data, **overrides):
+        """Record from a mapping, ignoring unknown keys and coercing mistyped values"""
+        record = cls.__new__(cls)
+        for name, field_type in cls.FIELDS:
+            value = overrides[name] if name in overrides else data.get(name)
+            if value is not None and field_type is not None and not isinstance(value, field_type):
+                if field_type is list and isinstance(value, (str, Mapping)):
+                    value = [value]  # One item, not its characters or keys
+                else:
+                    try:
+                        value = field_type(value)
+                    except (TypeError, ValueError):
+                        pass
+            setattr(record, name, value)
+        record.lead_category = overrides.get('lead_category', data.get('lead_category'))
+        return record
+
+    def tag(self, category):
+        """Set lead_category in place (returns the record)"""
+        self.lead_category = category
+        return self
+
+    def to_dict(self):
+        """Plain dict in FIELDS order (nested records are left as records)"""
+        data = {name: getattr(self, name) for name, _ in self.FIELDS}
+        if self.lead_category is not None:
+            data['lead_category'] = self.lead_category
+        return data
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._NAMES = frozenset(name for name, _ in cls.FIELDS)
+
+    def __getitem__(self, key):
+        if key in self._NAMES:
+            return getattr(self, key)
+        if key == 'lead_category' and self.lead_category is not None:
+            return self.lead_category
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key != 'lead_category' and key not in self._NAMES:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        if key == 'lead_category':
+            return self.lead_category is not None
+        return key in self._NAMES
+
+    def __iter__(self):
+        for name, _ in self.FIELDS:
+            yield name
+        if self.lead_category is not None:
+            yield 'lead_category'
+
+    def __len__(self):
+        return len(self.FIELDS) + (self.lead_category is not None)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        for name, _ in self.FIELDS:
+            setattr(self, name, state.get(name))
+        self.lead_category = state.get('lead_category')
+
+
+def _slots(fields):
+    return tuple(name for name, _ in fields)
+
+
+class HeirContact(LeadRecord):
+    """One potential heir found for a property owner"""
+
+    FIELDS = (('name', str), ('phone', str), ('relationship', str), ('confidence', None))
+    __slots__ = _slots(FIELDS)
+
+
+class InvestorLead(LeadRecord):
+    """Real estate investor found on LinkedIn"""
+
+    FIELDS = (
+        ('name', str), ('title', str), ('location', str), ('profile_url', str),
+        ('search_term', str), ('target_city', str), ('quality_score', int),
+        ('scraped_at', str), ('lead_type', str)
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class ObituaryRecord(LeadRecord):
+    """Obituary mined from a search result card"""
+
+    FIELDS = (
+        ('deceased_name', str), ('age', str), ('death_date', str), ('city', str),
+        ('address_hints', str), ('property_potential_score', int), ('source', str),
+        ('scraped_at', str)
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class PropertyLead(LeadRecord):
+    """Inheritance property enriched with obituary details and heir contacts"""
+
+    FIELDS = (
+        ('owner_name', str), ('address', str), ('city', str), ('estimated_value', int),
+        ('property_type', str), ('status', str), ('urgency_score', int), ('lead_quality', str),
+        ('found_at', str), ('deceased_age', str), ('death_date', str), ('obituary_source', str),
+        ('property_potential_score', int), ('heir_contacts', list), ('lead_type', str)
+    )
+    __slots__ = _slots(FIELDS)
+
+
+def as_dict(lead):
+    """Plain dict for a record or dict lead"""
+    return lead.to_dict() if isinstance(lead, LeadRecord) else lead
+
+
+def json_default(value):
+    """json.dumps default= hook: records become dicts, anything else a string"""
+    if isinstance(value, LeadRecord):
+        return value.to_dict()
+    return str(value)
+
+
+def tag_category(leads, category):
+    """Tag every lead with lead_category in place (records or dicts), yielding them"""
+    for lead in leads:
+        if isinstance(lead, LeadRecord):
+            lead.lead_category = category
+        else:
+            lead['lead_category'] = category
+        yield lead
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Lead Store
+Persistent SQLite storage for investor and inheritance property leads
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import uuid
+
+from config.settings import LeadFlowConfig
+from src.storage.lead_records import json_default
+
+# Column order matches the historical CSV exports
+INVESTOR_FIELDS = [
+    'name', 'title', 'location', 'profile_url', 'search_term',
+    'target_city', 'quality_score', 'lead_type', 'scraped_at'
+]
+PROPERTY_FIELDS = [
+    'owner_name', 'address', 'city', 'estimated_value', 'property_type',
+    'status', 'urgency_score', 'lead_quality', 'deceased_age',
+    'death_date', 'property_potential_score', 'heir_contacts', 'found_at'
+]
+PROPERTY_EXTRA_FIELDS = ['obituary_source', 'lead_type']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS investors (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    name TEXT,
+    title TEXT,
+    location TEXT,
+    profile_url TEXT,
+    search_term TEXT,
+    target_city TEXT COLLATE NOCASE,
+    quality_score INTEGER,
+    lead_type TEXT,
+    scraped_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_investors_city ON investors (target_city);
+CREATE INDEX IF NOT EXISTS idx_investors_score ON investors (quality_score);
+CREATE INDEX IF NOT EXISTS idx_investors_profile_url ON investors (profile_url);
+CREATE INDEX IF NOT EXISTS idx_investors_scraped_at ON investors (scraped_at);
+CREATE INDEX IF NOT EXISTS idx_investors_run ON investors (run_id);
+
+CREATE TABLE IF NOT EXISTS properties (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    owner_name TEXT,
+    address TEXT,
+    city TEXT COLLATE NOCASE,
+    estimated_value INTEGER,
+    property_type TEXT,
+    status TEXT,
+    urgency_score INTEGER,
+    lead_quality TEXT,
+    deceased_age TEXT,
+    death_date TEXT,
+    property_potential_score INTEGER,
+    heir_contacts TEXT,
+    found_at TEXT,
+    obituary_source TEXT,
+    lead_type TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_properties_city ON properties (city);
+CREATE INDEX IF NOT EXISTS idx_properties_score ON properties (property_potential_score);
+CREATE INDEX IF NOT EXISTS idx_properties_found_at ON properties (found_at);
+CREATE INDEX IF NOT EXISTS idx_properties_run ON properties (run_id);
+"""
+
+# Per-table query metadata: (city column, score column, timestamp column, fields)
+TABLES = {
+    'investors': ('target_city', 'quality_score', 'scraped_at', INVESTOR_FIELDS),
+    'properties': ('city', 'property_potential_score', 'found_at', PROPERTY_FIELDS + PROPERTY_EXTRA_FIELDS)
+}
+
+
+def new_run_id():
+    """Identifier grouping the leads written by one hunt"""
+    return uuid.uuid4().hex
+
+
+def format_heir_contacts(contacts):
+    """Flatten heir contacts into the 'Name (phone); ...' CSV form"""
+    if isinstance(contacts, list):
+        return '; '.join([c if isinstance(c, str) else f"{c['name']} ({c['phone']})" for c in contacts])
+    return contacts or ''
+
+
+class LeadStore:
+    """Indexed SQLite lead store (WAL mode, batched inserts)"""
+
+    def __init__(self, path=None):
+        self.path = path or LeadFlowConfig.LEAD_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the database connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # ------------------------------------------------------------------ writes
+
+    def add_investors(self, investors, run_id=None):
+        """Insert investor leads in one batch, returning the run id"""
+        run_id = run_id or new_run_id()
+        rows = [
+            [run_id] + [investor.get(field) for field in INVESTOR_FIELDS]
+            for investor in investors
+        ]
+        self._insert_many('investors', ['run_id'] + INVESTOR_FIELDS, rows)
+        return run_id
+
+    def add_properties(self, properties, run_id=None):
+        """Insert inheritance property leads in one batch, returning the run id"""
+        run_id = run_id or new_run_id()
+        fields = PROPERTY_FIELDS + PROPERTY_EXTRA_FIELDS
+        rows = []
+        for prop in properties:
+            row = [run_id]
+            for field in fields:
+                value = prop.get(field)
+                if field == 'heir_contacts' and isinstance(value, list):
+                    value = json.dumps(value, default=json_default)
+                row.append(value)
+            rows.append(row)
+        self._insert_many('properties', ['run_id'] + fields, rows)
+        return run_id
+
+    def _insert_many(self, table, columns, rows):
+        """Batched executemany insert inside a single transaction"""
+        if not rows:
+            return
+        placeholders = ', '.join('?' * len(columns))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+            )
+
+    # ----------------------------------------------------------------- queries
+
+    def _where(self, table, city=None, min_score=None, since=None, run_id=None):
+        """Build the WHERE clause for the indexed query filters"""
+        city_col, score_col, time_col, _ = TABLES[table]
+        clauses, params = [], []
+        if city:
+            clauses.append(f"{city_col} = ?")
+            params.append(city)
+        if min_score is not None:
+            clauses.append(f"{score_col} >= ?")
+            params.append(min_score)
+        if since:
+            clauses.append(f"{time_col} >= ?")
+            params.append(since)
+        if run_id:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, params
+
+    def iter_leads(self, table, city=None, min_score=None, since=None, run_id=None,
+                   limit=None, order_by_score=False):
+        """Stream matching leads as dicts without loading the whole table"""
+        _, score_col, _, fields = TABLES[table]
+        where, params = self._where(table, city, min_score, since, run_id)
+        order = f" ORDER BY {score_col} DESC, id" if order_by_score else " ORDER BY id"
+        sql = f"SELECT {', '.join(fields)} FROM {table}{where}{order}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for row in self.conn.execute(sql, params):
+            lead = dict(row)
+            if table == 'properties' and lead.get('heir_contacts'):
+                try:
+                    lead['heir_contacts'] = json.loads(lead['heir_contacts'])
+                except ValueError:
+                    pass
+            yield lead
+
+    def find_investors(self, city=None, min_score=None, since=None, run_id=None, limit=None):
+        """Investor leads for a city / score / date filter, best first"""
+        return list(self.iter_leads('investors', city, min_score, since, run_id, limit, order_by_score=True))
+
+    def find_properties(self, city=None, min_score=None, since=None, run_id=None, limit=None):
+        """Property leads for a city / score / date filter, best first"""
+        return list(self.iter_leads('properties', city, min_score, since, run_id, limit, order_by_score=True))
+
+    def count(self, table, city=None, min_score=None, since=None, run_id=None):
+        """Number of leads matching the filters"""
+        where, params = self._where(table, city, min_score, since, run_id)
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table}{where}", params).fetchone()[0]
+
+    def counts_by_city(self, table):
+        """Lead counts per city, largest first"""
+        city_col = TABLES[table][0]
+        rows = self.conn.execute(
+            f"SELECT {city_col} AS city, COUNT(*) AS leads FROM {table} "
+            f"GROUP BY {city_col} COLLATE NOCASE ORDER BY leads DESC"
+        )
+        return [(row['city'], row['leads']) for row in rows]
+
+    # ------------------------------------------------------------------ export
+
+    def export_csv(self, table, filepath, **filters):
+        """Write matching leads to CSV in the historical column layout"""
+        fieldnames = INVESTOR_FIELDS if table == 'investors' else PROPERTY_FIELDS
+        written = 0
+        with open(filepath, 'w', newline='', encoding=LeadFlowConfig.CSV_ENCODING) as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            for lead in self.iter_leads(table, **filters):
+                if table == 'properties':
+                    lead['heir_contacts'] = format_heir_contacts(lead.get('heir_contacts'))
+                writer.writerow(lead)
+                written += 1
+        return written
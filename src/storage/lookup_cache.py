@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Lookup Cache
+Size-bounded LRU with per-entry TTL for record lookups, optionally persisted
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+
+from config.settings import LeadFlowConfig
+from src.extraction.text_normalize import normalize_text
+
+
+def lookup_key(name, city):
+    """Normalized cache key for a (name, city) lookup"""
+    return f"{normalize_text(name)}|{normalize_text(city)}"
+
+
+class LookupCache:
+    """LRU cache of lookup results keyed on normalized (name, city)
+
+    Entries older than `ttl` seconds are treated as misses. With `path` set,
+    live entries are loaded on open and written back (atomically) on close,
+    so results carry over between runs.
+    """
+
+    def __init__(self, name, max_entries=None, ttl=None, path=None):
+        self.name = name
+        self.max_entries = max_entries or LeadFlowConfig.LOOKUP_CACHE_SIZE
+        self.ttl = LeadFlowConfig.LOOKUP_CACHE_TTL if ttl is None else ttl
+        self.path = path
+        self.entries = OrderedDict()  # key -> (stored_at, value), oldest first
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evicted': 0}
+        self._dirty = False
+        if path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, stored_at, value in stored.get('entries', [])[-self.max_entries:]:
+            if now - stored_at < self.ttl:
+                self.entries[key] = (stored_at, value)
+
+    def get(self, name, city):
+        """Cached value for (name, city), or None on a miss"""
+        key = lookup_key(name, city)
+        entry = self.entries.get(key)
+        if entry is not None and time.time() - entry[0] >= self.ttl:
+            del self.entries[key]
+            self.stats['expired'] += 1
+            self._dirty = True
+            entry = None
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry[1]
+
+    def put(self, name, city, value):
+        """Store a lookup result, evicting the least recently used entries"""
+        key = lookup_key(name, city)
+        self.entries[key] = (time.time(), value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats['evicted'] += 1
+        self._dirty = True
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self):
+        """Atomically write live entries to `path` (no-op without one)"""
+        if not self.path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'cache': self.name,
+                'entries': [[key, stored_at, value] for key, (stored_at, value) in self.entries.items()]
+            }, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def close(self):
+        self.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def summary(self):
+        """One-line description of this run's cache activity"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        rate = 100 * self.stats['hits'] / lookups if lookups else 0
+        return (f"🗃️  {self.name} cache: {self.stats['hits']} hits, {self.stats['misses']} misses "
+                f"({rate:.0f}% hit rate, {self.stats['expired']} expired, {self.stats['evicted']} evicted)")
+
+
+def open_lookup_cache(name):
+    """LookupCache for `name` per config, persisted under LOOKUP_CACHE_DIR if enabled"""
+    path = None
+    if LeadFlowConfig.LOOKUP_CACHE_PERSIST:
+        path = os.path.join(LeadFlowConfig.LOOKUP_CACHE_DIR, f"{name}.json")
+    return LookupCache(name, path=path)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Normalized Property Export
+Properties and heir contacts as separate tables linked by property id
+"""
+
+import csv
+import json
+import os
+import time
+
+from config.settings import LeadFlowConfig
+from src.storage.lead_records import as_dict
+from src.storage.lead_store import PROPERTY_EXTRA_FIELDS, PROPERTY_FIELDS
+
+NORMALIZED_PROPERTY_FIELDS = (
+    ['property_id'] + [field for field in PROPERTY_FIELDS if field != 'heir_contacts'] +
+    PROPERTY_EXTRA_FIELDS + ['heir_contact_count']
+)
+CONTACT_FIELDS = ['property_id', 'contact_index', 'name', 'phone', 'relationship', 'confidence']
+
+
+def _parse_flat_contacts(text):
+    """Contacts from the 'Name (phone); Name (phone)' form of the flat CSV exports"""
+    contacts = []
+    for part in text.split(';'):
+        name, separator, phone = part.strip().partition(' (')
+        if separator and phone.endswith(')'):
+            contacts.append({'name': name, 'phone': phone[:-1]})
+    return contacts
+
+
+def heir_contacts_of(lead):
+    """Heir contacts of a property lead as a list, whatever form they are stored in
+
+    Accepts a list (live records), a JSON string (store rows that failed to
+    decode) or the flattened 'Name (phone); ...' CSV form, also as the one
+    item of a list.
+    """
+    contacts = lead.get('heir_contacts')
+    if not contacts:
+        return []
+    if isinstance(contacts, (list, tuple)):
+        if not any(isinstance(contact, str) for contact in contacts):
+            return contacts
+        parsed = []
+        for contact in contacts:
+            parsed.extend(_parse_flat_contacts(contact) if isinstance(contact, str) else [contact])
+        return parsed
+    if isinstance(contacts, str):
+        try:
+            decoded = json.loads(contacts)
+            if isinstance(decoded, list):
+                return decoded
+        except ValueError:
+            pass
+        return _parse_flat_contacts(contacts)
+    return []
+
+
+class NormalizedExporter:
+    """Streams property leads into properties.csv, contacts.csv and contacts.jsonl
+
+    Each property gets a sequential property_id that its contact rows refer
+    to. Leads are read, never modified, so the in-memory records keep their
+    contact lists.
+    """
+
+    def __init__(self, directory, prefix='leadflow'):
+        os.makedirs(directory, exist_ok=True)
+        self.paths = {
+            'properties': os.path.join(directory, f"{prefix}_properties.csv"),
+            'contacts': os.path.join(directory, f"{prefix}_contacts.csv"),
+            'contacts_jsonl': os.path.join(directory, f"{prefix}_contacts.jsonl")
+        }
+        encoding = LeadFlowConfig.CSV_ENCODING
+        self._files = [
+            open(self.paths['properties'], 'w', newline='', encoding=encoding),
+            open(self.paths['contacts'], 'w', newline='', encoding=encoding),
+            open(self.paths['contacts_jsonl'], 'w', encoding=encoding)
+        ]
+        self._properties = csv.DictWriter(self._files[0], fieldnames=NORMALIZED_PROPERTY_FIELDS,
+                                          extrasaction='ignore')
+        self._contacts = csv.writer(self._files[1])
+        self._jsonl = self._files[2]
+        self._properties.writeheader()
+        self._contacts.writerow(CONTACT_FIELDS)
+        self.property_count = 0
+        self.contact_count = 0
+
+    def write(self, lead):
+        """Append one property lead and its heir contacts"""
+        self.property_count += 1
+        property_id = self.property_count
+        contacts = heir_contacts_of(lead)
+
+        row = {field: lead.get(field) for field in NORMALIZED_PROPERTY_FIELDS[1:-1]}
+        row['property_id'] = property_id
+        row['heir_contact_count'] = len(contacts)
+        self._properties.writerow(row)
+
+        for index, contact in enumerate(contacts, 1):
+            contact = as_dict(contact)
+            values = [property_id, index] + [contact.get(field) for field in CONTACT_FIELDS[2:]]
+            self._contacts.writerow(values)
+            self._jsonl.write(json.dumps(dict(zip(CONTACT_FIELDS, values))) + '\n')
+        self.contact_count += len(contacts)
+
+    def write_many(self, leads):
+        for lead in leads:
+            self.write(lead)
+        return self
+
+    def close(self):
+        for f in self._files:
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def export_normalized(properties, directory=None, prefix=None):
+    """Write a normalized export of `properties` (list or stream) in one pass
+
+    Returns the exporter (its .paths and counts describe what was written).
+    """
+    directory = directory or os.path.join(os.getcwd(), 'data')
+    prefix = prefix or f"leadflow_inheritance_{int(time.time())}"
+    with NormalizedExporter(directory, prefix) as exporter:
+        exporter.write_many(properties)
+    return exporter
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Streaming Lead Sinks
+Crash-safe, buffered lead writers for CSV, JSONL and the SQLite lead store
+"""
+
+import csv
+import json
+import os
+import time
+
+from config.settings import LeadFlowConfig
+from src.instrumentation.profiler import profiled
+from src.storage.lead_records import json_default
+from src.storage.lead_store import (
+    INVESTOR_FIELDS, PROPERTY_FIELDS, LeadStore, format_heir_contacts, new_run_id
+)
+from src.storage.xlsx_export import export_xlsx
+
+SINK_FORMATS = ['sqlite', 'csv', 'jsonl']
+
+# File name prefixes per lead table (matches the historical CSV names)
+FILE_PREFIXES = {
+    'investors': 'leadflow_investors',
+    'properties': 'leadflow_inheritance'
+}
+
+# Integer columns per lead table, restored when a CSV sink is read back
+CSV_INT_FIELDS = {
+    'investors': ('quality_score',),
+    'properties': ('estimated_value', 'urgency_score', 'property_potential_score')
+}
+
+
+def export_path(table, extension):
+    """Timestamped output file for a lead table under data/"""
+    output_dir = os.path.join(os.getcwd(), 'data')
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{FILE_PREFIXES[table]}_{int(time.time())}.{extension}")
+
+
+class LeadSink:
+    """Buffered lead writer that flushes in batches and fsyncs periodically
+
+    Leads are written as they are produced, so an exception or Ctrl-C in the
+    middle of a long hunt only loses the unflushed tail of the buffer.
+    """
+
+    def __init__(self, table, batch_size=None, fsync_interval=None):
+        if table not in FILE_PREFIXES:
+            raise ValueError(f"Unknown lead table: {table}")
+        self.table = table
+        self.batch_size = batch_size or LeadFlowConfig.SINK_BATCH_SIZE
+        self.fsync_interval = LeadFlowConfig.SINK_FSYNC_INTERVAL if fsync_interval is None else fsync_interval
+        self.written = 0
+        self.location = None
+        self._buffer = []
+        self._last_sync = time.monotonic()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, lead):
+        """Queue one lead, flushing when the batch is full"""
+        self._buffer.append(lead)
+        self.written += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, leads):
+        """Queue several leads"""
+        for lead in leads:
+            self.write(lead)
+
+    @profiled('sink.flush')
+    def flush(self):
+        """Write buffered leads, syncing to disk once the interval has passed"""
+        if self._closed:
+            return
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+        if time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """Force written leads to stable storage"""
+        self._sync()
+        self._last_sync = time.monotonic()
+
+    @profiled('sink.close')
+    def close(self):
+        """Flush, sync and release the underlying file or connection"""
+        if self._closed:
+            return
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+        self.sync()
+        self._close()
+        self._closed = True
+
+    def iter_leads(self):
+        """Read back the leads written by this sink, when supported"""
+        return None
+
+    def checkpoint_state(self):
+        """Flush and describe the sink position so a resumed run can reopen it"""
+        self.flush()
+        return {
+            'format': self.format,
+            'location': self.location,
+            'written': self.written,
+            'offset': self._offset()
+        }
+
+    def _write_batch(self, leads):
+        raise NotImplementedError
+
+    def _offset(self):
+        raise NotImplementedError
+
+    def _sync(self):
+        pass
+
+    def _close(self):
+        pass
+
+
+class _FileSink(LeadSink):
+    """Shared file handling for the text sinks"""
+
+    extension = None
+
+    def __init__(self, table, path=None, resume_offset=None, **kwargs):
+        super().__init__(table, **kwargs)
+        if not path:
+            path = export_path(table, self.extension)
+        self.location = path
+        self.resumed = resume_offset is not None
+        if self.resumed:
+            # Drop anything written after the last checkpoint, then append
+            self._file = open(path, 'r+', newline='', encoding=LeadFlowConfig.CSV_ENCODING)
+            self._file.seek(resume_offset)
+            self._file.truncate()
+        else:
+            self._file = open(path, 'w', newline='', encoding=LeadFlowConfig.CSV_ENCODING)
+
+    def _offset(self):
+        return self._file.tell()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close(self):
+        self._file.close()
+
+
+class CsvSink(_FileSink):
+    """Stream leads into a CSV file with the historical column layout"""
+
+    format = 'csv'
+    extension = 'csv'
+
+    def __init__(self, table, path=None, **kwargs):
+        super().__init__(table, path, **kwargs)
+        fieldnames = INVESTOR_FIELDS if table == 'investors' else PROPERTY_FIELDS
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        if not self.resumed:
+            self._writer.writeheader()
+
+    def _write_batch(self, leads):
+        for lead in leads:
+            if self.table == 'properties' and isinstance(lead.get('heir_contacts'), list):
+                # Flatten a copy so the caller's record is never mutated
+                lead = {**lead, 'heir_contacts': format_heir_contacts(lead['heir_contacts'])}
+            self._writer.writerow(lead)
+        self._file.flush()
+
+    def iter_leads(self):
+        """Read the CSV back as dicts (heir contacts stay in their flattened form)"""
+        self.flush()
+        int_fields = CSV_INT_FIELDS[self.table]
+        with open(self.location, newline='', encoding=LeadFlowConfig.CSV_ENCODING) as f:
+            for lead in csv.DictReader(f):
+                for field in int_fields:
+                    try:
+                        lead[field] = int(lead[field])
+                    except (TypeError, ValueError):
+                        lead[field] = lead[field] or None
+                yield lead
+
+
+class JsonlSink(_FileSink):
+    """Stream leads into a JSON Lines file, one lead per line"""
+
+    format = 'jsonl'
+    extension = 'jsonl'
+
+    def _write_batch(self, leads):
+        self._file.write(''.join(json.dumps(lead, default=json_default) + '\n' for lead in leads))
+        self._file.flush()
+
+    def iter_leads(self):
+        self.flush()
+        with open(self.location, encoding=LeadFlowConfig.CSV_ENCODING) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class SqliteSink(LeadSink):
+    """Stream leads into the lead store under one run id"""
+
+    format = 'sqlite'
+
+    def __init__(self, table, store=None, run_id=None, path=None, resume_offset=None, **kwargs):
+        super().__init__(table, **kwargs)
+        self._owns_store = store is None
+        self.store = store or LeadStore(path)
+        self.run_id = run_id or new_run_id()
+        self.location = self.store.path
+        if resume_offset is not None:
+            # Drop rows this run wrote after its last checkpoint
+            with self.store.conn:
+                self.store.conn.execute(
+                    f"DELETE FROM {table} WHERE run_id = ? AND id > ?", (self.run_id, resume_offset)
+                )
+
+    def _offset(self):
+        row = self.store.conn.execute(
+            f"SELECT COALESCE(MAX(id), 0) FROM {self.table} WHERE run_id = ?", (self.run_id,)
+        ).fetchone()
+        return row[0]
+
+    def checkpoint_state(self):
+        state = super().checkpoint_state()
+        state['run_id'] = self.run_id
+        return state
+
+    def _write_batch(self, leads):
+        if self.table == 'investors':
+            self.store.add_investors(leads, run_id=self.run_id)
+        else:
+            self.store.add_properties(leads, run_id=self.run_id)
+
+    def _sync(self):
+        # Each batch is committed; a passive checkpoint moves it into the main file
+        self.store.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def _close(self):
+        if self._owns_store:
+            self.store.close()
+
+    def iter_leads(self):
+        self.flush()
+        return self.store.iter_leads(self.table, run_id=self.run_id)
+
+    def export_csv(self, filepath):
+        """Write this run's leads as a CSV view over the store"""
+        self.flush()
+        return self.store.export_csv(self.table, filepath, run_id=self.run_id)
+
+
+def open_sink(table, sink_format=None, path=None, **kwargs):
+    """Create a sink by format name ('sqlite', 'csv' or 'jsonl')"""
+    sink_format = sink_format or LeadFlowConfig.RESULT_SINK
+    if sink_format == 'sqlite':
+        return SqliteSink(table, path=path, **kwargs)
+    if sink_format == 'csv':
+        return CsvSink(table, path, **kwargs)
+    if sink_format == 'jsonl':
+        return JsonlSink(table, path, **kwargs)
+    raise ValueError(f"Unknown sink format: {sink_format} (choose from {', '.join(SINK_FORMATS)})")
+
+
+def finish_sink(lead_sink, label=None, close=True, export_format='csv', on_export=None):
+    """Flush a run's sink and export a CSV or Excel view of the run's leads
+    
+    Store-backed runs export to data/ (export_format None skips the export);
+    file sinks are already the CSV/JSONL view, but can add an Excel copy.
+    on_export(filepath) runs after an export, while the sink is still open;
+    for a file sink the file itself is the export.
+    """
+    label = label or lead_sink.table
+    try:
+        if not lead_sink.written:
+            print(f"❌ No {lead_sink.table} found to save")
+        elif export_format == 'xlsx' and lead_sink.iter_leads() is not None:
+            filepath = export_path(lead_sink.table, 'xlsx')
+            export_xlsx(filepath, {lead_sink.table: lead_sink.iter_leads()})
+            print(f"💾 Saved {lead_sink.written} {label} to {filepath}")
+            if on_export:
+                on_export(filepath)
+        elif isinstance(lead_sink, SqliteSink) and export_format:
+            filepath = export_path(lead_sink.table, 'csv')
+            lead_sink.export_csv(filepath)
+            print(f"💾 Saved {lead_sink.written} {label} to {filepath}")
+            if on_export:
+                on_export(filepath)
+        else:
+            print(f"💾 Saved {lead_sink.written} {label} to {lead_sink.location}")
+            if on_export and export_format:
+                on_export(lead_sink.location)
+    finally:
+        if close:
+            lead_sink.close()
+        else:
+            lead_sink.flush()
+
+
+def reopen_sink(table, state, **kwargs):
+    """Reopen a sink from checkpoint_state(), discarding writes made after it"""
+    sink_format = state['format']
+    if sink_format == 'sqlite':
+        sink = SqliteSink(table, run_id=state['run_id'], path=state['location'],
+                          resume_offset=state['offset'], **kwargs)
+    elif sink_format == 'csv':
+        sink = CsvSink(table, state['location'], resume_offset=state['offset'], **kwargs)
+    elif sink_format == 'jsonl':
+        sink = JsonlSink(table, state['location'], resume_offset=state['offset'], **kwargs)
+    else:
+        raise ValueError(f"Unknown sink format: {sink_format} (choose from {', '.join(SINK_FORMATS)})")
+    sink.written = state['written']
+    return sink
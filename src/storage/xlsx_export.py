@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🤖 LeadFlow AI - Excel Export
+Streams leads into .xlsx workbooks with openpyxl's write-only mode
+"""
+
+import itertools
+import re
+
+from src.storage.lead_store import (
+    INVESTOR_FIELDS, PROPERTY_EXTRA_FIELDS, PROPERTY_FIELDS, format_heir_contacts
+)
+
+EXPORT_FORMATS = ['csv', 'xlsx']
+
+SHEET_TITLES = {'investors': 'Investors', 'properties': 'Properties'}
+SHEET_FIELDS = {
+    'investors': INVESTOR_FIELDS,
+    'properties': PROPERTY_FIELDS + PROPERTY_EXTRA_FIELDS
+}
+
+# Column widths are sized from the first rows of each sheet (write-only
+# sheets must have their widths set before any row is written)
+WIDTH_SAMPLE_ROWS = 500
+MIN_COLUMN_WIDTH = 8
+MAX_COLUMN_WIDTH = 60
+
+_ILLEGAL_CHARACTERS = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+
+
+def _cell_value(field, value):
+    if field == 'heir_contacts':
+        value = format_heir_contacts(value)
+    if value is None or isinstance(value, (int, float)):
+        return value
+    # Scraped text can carry control characters that Excel rejects
+    return _ILLEGAL_CHARACTERS.sub('', str(value))
+
+
+def _column_widths(fields, rows):
+    widths = [len(field) for field in fields]
+    for row in rows:
+        for i, value in enumerate(row):
+            if value is not None:
+                widths[i] = max(widths[i], len(str(value)))
+    return [min(max(width + 2, MIN_COLUMN_WIDTH), MAX_COLUMN_WIDTH) for width in widths]
+
+
+class XlsxExporter:
+    """Write-only workbook with one streamed sheet per lead category
+
+    Memory stays bounded by WIDTH_SAMPLE_ROWS however many leads a sheet
+    holds; rows go straight to openpyxl's temporary sheet files.
+    """
+
+    def __init__(self, path):
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self._column_letter = get_column_letter
+        self.row_counts = {}
+
+    def add_sheet(self, title, fields, leads):
+        """Stream `leads` (dicts or records) into a new sheet, returning the row count"""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        rows = ([_cell_value(field, lead.get(field)) for field in fields] for lead in leads)
+        sample = list(itertools.islice(rows, WIDTH_SAMPLE_ROWS))
+
+        sheet = self.workbook.create_sheet(title=title)
+        for i, width in enumerate(_column_widths(fields, sample), 1):
+            sheet.column_dimensions[self._column_letter(i)].width = width
+        sheet.freeze_panes = 'A2'
+
+        header = []
+        for field in fields:
+            cell = WriteOnlyCell(sheet, value=field)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+
+        count = 0
+        for row in itertools.chain(sample, rows):
+            sheet.append(row)
+            count += 1
+        self.row_counts[title] = count
+        return count
+
+    def add_table(self, table, leads, title=None):
+        """Sheet for a lead table ('investors' or 'properties') in its export column order"""
+        return self.add_sheet(title or SHEET_TITLES[table], SHEET_FIELDS[table], leads)
+
+    def save(self):
+        self.workbook.save(self.path)
+        return self.path
+
+
+def export_xlsx(path, tables):
+    """Write {table: leads} (lists or streams) as one sheet per table; returns row counts"""
+    exporter = XlsxExporter(path)
+    for table, leads in tables.items():
+        exporter.add_table(table, leads)
+    exporter.save()
+    return exporter.row_counts